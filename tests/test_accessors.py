@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge accessor engine
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+import struct
+
+import numpy as np
+
+# Import the accessors module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.accessors import accessor_array, accessor_layout, repair_accessors, sparse_accessor_array
+from voxbridge.converter import VoxBridgeConverter
+
+
+def interleaved_document():
+    """Two triangles sharing one interleaved POSITION/NORMAL view plus an index view"""
+    vertices = np.zeros((6, 6), dtype='<f4')
+    vertices[:, :3] = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [2, 2, 2], [3, 2, 2], [2, 3, 5]]
+    vertices[:, 3:] = [0, 0, 1]
+    indices = np.array([0, 1, 2, 0, 2, 1], dtype='<u2').tobytes()
+    data = vertices.tobytes() + indices
+    gltf_data = {
+        "asset": {"version": "2.0"},
+        "meshes": [{"primitives": [
+            {"attributes": {"POSITION": 0, "NORMAL": 1}, "indices": 2},
+            {"attributes": {"POSITION": 3}, "indices": 4},
+        ]}],
+        "accessors": [
+            {"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"},
+            {"bufferView": 0, "byteOffset": 12, "componentType": 5126, "count": 3, "type": "VEC3"},
+            {"bufferView": 1, "componentType": 5123, "count": 3, "type": "SCALAR"},
+            {"bufferView": 0, "byteOffset": 72, "componentType": 5126, "count": 3, "type": "VEC3",
+             "min": [0, 0, 0], "max": [1, 1, 1]},
+            {"bufferView": 1, "byteOffset": 6, "componentType": 5123, "count": 3, "type": "SCALAR"},
+        ],
+        "bufferViews": [
+            {"buffer": 0, "byteLength": 144, "byteStride": 24},
+            {"buffer": 0, "byteOffset": 144, "byteLength": 12},
+        ],
+        "buffers": [{"byteLength": len(data)}],
+    }
+    return gltf_data, data
+
+
+class TestAccessorEngine(unittest.TestCase):
+    """Test cases for layout checks, zero-copy decoding and repair"""
+
+    def test_strided_zero_copy_view(self):
+        """Interleaved accessors decode through byteOffset and byteStride without copying"""
+        gltf_data, data = interleaved_document()
+        normals = accessor_array(gltf_data, 1, [data])
+        positions = accessor_array(gltf_data, 3, [data])
+
+        self.assertEqual(normals.tolist(), [[0, 0, 1]] * 3)
+        self.assertEqual(positions.tolist(), [[2, 2, 2], [3, 2, 2], [2, 3, 5]])
+        self.assertFalse(positions.flags.owndata)
+        self.assertEqual(positions.strides, (24, 4))
+
+    def test_layout_capacity(self):
+        """Capacity honours the accessor byteOffset and the view stride"""
+        gltf_data, _ = interleaved_document()
+        layout = accessor_layout(gltf_data)
+        self.assertEqual(layout.indices, [0, 1, 2, 3, 4])
+        self.assertEqual(layout.capacity.tolist(), [6, 6, 6, 3, 3])
+        self.assertFalse(layout.too_long.any())
+
+    def test_repair(self):
+        """Counts are clamped, POSITION bounds recomputed and bad indices flagged"""
+        gltf_data, data = interleaved_document()
+        gltf_data['accessors'][3]['count'] = 5
+        data = bytearray(data)
+        data[150:152] = (9).to_bytes(2, 'little')
+
+        changes = repair_accessors(gltf_data, [data])
+
+        accessors = gltf_data['accessors']
+        self.assertEqual(accessors[3]['count'], 3)
+        self.assertEqual((accessors[3]['min'], accessors[3]['max']), ([2, 2, 2], [3, 3, 5]))
+        self.assertEqual((accessors[0]['min'], accessors[0]['max']), ([0, 0, 0], [1, 1, 0]))
+        self.assertNotIn('min', accessors[1])
+        self.assertTrue(any("count 5 -> 3" in change for change in changes))
+        self.assertTrue(any("index 9 in accessor 4" in change for change in changes))
+        self.assertEqual(repair_accessors(gltf_data, [data]), [c for c in changes if c.startswith("Warning")])
+
+    def test_sparse_bounds(self):
+        """Bounds include the sparse substitutions; unreadable sparse data leaves them alone"""
+        gltf_data, data = interleaved_document()
+        sparse = struct.pack('<H', 1) + b'\0\0' + struct.pack('<3f', -4, 0, 9)
+        gltf_data['bufferViews'].append({"buffer": 0, "byteOffset": len(data), "byteLength": len(sparse)})
+        gltf_data['accessors'][3]['sparse'] = {
+            "count": 1,
+            "indices": {"bufferView": 2, "componentType": 5123},
+            "values": {"bufferView": 2, "byteOffset": 4},
+        }
+        data += sparse
+
+        self.assertEqual(sparse_accessor_array(gltf_data, 3, accessor_array(gltf_data, 3, [data]), [data]).tolist(),
+                         [[2, 2, 2], [-4, 0, 9], [2, 3, 5]])
+        repair_accessors(gltf_data, [data])
+        self.assertEqual((gltf_data['accessors'][3]['min'], gltf_data['accessors'][3]['max']), ([-4, 0, 2], [2, 3, 9]))
+
+        gltf_data['accessors'][3]['min'] = [0, 0, 0]
+        changes = repair_accessors(gltf_data, [data[:-4]])
+        self.assertEqual(gltf_data['accessors'][3]['min'], [0, 0, 0])
+        self.assertNotIn("Recomputed min/max of accessor 3", changes)
+
+    def test_repair_without_buffer_data(self):
+        """Layout fixes still apply when the buffer is not loaded"""
+        gltf_data, _ = interleaved_document()
+        gltf_data['accessors'][0]['count'] = 7
+        gltf_data['accessors'][2]['byteOffset'] = 1
+
+        changes = repair_accessors(gltf_data, [None])
+
+        self.assertEqual(gltf_data['accessors'][0]['count'], 6)
+        self.assertNotIn('min', gltf_data['accessors'][0])
+        self.assertIn("Warning: Accessor 2 is not aligned to its component size", changes)
+
+
+class TestConverterAccessors(unittest.TestCase):
+    """Test cases for accessor handling during GLB conversion"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_shared_buffer_view_offsets_preserved(self):
+        """Accessors sharing a bufferView keep their byteOffset, so the output validates"""
+        gltf_data, data = interleaved_document()
+        gltf_data['accessors'][0].update({"min": [0, 0, 0], "max": [1, 1, 0]})
+        gltf_data['accessors'][3].update({"min": [2, 2, 2], "max": [3, 3, 5]})
+        gltf_data.update({"scene": 0, "scenes": [{"nodes": [0]}], "nodes": [{"mesh": 0}]})
+        json_chunk = json.dumps(gltf_data).encode('utf-8')
+        json_chunk += b' ' * (-len(json_chunk) % 4)
+        chunks = (struct.pack('<II', len(json_chunk), 0x4E4F534A) + json_chunk +
+                  struct.pack('<II', len(data), 0x004E4942) + data)
+        input_path = self.test_dir / "shared.glb"
+        input_path.write_bytes(struct.pack('<4sII', b'glTF', 2, 12 + len(chunks)) + chunks)
+
+        converter = VoxBridgeConverter()
+        self.assertTrue(converter.convert_file(input_path, self.test_dir / "out" / "shared.gltf", use_blender=False))
+
+        self.assertEqual(converter.last_validation.messages(), [])
+        self.assertFalse([change for change in converter.last_changes if 'accessor' in change])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge backend registry and racing
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+import subprocess
+import threading
+import time
+
+# Import the backends module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.backends import Backend, BackendCancelled, BackendRegistry, default_backends, race_pair, run_process
+from voxbridge.converter import VoxBridgeConverter
+
+SLEEP = [sys.executable, '-c', 'import time; time.sleep(30)']
+
+
+def subprocess_backend(convert, timeout=30.0, cost=20.0):
+    """An always available out-of-process backend standing in for Blender"""
+    return Backend('blender', 'Blender', convert, lambda converter, input_path, options: True,
+                   cost=cost, timeout=timeout, in_process=False, option='use_blender')
+
+
+def sleeping_convert(converter, input_path, output_path, options, timeout, cancel):
+    run_process(SLEEP, timeout=timeout, cancel=cancel)
+    return True
+
+
+def writing_convert(converter, input_path, output_path, options, timeout, cancel):
+    output_path.write_text(json.dumps({"asset": {"version": "2.0"}}))
+    return True
+
+
+def failing_convert(converter, input_path, output_path, options, timeout, cancel):
+    time.sleep(0.2)
+    return False
+
+
+class TestBackendRegistry(unittest.TestCase):
+    """Test cases for backend order and race selection"""
+
+    def test_order(self):
+        registry = default_backends()
+        self.assertEqual(registry.names(), ['blender', 'assimp', 'trimesh', 'python'])
+        registry.register(Backend('fast', 'Fast', failing_convert, lambda *args: True, cost=0.1), before='assimp')
+        self.assertEqual(registry.names(), ['blender', 'fast', 'assimp', 'trimesh', 'python'])
+        registry.unregister('fast')
+        with self.assertRaises(KeyError):
+            registry.register(Backend('fast', 'Fast', failing_convert, lambda *args: True, cost=0.1), before='nope')
+        self.assertIsNot(default_backends().get('blender'), registry.get('blender'))
+
+    def test_race_pair(self):
+        """The preferred subprocess backend races the cheapest in-process one below it"""
+        backends = list(default_backends())
+        slow, fast = race_pair(backends)
+        self.assertEqual((slow.name, fast.name), ('blender', 'python'))
+        self.assertIsNone(race_pair(backends[1:]))
+        backends[0].cost = 0.1
+        self.assertIsNone(race_pair(backends))
+
+    def test_run_process(self):
+        """Cancelling kills the process promptly; the timeout applies with or without cancellation"""
+        cancel = threading.Event()
+        threading.Timer(0.2, cancel.set).start()
+        started = time.perf_counter()
+        with self.assertRaises(BackendCancelled):
+            run_process(SLEEP, timeout=30, cancel=cancel)
+        self.assertLess(time.perf_counter() - started, 5)
+        with self.assertRaises(subprocess.TimeoutExpired):
+            run_process(SLEEP, timeout=0.2, cancel=threading.Event())
+        self.assertEqual(run_process([sys.executable, '-c', 'print(1)']).stdout.strip(), '1')
+
+
+class TestBackendRace(unittest.TestCase):
+    """Test cases for sequential fallbacks with timeouts and for race mode"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.input_path = self.test_dir / "model.gltf"
+        self.input_path.write_text(json.dumps({
+            "asset": {"version": "2.0"}, "scene": 0, "scenes": [{"nodes": [0]}], "nodes": [{}]}))
+        self.converter = VoxBridgeConverter()
+        self.events = []
+        self.converter.events.add_sink(self.events.append)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def outcomes(self):
+        return {event['backend']: event['outcome'] for event in self.events if event['event'] == 'backend'}
+
+    def test_timeout_falls_back(self):
+        """A backend over its timeout gives way to the next one"""
+        self.converter.backends.register(subprocess_backend(sleeping_convert, timeout=0.3), before='assimp')
+        started = time.perf_counter()
+        self.assertTrue(self.converter.convert_file(self.input_path, self.test_dir / "out" / "model.gltf"))
+        self.assertLess(time.perf_counter() - started, 10)
+        self.assertEqual(self.outcomes()['blender'], 'error')
+        self.assertEqual(self.outcomes()['python'], 'success')
+
+    def test_basic_converter_wins(self):
+        """The basic converter finishes first and the subprocess backend is killed"""
+        self.converter.backends.register(subprocess_backend(sleeping_convert), before='assimp')
+        self.converter.optimization_settings['race_backends'] = True
+        started = time.perf_counter()
+        self.assertTrue(self.converter.convert_file(self.input_path, self.test_dir / "out" / "model.gltf"))
+        self.assertLess(time.perf_counter() - started, 10)
+        self.assertEqual(self.outcomes(), {'blender': 'cancelled', 'python': 'success'})
+        self.assertTrue((self.test_dir / "out" / "model.zip").exists())
+        self.assertEqual([path.name for path in (self.test_dir / "out").iterdir()], ["model.zip"])
+
+    def test_subprocess_backend_wins(self):
+        """When the basic converter fails, the raced backend's valid output is published"""
+        self.converter.backends.register(subprocess_backend(writing_convert), before='assimp')
+        self.converter.backends.register(Backend('python', 'the basic converter', failing_convert,
+                                                 lambda *args: True, cost=0.5))
+        self.converter.optimization_settings['race_backends'] = True
+        output_path = self.test_dir / "out" / "model.gltf"
+        self.assertTrue(self.converter.convert_file(self.input_path, output_path))
+        self.assertEqual(self.outcomes(), {'blender': 'success', 'python': 'failed'})
+        self.assertEqual(json.loads(output_path.read_text())['asset']['version'], '2.0')
+        self.assertEqual(self.converter.last_result.to_dict()['success'], True)
+        job_end = next(event for event in self.events if event['event'] == 'job_end')
+        self.assertEqual(job_end['backend'], 'blender')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge capability probing
+"""
+
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import tempfile
+import shutil
+import os
+
+# Import the capabilities module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge import capabilities
+from voxbridge.capabilities import CapabilityRegistry, _stat_fingerprint
+from voxbridge.converter import VoxBridgeConverter
+
+
+class TestCapabilityRegistry(unittest.TestCase):
+    """Test cases for the in-process and on-disk capability caches"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.cache_path = self.test_dir / "cache" / "capabilities.json"
+        self.tool = self.test_dir / "blender"
+        self.tool.write_text("#!/bin/sh\n")
+        self.probes = 0
+
+        def probe():
+            self.probes += 1
+            return True, str(self.tool), None
+        patcher = patch.dict(capabilities.PROBES, {'blender': (probe, _stat_fingerprint)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_probed_once(self):
+        """One probe per process; later processes read the disk cache"""
+        registry = CapabilityRegistry(self.cache_path)
+        self.assertTrue(registry.available('blender'))
+        self.assertEqual(registry.path('blender'), str(self.tool))
+        self.assertEqual(registry.get('blender')['source'], 'probe')
+        self.assertEqual(self.probes, 1)
+
+        later = CapabilityRegistry(self.cache_path)
+        self.assertEqual(later.get('blender')['source'], 'disk')
+        self.assertEqual(self.probes, 1)
+
+        later.refresh(['blender'])
+        self.assertEqual(self.probes, 2)
+
+        with self.assertRaises(KeyError):
+            registry.get('maya')
+
+    def test_invalidation(self):
+        """A changed tool, an expired entry, a different PATH or a corrupt file force a new probe"""
+        CapabilityRegistry(self.cache_path).get('blender')
+
+        stat = self.tool.stat()
+        os.utime(self.tool, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(CapabilityRegistry(self.cache_path).get('blender')['source'], 'probe')
+
+        self.assertEqual(CapabilityRegistry(self.cache_path, ttl=0).get('blender')['source'], 'probe')
+
+        with patch.dict(os.environ, {'PATH': str(self.test_dir)}):
+            self.assertEqual(CapabilityRegistry(self.cache_path).get('blender')['source'], 'probe')
+
+        self.cache_path.write_text("{truncated")
+        self.assertEqual(CapabilityRegistry(self.cache_path).get('blender')['source'], 'probe')
+        self.assertEqual(CapabilityRegistry(self.cache_path).get('blender')['source'], 'disk')
+        self.assertEqual(self.probes, 5)
+
+    def test_not_found_expires_sooner(self):
+        """A missing tool is probed again after negative_ttl, a found one is trusted for ttl"""
+        CapabilityRegistry(self.cache_path).get('blender')
+        with patch.dict(capabilities.PROBES, {'blender': (lambda: (False, None, None), _stat_fingerprint)}):
+            CapabilityRegistry(self.cache_path).refresh(['blender'])
+            self.assertEqual(CapabilityRegistry(self.cache_path).get('blender')['source'], 'disk')
+            self.assertEqual(CapabilityRegistry(self.cache_path, negative_ttl=0).get('blender')['source'], 'probe')
+
+        CapabilityRegistry(self.cache_path).refresh(['blender'])
+        self.assertEqual(CapabilityRegistry(self.cache_path, negative_ttl=0).get('blender')['source'], 'disk')
+
+    def test_unwritable_cache(self):
+        """Without a usable cache directory results are still cached in memory"""
+        blocker = self.test_dir / "file"
+        blocker.write_text("")
+        registry = CapabilityRegistry(blocker / "capabilities.json")
+        registry.get('blender')
+        registry.get('blender')
+        self.assertEqual(self.probes, 1)
+
+    def test_converter_uses_registry(self):
+        converter = VoxBridgeConverter()
+        converter.capabilities = CapabilityRegistry(self.cache_path)
+        self.assertEqual(converter._can_use_trimesh(), converter.capabilities.available('trimesh'))
+        self.assertTrue(converter._can_use_blender(self.test_dir / "model.gltf"))
+        self.assertEqual(self.probes, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
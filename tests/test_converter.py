@@ -21,6 +21,10 @@ from voxbridge.converter import (
     ConversionError, 
     BlenderNotFoundError
 )
+from voxbridge.capabilities import CapabilityRegistry
+from voxbridge.cli import app
+from voxbridge.synthetic import generate_voxel_glb
+from typer.testing import CliRunner
 
 # Try to import PIL for texture tests
 try:
@@ -281,10 +285,10 @@ class TestVoxBridgeConverter(unittest.TestCase):
         # Note: .bin files are now handled differently in the new ZIP packaging system
         # The test verifies the basic functionality still works
     
-    @patch.object(VoxBridgeConverter, 'find_blender')
-    def test_convert_with_blender_not_found(self, mock_find_blender):
+    @patch.object(CapabilityRegistry, 'path')
+    def test_convert_with_blender_not_found(self, mock_blender_path):
         """Test Blender conversion when Blender is not found"""
-        mock_find_blender.return_value = None
+        mock_blender_path.return_value = None
         
         input_path = self.create_test_glb()
         output_path = self.test_dir / "output.glb"
@@ -294,11 +298,11 @@ class TestVoxBridgeConverter(unittest.TestCase):
         # Should return False when Blender is not found
         self.assertFalse(success)
     
-    @patch.object(VoxBridgeConverter, 'find_blender')
+    @patch.object(CapabilityRegistry, 'path')
     @patch('subprocess.run')
-    def test_convert_with_blender_success(self, mock_run, mock_find_blender):
+    def test_convert_with_blender_success(self, mock_run, mock_blender_path):
         """Test successful Blender conversion"""
-        mock_find_blender.return_value = "/usr/bin/blender"
+        mock_blender_path.return_value = "/usr/bin/blender"
         mock_run.return_value = MagicMock(returncode=0)
         
         input_path = self.create_test_glb()
@@ -314,14 +318,15 @@ class TestVoxBridgeConverter(unittest.TestCase):
         args, kwargs = mock_run.call_args
         cmd = args[0]
         self.assertEqual(cmd[0], "/usr/bin/blender")
+        mock_blender_path.assert_called_with('blender')
         self.assertIn("--background", cmd)
         self.assertIn("--python", cmd)
     
-    @patch.object(VoxBridgeConverter, 'find_blender')
+    @patch.object(CapabilityRegistry, 'path')
     @patch('subprocess.run')
-    def test_convert_with_blender_failure(self, mock_run, mock_find_blender):
+    def test_convert_with_blender_failure(self, mock_run, mock_blender_path):
         """Test Blender conversion failure"""
-        mock_find_blender.return_value = "/usr/bin/blender"
+        mock_blender_path.return_value = "/usr/bin/blender"
         mock_run.return_value = MagicMock(returncode=1, stderr="Blender error")
         
         input_path = self.create_test_glb()
@@ -332,11 +337,11 @@ class TestVoxBridgeConverter(unittest.TestCase):
         # Should return False when Blender conversion fails
         self.assertFalse(success)
     
-    @patch.object(VoxBridgeConverter, 'find_blender')
+    @patch.object(CapabilityRegistry, 'path')
     @patch('subprocess.run')
-    def test_convert_with_blender_timeout(self, mock_run, mock_find_blender):
+    def test_convert_with_blender_timeout(self, mock_run, mock_blender_path):
         """Test Blender conversion timeout"""
-        mock_find_blender.return_value = "/usr/bin/blender"
+        mock_blender_path.return_value = "/usr/bin/blender"
         mock_run.side_effect = subprocess.TimeoutExpired("blender", 120)
         
         input_path = self.create_test_glb()
@@ -374,7 +379,11 @@ class TestVoxBridgeConverter(unittest.TestCase):
         mock_convert_blender.assert_called_once()
         call_args = mock_convert_blender.call_args
         self.assertEqual(call_args[0][0], input_path)
-        self.assertEqual(call_args[0][1], output_path)
+        # Converters write into a private staging directory inside the output directory
+        staged_output = call_args[0][1]
+        self.assertEqual(staged_output.name, output_path.name)
+        self.assertEqual(staged_output.parent.parent, output_path.parent)
+        self.assertFalse(staged_output.parent.exists())
         self.assertIn('platform', call_args[1])
     
     def test_convert_file_creates_output_directory(self):
@@ -650,6 +659,159 @@ class TestVoxBridgeConverterIntegration(unittest.TestCase):
         self.assertGreaterEqual(stats['nodes'], 1)
 
 
+class TestConversionStaging(unittest.TestCase):
+    """Test cases for per-job staging directories"""
+    
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.input_dir = self.test_dir / "input"
+        self.output_dir = self.test_dir / "output"
+        self.input_dir.mkdir()
+        self.output_dir.mkdir()
+    
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+    
+    def create_input(self, name, texture=None):
+        gltf_data = {"asset": {"version": "2.0"}, "scene": 0, "scenes": [{"nodes": [0]}], "nodes": [{}]}
+        if texture:
+            gltf_data["images"] = [{"uri": texture}]
+            gltf_data["textures"] = [{"source": 0}]
+        path = self.input_dir / f"{name}.gltf"
+        path.write_text(json.dumps(gltf_data))
+        return path
+    
+    def test_concurrent_conversions_share_output_directory(self):
+        """Parallel jobs into one folder each publish only their own package"""
+        from concurrent.futures import ThreadPoolExecutor
+        inputs = [self.create_input(f"model{i}") for i in range(4)]
+        (self.output_dir / "unrelated.glb").write_bytes(b"glTF")
+        
+        def convert(input_path):
+            return VoxBridgeConverter().convert_file(
+                input_path, self.output_dir / f"{input_path.stem}.gltf", use_blender=False)
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            self.assertTrue(all(pool.map(convert, inputs)))
+        
+        self.assertEqual(sorted(p.name for p in self.output_dir.iterdir()),
+                         ["model0.zip", "model1.zip", "model2.zip", "model3.zip", "unrelated.glb"])
+    
+    @unittest.skipUnless(PIL_AVAILABLE, "Pillow not installed")
+    def test_input_textures_are_not_modified(self):
+        """Roblox resizing works on a staged copy of the texture"""
+        texture = self.input_dir / "texture.png"
+        Image.new('RGB', (2048, 64), (200, 10, 10)).save(texture)
+        original = texture.read_bytes()
+        input_path = self.create_input("model", "texture.png")
+        
+        success = VoxBridgeConverter().convert_file(
+            input_path, self.output_dir / "model.gltf", use_blender=False, platform="roblox")
+        
+        self.assertTrue(success)
+        self.assertEqual(texture.read_bytes(), original)
+        import zipfile
+        import io
+        with zipfile.ZipFile(self.output_dir / "model.zip") as zipf:
+            with Image.open(io.BytesIO(zipf.read("texture.png"))) as img:
+                self.assertEqual(img.width, 1024)
+    
+    def test_stale_outputs_of_same_job_removed(self):
+        """Loose files from an earlier unpackaged run of the same output are cleaned up"""
+        (self.output_dir / "model_unity.gltf").write_text("{}")
+        (self.output_dir / "model_extra.gltf").write_text("{}")
+        input_path = self.create_input("model")
+        
+        self.assertTrue(VoxBridgeConverter().convert_file(input_path, self.output_dir / "model.gltf", use_blender=False))
+        
+        self.assertEqual(sorted(p.name for p in self.output_dir.iterdir()), ["model.zip", "model_extra.gltf"])
+
+
+class TestConversionResult(unittest.TestCase):
+    """Test cases for the single validation pass cached on the conversion result"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.input_path = self.test_dir / "model.gltf"
+        self.input_path.write_text(json.dumps({
+            "asset": {"version": "2.0"}, "scene": 0, "scenes": [{"nodes": [0]}], "nodes": [{}],
+        }))
+        self.output_path = self.test_dir / "output" / "model.gltf"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_validation_runs_once(self):
+        """Structure and platform rules land in one report without re-reading the output"""
+        converter = VoxBridgeConverter()
+        rules = (["Missing scene definition"], ["Material 0 missing PBR definition"])
+        with patch.object(converter.platform_manager, 'validate_output') as mock_validate, \
+                patch.object(converter.platform_manager, 'check_gltf', return_value=rules) as mock_check:
+            success = converter.convert_file(self.input_path, self.output_path, use_blender=False, platform="roblox")
+
+        self.assertTrue(success)
+        mock_validate.assert_not_called()
+        mock_check.assert_called_once()
+        result = converter.last_result
+        self.assertIs(result.validation, converter.last_validation)
+        self.assertEqual(result.validation.messages(),
+                         ["/: Missing scene definition", "/: Material 0 missing PBR definition"])
+        self.assertEqual(set(result.validation.timings), {'structure', 'platform'})
+        self.assertEqual(set(result.timings), {'schema', 'conversion', 'validation'})
+        self.assertEqual(result.to_dict()['validation']['errors'], 1)
+
+    def test_report_includes_validation(self):
+        """The performance report reuses the cached validation"""
+        converter = VoxBridgeConverter()
+        self.assertTrue(converter.convert_file(self.input_path, self.output_path, use_blender=False))
+
+        report = converter.generate_performance_report(
+            self.input_path, self.output_path, converter.get_last_conversion_stats())
+
+        self.assertEqual(report['validation'], converter.last_validation.to_dict())
+        self.assertTrue(report['validation']['valid'])
+
+
+@unittest.skipUnless(PIL_AVAILABLE, "PIL/Pillow not installed")
+class TestSharedAtlasBatch(unittest.TestCase):
+    """Test cases for batch conversions into one shared atlas"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.input_dir = self.test_dir / "input"
+        self.input_dir.mkdir()
+        self.output_dir = self.test_dir / "output"
+        for seed in range(2):
+            generate_voxel_glb(self.input_dir / f"asset_{seed}.glb", voxels=200, parts=2, seed=seed, textures=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_batch_validates(self):
+        """Outputs referencing the atlas next to the packages pass validation"""
+        result = CliRunner().invoke(app, ["batch", str(self.input_dir), "--output-dir", str(self.output_dir),
+                                          "--shared-atlas", "--no-blender"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertTrue((self.output_dir / "shared_atlas.png").exists())
+        self.assertNotIn("VALIDATION FAILED", result.output)
+        self.assertEqual(result.output.count("All validations passed"), 2)
+
+    def test_stats_include_atlas(self):
+        """The atlas is found while the output is still staged, so its texture memory is counted"""
+        converter = VoxBridgeConverter()
+        converter.detailed_stats = True
+        input_paths = sorted(self.input_dir.glob("*.glb"))
+        self.assertIsNotNone(converter.prepare_shared_atlas(input_paths, self.output_dir))
+
+        self.assertTrue(converter.convert_file(input_paths[0], self.output_dir / "asset_0.gltf", use_blender=False))
+
+        self.assertTrue(converter.last_result.validation.is_valid)
+        uris = [texture['uri'] for texture in converter.last_result.stats['texture_details']]
+        self.assertIn("shared_atlas.png", uris)
+        self.assertGreater(converter.last_result.stats['texture_memory'], 0)
+
+
 if __name__ == '__main__':
     # Import subprocess for the timeout test
     import subprocess
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge event log
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+
+# Import the events module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.events import EventLog, read_events, summarize_events
+from voxbridge.converter import VoxBridgeConverter
+
+
+def job_events(job, ts, seconds, success=True, error=None, bytes_in=1000):
+    """The events one conversion job writes, reduced to what the summary reads"""
+    return [
+        {'event': 'job_start', 'job': job, 'ts': ts},
+        {'event': 'backend', 'job': job, 'ts': ts, 'backend': 'python', 'outcome': 'success' if success else 'failed'},
+        {'event': 'stage', 'job': job, 'ts': ts, 'stage': 'mesh', 'seconds': seconds / 4},
+        {'event': 'stage', 'job': job, 'ts': ts, 'stage': 'mesh', 'seconds': seconds / 4},
+        {'event': 'job_end', 'job': job, 'ts': ts + seconds, 'seconds': seconds, 'success': success,
+         'error': error, 'bytes_in': bytes_in, 'bytes_out': 500},
+    ]
+
+
+class TestEventLog(unittest.TestCase):
+    """Test cases for event sinks and log summaries"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_sinks(self):
+        """Events go to a callback or one JSON line each in a file; no sink means no events"""
+        received = []
+        log = EventLog(received.append)
+        log.begin_job()
+        log.emit('job_start', input='a.glb')
+        self.assertEqual(received[0]['event'], 'job_start')
+        self.assertEqual(received[0]['job'], log.job)
+
+        log_path = self.test_dir / "logs" / "events.jsonl"
+        log = EventLog(log_path)
+        log.emit('stage', stage='parse', seconds=0.5)
+        log.emit('stage', stage='write', path=self.test_dir)
+        log.close()
+        with open(log_path, 'a') as f:
+            f.write("not json\n")
+        events = list(read_events(log_path))
+        self.assertEqual([event['stage'] for event in events], ['parse', 'write'])
+
+        self.assertFalse(EventLog().enabled)
+        self.assertIsNone(EventLog().emit('job_start'))
+
+    def test_summary(self):
+        """Throughput spans the log; stages repeated within a job are summed per job"""
+        events = []
+        for i in range(10):
+            events += job_events(f"job{i}", ts=i, seconds=(i + 1) / 10)
+        events += job_events("bad", ts=10, seconds=0.1, success=False, error="ValueError: broken")
+
+        summary = summarize_events(events)
+
+        self.assertEqual((summary['jobs'], summary['succeeded'], summary['failed']), (11, 10, 1))
+        self.assertEqual(summary['failure_causes'], {"ValueError: broken": 1})
+        self.assertAlmostEqual(summary['wall_seconds'], 10.1)
+        self.assertAlmostEqual(summary['throughput']['jobs_per_second'], 11 / 10.1, places=5)
+        self.assertEqual(summary['throughput']['bytes_in'], 11000)
+        self.assertAlmostEqual(summary['latency']['max'], 1.0)
+        self.assertAlmostEqual(summary['latency']['p50'], 0.5)
+        self.assertAlmostEqual(summary['stages']['mesh']['max'], 0.5)
+        self.assertEqual(summary['backends']['python'], {'success': 10, 'failed': 1})
+
+    def test_conversion_events(self):
+        """A conversion reports its backend, stages and bytes; a rejected input still ends its job"""
+        gltf_path = self.test_dir / "model.gltf"
+        gltf_path.write_text(json.dumps({
+            "asset": {"version": "2.0"}, "scene": 0, "scenes": [{"nodes": [0]}], "nodes": [{}]}))
+        received = []
+        converter = VoxBridgeConverter()
+        converter.events = EventLog(received.append)
+
+        self.assertTrue(converter.convert_file(gltf_path, self.test_dir / "out" / "model.gltf", use_blender=False))
+
+        names = [event['event'] for event in received]
+        self.assertEqual((names[0], names[-1]), ('job_start', 'job_end'))
+        self.assertEqual(len({event['job'] for event in received}), 1)
+        self.assertIn({'python'}, [{event['backend'] for event in received if event['event'] == 'backend' and event['outcome'] == 'success'}])
+        stages = {event['stage'] for event in received if event['event'] == 'stage'}
+        self.assertEqual(stages, set(converter.stage_timings))
+        job_end = received[-1]
+        self.assertTrue(job_end['success'])
+        self.assertEqual(job_end['backend'], 'python')
+        self.assertEqual(job_end['bytes_in'], gltf_path.stat().st_size)
+        self.assertGreater(job_end['bytes_out'], 0)
+
+        received.clear()
+        bad_path = self.test_dir / "bad.gltf"
+        bad_path.write_text("{not json")
+        self.assertFalse(converter.convert_file(bad_path, self.test_dir / "out" / "bad.gltf", use_blender=False))
+        self.assertEqual(received[-1]['event'], 'job_end')
+        self.assertFalse(received[-1]['success'])
+        self.assertTrue(received[-1]['error'].startswith('InputValidationError'))
+
+
+if __name__ == '__main__':
+    unittest.main()
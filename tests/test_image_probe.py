@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge image header probe
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import struct
+import json
+import os
+
+# Import the image probe module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.image_probe import probe_image, probe_image_bytes, KTX2_IDENTIFIER
+from voxbridge.benchmark import ModelBenchmark
+
+try:
+    from PIL import Image  # type: ignore
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+class TestImageProbe(unittest.TestCase):
+    """Test cases for header-only image dimension reads"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    @unittest.skipUnless(PIL_AVAILABLE, "Pillow not installed")
+    def test_common_formats(self):
+        """PNG, JPEG (with a large EXIF block), WebP and BMP report their size"""
+        cases = [
+            ('PNG', 'png', {}),
+            ('JPEG', 'jpg', {'exif': b'Exif\x00\x00' + b'\x00' * 8000}),
+            ('JPEG', 'jpeg', {'progressive': True}),
+            ('WEBP', 'webp', {}),
+            ('WEBP', 'lossless.webp', {'lossless': True}),
+            ('BMP', 'bmp', {}),
+        ]
+        for fmt, suffix, options in cases:
+            with self.subTest(suffix=suffix):
+                path = self.test_dir / f"texture.{suffix}"
+                Image.new('RGB', (123, 45), (10, 20, 30)).save(path, fmt, **options)
+                info = probe_image(path)
+                self.assertEqual((info.format, info.width, info.height), (fmt, 123, 45))
+
+    def test_ktx2_header(self):
+        """KTX2 dimensions and mip level count come from the fixed header"""
+        header = KTX2_IDENTIFIER + struct.pack('<9I', 37, 1, 512, 256, 0, 0, 1, 10, 0)
+        info = probe_image_bytes(header + b'\x00' * 64)
+        self.assertEqual(info, ('KTX2', 512, 256, 10))
+
+    def test_unknown_and_missing(self):
+        """Unrecognised data and missing files return None"""
+        path = self.test_dir / "notes.png"
+        path.write_bytes(b'not an image')
+        self.assertIsNone(probe_image(path))
+        self.assertIsNone(probe_image(self.test_dir / "missing.png"))
+
+    @unittest.skipUnless(PIL_AVAILABLE, "Pillow not installed")
+    def test_rewritten_file_is_reprobed(self):
+        """The memo key includes mtime and size, so edits are picked up"""
+        path = self.test_dir / "texture.png"
+        Image.new('RGBA', (16, 16)).save(path)
+        self.assertEqual(probe_image(path).width, 16)
+
+        Image.new('RGBA', (32, 8)).save(path)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        info = probe_image(path)
+        self.assertEqual((info.width, info.height), (32, 8))
+
+    @unittest.skipUnless(PIL_AVAILABLE, "Pillow not installed")
+    def test_benchmark_texture_memory(self):
+        """measure_model_stats estimates RGBA memory with mips from header dimensions"""
+        Image.new('RGB', (64, 32)).save(self.test_dir / "a.png")
+        Image.new('RGB', (16, 16)).save(self.test_dir / "b.jpg")
+        gltf_path = self.test_dir / "model.gltf"
+        gltf_path.write_text(json.dumps({
+            "asset": {"version": "2.0"},
+            "images": [{"uri": "a.png"}, {"uri": "b.jpg"}, {"uri": "missing.png"}]
+        }))
+
+        stats = ModelBenchmark().measure_model_stats(gltf_path)
+
+        # Full mip chains: 64x32 down to 1x1 and 16x16 down to 1x1
+        self.assertEqual(stats['texture_memory'], (2731 + 341) * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge metrics
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+import urllib.request
+import urllib.error
+from unittest.mock import patch
+
+# Import the metrics module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.metrics import ConversionMetrics, MetricsRegistry
+from voxbridge.events import EventLog
+from voxbridge.converter import VoxBridgeConverter
+from voxbridge.cli import app
+from typer.testing import CliRunner
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test cases for metric types and the Prometheus text format"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_exposition_format(self):
+        """Counters, gauges and cumulative histogram buckets render as Prometheus text"""
+        registry = MetricsRegistry()
+        counter = registry.counter('jobs_total', 'Jobs', ('outcome',))
+        counter.inc(outcome='success')
+        counter.inc(2, outcome='fail "quoted"')
+        registry.gauge('queue_depth', 'Queue').set(3)
+        histogram = registry.histogram('latency_seconds', 'Latency', buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 5.0):
+            histogram.observe(value)
+
+        lines = registry.render().splitlines()
+
+        self.assertIn('# TYPE jobs_total counter', lines)
+        self.assertIn('jobs_total{outcome="success"} 1', lines)
+        self.assertIn('jobs_total{outcome="fail \\"quoted\\""} 2', lines)
+        self.assertIn('queue_depth 3', lines)
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', lines)
+        self.assertIn('latency_seconds_bucket{le="1"} 3', lines)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 4', lines)
+        self.assertIn('latency_seconds_sum 6.25', lines)
+        self.assertIn('latency_seconds_count 4', lines)
+
+    def test_misuse(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('jobs_total', 'Jobs', ('outcome',))
+        self.assertIs(registry.counter('jobs_total', 'Jobs', ('outcome',)), counter)
+        with self.assertRaises(ValueError):
+            registry.gauge('jobs_total', 'Jobs')
+        with self.assertRaises(ValueError):
+            counter.inc(outcome='success', backend='python')
+        with self.assertRaises(ValueError):
+            counter.inc(-1, outcome='success')
+
+    def test_textfile_and_http(self):
+        """The same text is written atomically for the textfile collector and served at /metrics"""
+        registry = MetricsRegistry()
+        registry.counter('jobs_total', 'Jobs').inc()
+        path = registry.write_textfile(self.test_dir / "collector" / "voxbridge.prom")
+        self.assertEqual(path.read_text(), registry.render())
+        self.assertEqual([p.name for p in path.parent.iterdir()], ["voxbridge.prom"])
+
+        server = registry.serve(0, host='127.0.0.1')
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            with urllib.request.urlopen(f"{url}/metrics") as response:
+                self.assertTrue(response.headers['Content-Type'].startswith('text/plain; version=0.0.4'))
+                self.assertIn('jobs_total 1', response.read().decode())
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{url}/other")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestConversionMetrics(unittest.TestCase):
+    """Test cases for metrics fed from conversion events"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_conversion_updates_metrics(self):
+        gltf_path = self.test_dir / "model.gltf"
+        gltf_path.write_text(json.dumps({
+            "asset": {"version": "2.0"}, "scene": 0, "scenes": [{"nodes": [0]}], "nodes": [{}]}))
+        metrics = ConversionMetrics()
+        converter = VoxBridgeConverter()
+        converter.events = EventLog()
+        metrics.attach(converter.events)
+
+        for _ in range(2):
+            self.assertTrue(converter.convert_file(gltf_path, self.test_dir / "out" / "model.gltf", use_blender=False))
+
+        self.assertEqual(metrics.conversions.value(backend='python', outcome='success'), 2)
+        self.assertEqual(metrics.backend_attempts.value(backend='python', outcome='success'), 2)
+        self.assertEqual(metrics.duration.count(), 2)
+        self.assertEqual(metrics.stage_duration.count(stage='validate'), 2)
+        self.assertEqual(metrics.bytes.value(direction='in'), 2 * gltf_path.stat().st_size)
+        self.assertGreater(metrics.bytes.value(direction='out'), 0)
+        self.assertEqual(metrics.in_progress.value(), 0)
+
+        text = metrics.registry.render()
+        self.assertIn('voxbridge_cache_requests_total{cache="schema_validator",result="hit"}', text)
+        self.assertIn('voxbridge_cache_hit_ratio{cache="image_probe"}', text)
+
+
+    def test_batch_cleans_up_after_a_crash(self):
+        """A conversion that raises still leaves the events closed, the textfile written and the port released"""
+        input_dir = self.test_dir / "input"
+        input_dir.mkdir()
+        (input_dir / "model.glb").write_bytes(b"")
+        metrics_path = self.test_dir / "voxbridge.prom"
+        servers = []
+        serve = MetricsRegistry.serve
+
+        def recording_serve(registry, port, host=''):
+            servers.append(serve(registry, port, host))
+            return servers[-1]
+
+        with patch('voxbridge.cli.handle_conversion', side_effect=RuntimeError("backend crashed")), \
+                patch.object(MetricsRegistry, 'serve', recording_serve):
+            result = CliRunner().invoke(app, ["batch", str(input_dir), "--output-dir", str(self.test_dir / "out"),
+                                              "--metrics-file", str(metrics_path), "--metrics-port", "0",
+                                              "--events", str(self.test_dir / "events.jsonl")])
+
+        self.assertIsInstance(result.exception, RuntimeError)
+        self.assertIn('voxbridge_queue_depth 0', metrics_path.read_text())
+        self.assertEqual(servers[0].socket.fileno(), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge packaging module
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import zipfile
+import zlib
+import json
+import os
+
+# Import the packaging module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.packaging import (
+    COMPRESS_CHUNK_SIZE, ZSTD_AVAILABLE, PackageWriter, crc32_combine, package_manifest
+)
+from voxbridge.converter import VoxBridgeConverter
+
+
+class TestPackageWriter(unittest.TestCase):
+    """Test cases for the streaming, atomically published ZIP writer"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.zip_path = self.test_dir / "model.zip"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_compressed_formats_are_stored(self):
+        """PNG/JPEG/KTX2/WebP members are stored, everything else deflated"""
+        texture = self.test_dir / "palette.png"
+        texture.write_bytes(b'\x89PNG' + b'\x00' * 256)
+
+        with PackageWriter(self.zip_path) as package:
+            package.write_file(texture)
+            package.write_bytes("model.bin", b'\x00' * 256)
+            package.write_json("model.gltf", {"asset": {"version": "2.0"}})
+            with package.open("notes.txt") as member:
+                member.write(b"streamed")
+
+        with zipfile.ZipFile(self.zip_path) as zipf:
+            methods = {info.filename: info.compress_type for info in zipf.infolist()}
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(json.loads(zipf.read("model.gltf")), {"asset": {"version": "2.0"}})
+            self.assertEqual(zipf.read("notes.txt"), b"streamed")
+        self.assertEqual(methods, {
+            "palette.png": zipfile.ZIP_STORED,
+            "model.bin": zipfile.ZIP_DEFLATED,
+            "model.gltf": zipfile.ZIP_DEFLATED,
+            "notes.txt": zipfile.ZIP_DEFLATED,
+        })
+        self.assertEqual(sorted(p.name for p in self.test_dir.iterdir()), ["model.zip", "palette.png"])
+
+    def test_failed_write_keeps_previous_package(self):
+        """An exception discards the partial archive and leaves the old one in place"""
+        with PackageWriter(self.zip_path) as package:
+            package.write_bytes("model.gltf", b"{}")
+
+        with self.assertRaises(RuntimeError):
+            with PackageWriter(self.zip_path) as package:
+                package.write_bytes("model.gltf", b'{"new": true}')
+                raise RuntimeError("stage failed")
+
+        with zipfile.ZipFile(self.zip_path) as zipf:
+            self.assertEqual(zipf.read("model.gltf"), b"{}")
+        self.assertEqual([p.name for p in self.test_dir.iterdir()], ["model.zip"])
+
+    def test_duplicate_member_rejected(self):
+        """The same member name cannot be written twice"""
+        with self.assertRaises(ValueError):
+            with PackageWriter(self.zip_path) as package:
+                package.write_bytes("model.bin", b"a")
+                package.write_bytes("model.bin", b"b")
+        self.assertFalse(self.zip_path.exists())
+
+    def test_large_member_compressed_in_parallel_chunks(self):
+        """Members spanning several chunks round-trip through zipfile with a valid CRC"""
+        source = self.test_dir / "model.bin"
+        data = (os.urandom(4096) + b"\x00" * 60000) * (3 * COMPRESS_CHUNK_SIZE // 64096 + 1)
+        source.write_bytes(data)
+
+        with PackageWriter(self.zip_path, level=1, max_workers=4) as package:
+            package.write_file(source)
+            package.write_bytes("empty.txt", b"")
+            package.write_json("model.gltf", {"asset": {"version": "2.0"}})
+
+        with zipfile.ZipFile(self.zip_path) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(zipf.read("model.bin"), data)
+            self.assertEqual(zipf.read("empty.txt"), b"")
+            info = zipf.getinfo("model.bin")
+        self.assertLess(info.compress_size, len(data))
+        self.assertEqual(info.CRC, zlib.crc32(data))
+
+    def test_store_mode(self):
+        """'store' writes every member uncompressed"""
+        with PackageWriter(self.zip_path, compression='store') as package:
+            package.write_bytes("model.bin", b"\x00" * 1024)
+
+        with zipfile.ZipFile(self.zip_path) as zipf:
+            self.assertEqual(zipf.getinfo("model.bin").compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(zipf.read("model.bin"), b"\x00" * 1024)
+
+    def test_invalid_options_rejected(self):
+        """Unknown modes, out-of-range levels and zstd without zstandard raise ValueError"""
+        with self.assertRaises(ValueError):
+            PackageWriter(self.zip_path, compression='lzma')
+        with self.assertRaises(ValueError):
+            PackageWriter(self.zip_path, level=12)
+        if not ZSTD_AVAILABLE:
+            with self.assertRaises(ValueError):
+                PackageWriter(self.zip_path, compression='zstd')
+
+    def test_deterministic_packages_are_byte_identical(self):
+        """Member order, mtimes and JSON key order do not leak into deterministic packages"""
+        texture = self.test_dir / "palette.png"
+        texture.write_bytes(b'\x89PNG' + b'\x00' * 64)
+        other_path = self.test_dir / "other.zip"
+
+        with PackageWriter(self.zip_path, deterministic=True) as package:
+            package.write_file(texture)
+            package.write_json("model.gltf", {"b": 1, "a": 2})
+        os.utime(texture, (1_700_000_000, 1_700_000_000))
+        with PackageWriter(other_path, deterministic=True) as package:
+            package.write_json("model.gltf", {"a": 2, "b": 1})
+            package.write_file(texture)
+
+        self.assertEqual(self.zip_path.read_bytes(), other_path.read_bytes())
+        with zipfile.ZipFile(self.zip_path) as zipf:
+            self.assertEqual(zipf.namelist(), ["model.gltf", "palette.png"])
+            self.assertEqual(zipf.getinfo("model.gltf").date_time, (1980, 1, 1, 0, 0, 0))
+
+    def test_source_date_epoch(self):
+        """SOURCE_DATE_EPOCH sets the entry timestamps of deterministic packages"""
+        previous = os.environ.get('SOURCE_DATE_EPOCH')
+        os.environ['SOURCE_DATE_EPOCH'] = '1700000000'
+        try:
+            with PackageWriter(self.zip_path, deterministic=True) as package:
+                package.write_bytes("model.bin", b"\x00")
+        finally:
+            if previous is None:
+                del os.environ['SOURCE_DATE_EPOCH']
+            else:
+                os.environ['SOURCE_DATE_EPOCH'] = previous
+
+        with zipfile.ZipFile(self.zip_path) as zipf:
+            self.assertEqual(zipf.getinfo("model.bin").date_time, (2023, 11, 14, 22, 13, 20))
+
+    def test_crc32_combine(self):
+        """Chunk CRCs combine into the CRC of the whole member"""
+        first, second = os.urandom(5000), os.urandom(777)
+        self.assertEqual(crc32_combine(zlib.crc32(first), zlib.crc32(second), len(second)),
+                         zlib.crc32(first + second))
+
+
+class TestPackageManifest(unittest.TestCase):
+    """Test cases for the list of files a glTF document references"""
+
+    def test_buffers_and_images_only(self):
+        """Only relative file URIs are listed, decoded and de-duplicated"""
+        gltf_data = {
+            "buffers": [{"uri": "model.bin"}, {"byteLength": 4}, {"uri": "data:application/octet-stream;base64,AAAA"}],
+            "images": [
+                {"uri": "textures/base%20color.png"},
+                {"uri": "model.bin"},
+                {"uri": "https://example.com/remote.png"},
+                {"bufferView": 2, "mimeType": "image/png"},
+            ],
+        }
+        self.assertEqual(package_manifest(gltf_data), ["model.bin", "textures/base color.png"])
+
+    def test_paths_outside_package_rejected(self):
+        """Absolute, parent-relative and package-root URIs never become package members"""
+        gltf_data = {"images": [{"uri": "../secret.png"}, {"uri": "/etc/passwd"}, {"uri": "C:/tex.png"},
+                                {"uri": "."}, {"uri": "./"}]}
+        self.assertEqual(package_manifest(gltf_data), [])
+
+
+class TestConverterPackaging(unittest.TestCase):
+    """Test cases for converter output packaging"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.converter = VoxBridgeConverter()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_staged_binary_written_into_package(self):
+        """In-memory members go straight into the ZIP without touching disk"""
+        gltf_path = self.test_dir / "model_unity.gltf"
+        gltf_path.write_text(json.dumps({"asset": {"version": "2.0"},
+                                         "buffers": [{"uri": "model.bin", "byteLength": 4}]}))
+        self.converter._staged_members = {"model.bin": b"\x01\x02\x03\x04"}
+
+        zip_path = self.converter._package_output_files(self.test_dir / "model.gltf", gltf_path)
+
+        self.assertEqual(zip_path, self.test_dir / "model.zip")
+        with zipfile.ZipFile(zip_path) as zipf:
+            self.assertEqual(zipf.read("model.bin"), b"\x01\x02\x03\x04")
+            self.assertIn("model_unity.gltf", zipf.namelist())
+        self.assertEqual([p.name for p in self.test_dir.iterdir()], ["model.zip"])
+        self.assertEqual(self.converter._staged_members, {})
+
+    def test_shared_output_directory(self):
+        """Each package holds only its own files; input files are never removed"""
+        input_dir = self.test_dir / "input"
+        output_dir = self.test_dir / "output"
+        input_dir.mkdir()
+        output_dir.mkdir()
+        for name in ("a", "b"):
+            (output_dir / f"{name}.bin").write_bytes(b"\x00" * 4)
+            (input_dir / f"{name}_texture.png").write_bytes(b"\x89PNG")
+            (output_dir / f"{name}_unity.gltf").write_text(json.dumps({
+                "asset": {"version": "2.0"},
+                "buffers": [{"uri": f"{name}.bin", "byteLength": 4}],
+                "images": [{"uri": f"{name}_texture.png"}],
+            }))
+
+        zip_path = self.converter._package_output_files(
+            output_dir / "a.gltf", output_dir / "a_unity.gltf", input_dir / "a.gltf")
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            self.assertEqual(sorted(zipf.namelist()), ["a.bin", "a_texture.png", "a_unity.gltf"])
+        self.assertEqual(sorted(p.name for p in output_dir.iterdir()), ["a.zip", "b.bin", "b_unity.gltf"])
+        self.assertEqual(sorted(p.name for p in input_dir.iterdir()), ["a_texture.png", "b_texture.png"])
+
+    def test_deterministic_conversion(self):
+        """Converting the same input twice in deterministic mode yields identical packages"""
+        input_path = self.test_dir / "model.gltf"
+        input_path.write_text(json.dumps({
+            "asset": {"version": "2.0"},
+            "scene": 0,
+            "scenes": [{"nodes": [0, 1]}],
+            "nodes": [{}, {"name": "Named"}],
+        }))
+        packages = []
+        for run in ("first", "second"):
+            converter = VoxBridgeConverter()
+            converter.optimization_settings['deterministic'] = True
+            output_path = self.test_dir / run / "model.gltf"
+            output_path.parent.mkdir()
+            self.assertTrue(converter.convert_file(input_path, output_path, use_blender=False))
+            packages.append((self.test_dir / run / "model.zip").read_bytes())
+
+        self.assertEqual(packages[0], packages[1])
+        with zipfile.ZipFile(self.test_dir / "first" / "model.zip") as zipf:
+            gltf_data = json.loads(zipf.read("model_unity.gltf"))
+        self.assertEqual([node["name"] for node in gltf_data["nodes"]], ["Node_0", "Named"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge performance harness
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+
+import numpy as np
+
+# Import the perf module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.perf import (ConversionBenchmark, compare_reports, fit_complexity, mann_whitney_greater,
+                            parse_threshold, smallest_p_value, summarize, sweep_report)
+from voxbridge.converter import VoxBridgeConverter
+
+
+def write_triangle(directory):
+    """A one-triangle .gltf with an external buffer"""
+    positions = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype='<f4').tobytes()
+    (directory / "triangle.bin").write_bytes(positions)
+    gltf_path = directory / "triangle.gltf"
+    gltf_path.write_text(json.dumps({
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0}],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}}]}],
+        "accessors": [{"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3",
+                       "min": [0, 0, 0], "max": [1, 1, 0]}],
+        "bufferViews": [{"buffer": 0, "byteLength": len(positions)}],
+        "buffers": [{"byteLength": len(positions), "uri": "triangle.bin"}],
+    }))
+    return gltf_path
+
+
+def asset_record(samples, file_size=1000, asset='model'):
+    """Minimal harness record for comparisons"""
+    return {
+        'asset': asset,
+        'wall_time': summarize(samples),
+        'stages': {'parse': summarize([value / 2 for value in samples])},
+        'memory': {'peak_traced_bytes': 100},
+        'output': {'file_size': file_size, 'triangles': 12},
+    }
+
+
+class TestRegressionGate(unittest.TestCase):
+    """Test cases for baseline comparison"""
+
+    def test_mann_whitney(self):
+        """Fully separated samples of five give the exact p-value 1/252"""
+        self.assertAlmostEqual(mann_whitney_greater([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]), 1 / 252)
+        self.assertAlmostEqual(mann_whitney_greater([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]), 1.0)
+        self.assertLess(mann_whitney_greater([3, 3, 4, 4, 4], [1, 1, 2, 2, 2]), 0.05)
+
+    def test_regression_detected(self):
+        """A consistent slowdown and a larger output are regressions"""
+        baseline = {'assets': [asset_record([0.10, 0.11, 0.10, 0.12, 0.11])]}
+        current = {'assets': [asset_record([0.20, 0.21, 0.22, 0.20, 0.21], file_size=1200)]}
+
+        comparison = compare_reports(baseline, current, threshold=0.10)
+
+        statuses = {row['metric']: row['status'] for row in comparison['rows']}
+        self.assertEqual(statuses['wall_time'], 'regression')
+        self.assertEqual(statuses['stage:parse'], 'regression')
+        self.assertEqual(statuses['output:file_size'], 'regression')
+        self.assertEqual(statuses['output:triangles'], 'unchanged')
+        self.assertEqual(comparison['regressions'], 3)
+
+        improved = compare_reports(current, baseline, threshold=0.10)
+        self.assertEqual(improved['regressions'], 0)
+        self.assertEqual(improved['improvements'], 3)
+
+    def test_noise_is_not_a_regression(self):
+        """A higher median from overlapping, noisy samples fails the significance test"""
+        baseline = {'assets': [asset_record([0.10, 0.30, 0.12, 0.28, 0.11])]}
+        current = {'assets': [asset_record([0.29, 0.11, 0.27, 0.13, 0.30]),
+                              asset_record([0.1], asset='new')]}
+
+        comparison = compare_reports(baseline, current, threshold=0.10)
+
+        wall_time = next(row for row in comparison['rows'] if row['metric'] == 'wall_time')
+        self.assertGreater(wall_time['change'], 0.10)
+        self.assertEqual(wall_time['status'], 'unchanged')
+        self.assertEqual(comparison['new_assets'], ['new'])
+
+    def test_three_repetitions(self):
+        """Three repetitions a side cannot reach p < 0.05, so the threshold decides alone"""
+        self.assertAlmostEqual(smallest_p_value(3, 3), 1 / 20)
+        self.assertLess(smallest_p_value(4, 4), 0.05)
+        baseline = {'assets': [asset_record([0.10, 0.11, 0.12])]}
+        current = {'assets': [asset_record([0.20, 0.21, 0.22])]}
+
+        comparison = compare_reports(baseline, current, threshold=0.10)
+
+        wall_time = next(row for row in comparison['rows'] if row['metric'] == 'wall_time')
+        self.assertEqual(wall_time['status'], 'regression')
+        self.assertIsNone(wall_time['p_value'])
+        self.assertEqual(compare_reports(current, baseline, threshold=0.10)['improvements'], 2)
+
+    def test_parse_threshold(self):
+        self.assertAlmostEqual(parse_threshold("10%"), 0.10)
+        self.assertAlmostEqual(parse_threshold("2.5"), 0.025)
+        with self.assertRaises(ValueError):
+            parse_threshold("ten")
+
+
+class TestPerformanceHarness(unittest.TestCase):
+    """Test cases for repeated, timed conversions"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_summarize(self):
+        """Median and p95 use linear interpolation between samples"""
+        summary = summarize([0.4, 0.1, 0.2, 0.3])
+        self.assertAlmostEqual(summary['median'], 0.25)
+        self.assertAlmostEqual(summary['p95'], 0.385)
+        self.assertEqual((summary['min'], summary['max']), (0.1, 0.4))
+        self.assertIsNone(summarize([])['median'])
+
+    def test_fit_complexity(self):
+        """The log-log slope recovers the exponent of power-law timings"""
+        sizes = [1000, 4000, 16000]
+        linear = fit_complexity(sizes, [0.01, 0.04, 0.16])
+        self.assertAlmostEqual(linear['exponent'], 1.0)
+        self.assertEqual(linear['complexity'], 'O(n)')
+        self.assertFalse(linear['superlinear'])
+
+        quadratic = fit_complexity(sizes, [0.01, 0.16, 2.56])
+        self.assertEqual(quadratic['complexity'], 'O(n^2)')
+        self.assertTrue(quadratic['superlinear'])
+
+        self.assertIsNone(fit_complexity(sizes, [0.01, None, 0.0]))
+
+        records = [{'wall_time': {'median': t}, 'stages': {'parse': {'median': t / 2}}} for t in (0.01, 0.04, 0.16)]
+        self.assertEqual(sweep_report(sizes, records)['stages']['parse']['complexity'], 'O(n)')
+
+    def test_repetitions(self):
+        """Warmup runs are discarded; timed runs give wall-time and per-stage samples"""
+        input_path = write_triangle(self.test_dir)
+        harness = ConversionBenchmark(VoxBridgeConverter(), repetitions=3, warmup=1)
+
+        record = harness.run_asset(input_path, self.test_dir / "out" / "triangle.gltf", use_blender=False)
+
+        self.assertTrue(record['success'])
+        self.assertEqual(len(record['wall_time']['samples']), 3)
+        self.assertTrue({'schema', 'parse', 'mesh', 'validate', 'package'} <= set(record['stages']))
+        self.assertEqual(len(record['stages']['parse']['samples']), 3)
+        self.assertGreater(record['memory']['peak_traced_bytes'], 0)
+        self.assertNotIn('peak_rss_bytes', record['memory'])
+        self.assertEqual(record['output']['triangles'], 1)
+
+        report_path = self.test_dir / "perf.json"
+        harness.save_report(report_path, settings={'target': 'unity'})
+        report = json.loads(report_path.read_text())
+        self.assertEqual(report['settings']['repetitions'], 3)
+        self.assertEqual(report['settings']['target'], 'unity')
+        self.assertEqual(report['assets'][0]['asset'], 'triangle')
+        self.assertIn('peak_rss_bytes', report)
+
+    def test_failed_conversions(self):
+        """Errors are collected instead of aborting the benchmark"""
+        input_path = self.test_dir / "broken.gltf"
+        input_path.write_text("{not json")
+        harness = ConversionBenchmark(VoxBridgeConverter(), repetitions=2, warmup=0, trace_memory=False)
+
+        record = harness.run_asset(input_path, self.test_dir / "out" / "broken.gltf", use_blender=False)
+
+        self.assertFalse(record['success'])
+        self.assertEqual(record['successful_runs'], 0)
+        self.assertEqual(len(record['errors']), 1)
+        self.assertIsNone(record['memory']['peak_traced_bytes'])
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            ConversionBenchmark(VoxBridgeConverter(), repetitions=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge profiling spans
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+import pstats
+import timeit
+import tracemalloc
+from unittest.mock import patch
+
+# Import the profiling module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.profiling import NULL_SPAN, MemoryProfiler, Profiler, traced
+from voxbridge.schemas import check_report_schema
+from voxbridge.converter import VoxBridgeConverter
+from voxbridge.cli import app
+from typer.testing import CliRunner
+
+
+class Worker:
+    """Minimal object carrying a profiler, as the converter does"""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    @traced()
+    def _step(self, value):
+        return value * 2
+
+    @traced('renamed')
+    def other(self):
+        with self.profiler.span('inner'):
+            return self._step(1)
+
+
+class TestProfiler(unittest.TestCase):
+    """Test cases for span recording and export"""
+
+    def test_nesting_by_containment(self):
+        """Spans nest by time containment; self time excludes children"""
+        profiler = Profiler(enabled=True)
+        profiler.record('convert', 0.0, 10.0)
+        profiler.record('parse', 1.0, 3.0)
+        profiler.record('package', 4.0, 9.0)
+        profiler.record('zip', 5.0, 6.0)
+        profiler.record('convert', 20.0, 21.0)
+
+        summary = {tuple(entry['path']): entry for entry in profiler.summary()}
+        self.assertEqual(summary[('convert',)]['calls'], 2)
+        self.assertEqual(summary[('convert',)]['self'], 4.0)
+        self.assertEqual(summary[('convert', 'package')]['self'], 4.0)
+        self.assertEqual([entry['path'] for entry in profiler.summary()][:2], [['convert'], ['convert', 'package']])
+        self.assertIn('convert;package;zip 1000000', profiler.collapsed_stacks())
+
+    def test_disabled(self):
+        """A disabled profiler records nothing and adds little overhead to traced methods"""
+        profiler = Profiler()
+        worker = Worker(profiler)
+        self.assertIs(profiler.span('anything'), NULL_SPAN)
+        self.assertEqual(worker.other(), 2)
+        self.assertEqual(profiler.spans, [])
+
+        def plain(value):
+            return value * 2
+        traced_time = min(timeit.repeat(lambda: worker._step(1), number=20000, repeat=3))
+        plain_time = min(timeit.repeat(lambda: plain(1), number=20000, repeat=3))
+        self.assertLess(traced_time, plain_time * 10 + 0.01)
+
+    def test_traced_names(self):
+        profiler = Profiler(enabled=True)
+        Worker(profiler).other()
+        self.assertEqual([' '.join(entry['path']) for entry in profiler.summary()],
+                         ['renamed', 'renamed inner', 'renamed inner step'])
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    """Test cases for tracemalloc snapshots at stage boundaries"""
+
+    def test_stages(self):
+        """Retained memory and its allocation site are charged to the stage that allocated it"""
+        profiler = MemoryProfiler(enabled=True)
+        profiler.begin()
+        kept = bytearray(2 * 1024 * 1024)
+        profiler.stage('allocate')
+        temporary = bytearray(4 * 1024 * 1024)
+        del temporary
+        profiler.stage('spike')
+        profiler.end()
+        self.assertFalse(tracemalloc.is_tracing())
+
+        allocate, spike = profiler.stages
+        self.assertGreaterEqual(allocate['retained_bytes'], len(kept))
+        self.assertIn('test_profiling.py', allocate['top_allocations'][0]['site'])
+        self.assertGreaterEqual(spike['peak_bytes'] - spike['start_bytes'], 4 * 1024 * 1024)
+        self.assertLess(spike['retained_bytes'], 1024 * 1024)
+
+        report = profiler.report()
+        self.assertEqual(report['peak_stage'], 'spike')
+        self.assertEqual(set(report['by_stage']), {'allocate', 'spike'})
+
+    def test_disabled(self):
+        profiler = MemoryProfiler()
+        profiler.begin()
+        profiler.stage('anything')
+        profiler.end()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIsNone(profiler.report())
+
+
+class TestConverterProfiling(unittest.TestCase):
+    """Test cases for conversion spans and profile files"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_conversion_spans(self):
+        """Backend, stages and steps appear as spans; files are written for flamegraph and pstats tools"""
+        gltf_path = self.test_dir / "model.gltf"
+        gltf_path.write_text(json.dumps({
+            "asset": {"version": "2.0"}, "scene": 0, "scenes": [{"nodes": [0]}], "nodes": [{}]}))
+        converter = VoxBridgeConverter()
+        converter.profiler = Profiler(enabled=True, cprofile=True)
+
+        converter.profiler.start()
+        self.assertTrue(converter.convert_file(gltf_path, self.test_dir / "out" / "model.gltf", use_blender=False))
+        converter.profiler.stop()
+
+        paths = {' '.join(entry['path']) for entry in converter.profiler.summary()}
+        self.assertIn('convert_file', paths)
+        self.assertIn('convert_file convert_with_fallbacks backend:python stage:parse clean_gltf_json', paths)
+        self.assertIn('convert_file convert_with_fallbacks backend:python stage:validate run_validation', paths)
+
+        files = converter.profiler.write(self.test_dir / "profile", "model")
+        self.assertEqual([path.name for path in files], ["model.profile.json", "model.folded", "model.pstats"])
+        self.assertTrue(files[1].read_text().startswith("convert_file"))
+        self.assertGreater(pstats.Stats(str(files[2])).total_calls, 0)
+
+    def test_memory_profile_report(self):
+        """Every pipeline stage gets a memory entry that the performance report carries"""
+        gltf_path = self.test_dir / "model.gltf"
+        gltf_path.write_text(json.dumps({
+            "asset": {"version": "2.0"}, "scene": 0, "scenes": [{"nodes": [0]}], "nodes": [{}]}))
+        converter = VoxBridgeConverter()
+        converter.memory_profiler = MemoryProfiler(enabled=True)
+
+        output_path = self.test_dir / "out" / "model.gltf"
+        self.assertTrue(converter.convert_file(gltf_path, output_path, use_blender=False))
+        self.assertFalse(tracemalloc.is_tracing())
+
+        stages = [entry['stage'] for entry in converter.memory_profiler.stages]
+        self.assertEqual(stages[0], 'schema')
+        self.assertEqual(stages[-1], 'publish')
+        self.assertTrue(set(converter.stage_timings) <= set(stages))
+
+        report = converter.generate_performance_report(gltf_path, output_path, converter.get_last_conversion_stats())
+        self.assertEqual(report['memory_profile']['stages'], converter.memory_profiler.stages)
+        self.assertEqual(check_report_schema(report), [])
+
+
+    def test_cli_profile_written_when_conversion_raises(self):
+        """cProfile is stopped and the profile written even if convert_file raises; --cprofile alone profiles nothing"""
+        glb_path = self.test_dir / "model.glb"
+        glb_path.write_bytes(b"")
+        output_path = self.test_dir / "out" / "model.gltf"
+        output_path.parent.mkdir()
+
+        with patch.object(VoxBridgeConverter, 'convert_file', side_effect=RuntimeError("backend crashed")):
+            result = CliRunner().invoke(app, ["convert", "--input", str(glb_path), "--output", str(output_path),
+                                              "--no-blender", "--profile", "--cprofile"])
+        self.assertEqual(result.exit_code, 1, result.output)
+        self.assertIsNone(sys.getprofile())
+        self.assertEqual(sorted(path.name for path in output_path.parent.iterdir()),
+                         ["model.folded", "model.profile.json", "model.pstats"])
+
+        for path in output_path.parent.iterdir():
+            path.unlink()
+        with patch.object(VoxBridgeConverter, 'convert_file', return_value=False):
+            CliRunner().invoke(app, ["convert", "--input", str(glb_path), "--output", str(output_path),
+                                     "--no-blender", "--cprofile"])
+        self.assertEqual(list(output_path.parent.iterdir()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
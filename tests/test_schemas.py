@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge bundled JSON schemas
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import struct
+import json
+from unittest.mock import patch
+
+# Import the schemas module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.schemas import GLTF_SCHEMA, REPORT_SCHEMA, check_gltf_schema, check_report_schema, get_validator
+from voxbridge.gltf_io import read_gltf_json
+from voxbridge.converter import VoxBridgeConverter, InputValidationError
+
+
+def write_glb(path, gltf_data, binary=b''):
+    """Write a GLB with a JSON chunk and an optional BIN chunk"""
+    json_chunk = json.dumps(gltf_data).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    chunks = struct.pack('<II', len(json_chunk), 0x4E4F534A) + json_chunk
+    if binary:
+        chunks += struct.pack('<II', len(binary), 0x004E4942) + binary
+    path.write_bytes(struct.pack('<4sII', b'glTF', 2, 12 + len(chunks)) + chunks)
+
+
+class TestSchemas(unittest.TestCase):
+    """Test cases for the glTF 2.0 and report schemas"""
+
+    def test_validators_compiled_once(self):
+        """Each bundled schema is compiled a single time per process"""
+        self.assertIs(get_validator(GLTF_SCHEMA), get_validator(GLTF_SCHEMA))
+        self.assertIsNot(get_validator(GLTF_SCHEMA), get_validator(REPORT_SCHEMA))
+
+    def test_valid_gltf(self):
+        """A minimal document with a scene passes"""
+        gltf_data = {"asset": {"version": "2.0"}, "scene": 0, "scenes": [{"nodes": [0]}], "nodes": [{}]}
+        self.assertEqual(check_gltf_schema(gltf_data), [])
+
+    def test_malformed_gltf(self):
+        """Wrong types, enums and missing required properties are reported with pointers"""
+        gltf_data = {
+            "asset": {"version": 2},
+            "accessors": [{"componentType": 1234, "count": 0, "type": "VEC3"}],
+            "nodes": [{"matrix": [1] * 16, "translation": [0, 0, 0]}],
+            "images": [{}],
+        }
+        errors = check_gltf_schema(gltf_data)
+        pointers = {error.split(':')[0] for error in errors}
+        self.assertTrue({'/asset/version', '/accessors/0/componentType', '/accessors/0/count',
+                         '/nodes/0', '/images/0'} <= pointers)
+        self.assertEqual(len(check_gltf_schema(gltf_data, limit=2)), 2)
+        self.assertEqual(check_gltf_schema({}), ["/: 'asset' is a required property"])
+
+    def test_report_schema(self):
+        """Reports need their core fields and a well-formed validation block"""
+        report = {
+            "input_file": "in.glb", "output_file": "out.gltf", "timestamp": "2024-01-01 00:00:00",
+            "file_size_before": 10, "file_size_after": 5, "platform": "unity",
+            "optimizations_applied": [], "warnings": [], "notes": [], "validation": None,
+        }
+        self.assertEqual(check_report_schema(report), [])
+
+        report["validation"] = {"valid": True, "errors": -1, "warnings": 0, "issues": []}
+        del report["platform"]
+        self.assertEqual(len(check_report_schema(report)), 2)
+
+
+class TestInputSchemaCheck(unittest.TestCase):
+    """Test cases for rejecting malformed inputs before conversion"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.converter = VoxBridgeConverter()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_glb_json_read_without_binary(self):
+        """Only the JSON chunk of a GLB is parsed"""
+        glb_path = self.test_dir / "model.glb"
+        write_glb(glb_path, {"asset": {"version": "2.0"}}, b'\x00' * 64)
+        self.assertEqual(read_gltf_json(glb_path), {"asset": {"version": "2.0"}})
+
+        glb_path.write_bytes(b'glTF' + b'\x00' * 4)
+        with self.assertRaises(ValueError):
+            read_gltf_json(glb_path)
+
+    def test_tolerated_deviations_convert(self):
+        """Empty image/sampler/texture and scene node lists and null names pass the check"""
+        input_path = self.test_dir / "loose.gltf"
+        input_path.write_text(json.dumps({
+            "asset": {"version": "2.0"}, "scene": 0, "scenes": [{"nodes": []}], "nodes": [{"name": None}],
+            "textures": [], "images": [], "samplers": []}))
+        self.converter.check_input_schema(input_path)
+        self.assertTrue(self.converter.convert_file(input_path, self.test_dir / "out" / "loose.gltf", use_blender=False))
+
+    def test_malformed_input_fails_before_backends(self):
+        """No backend runs and no output is created for a structurally invalid input"""
+        input_path = self.test_dir / "broken.glb"
+        write_glb(input_path, {"asset": {}, "meshes": [{"primitives": []}], "accessors": [{"count": -3}]})
+        output_dir = self.test_dir / "output"
+
+        with patch.object(self.converter, '_convert_with_fallbacks') as mock_convert:
+            self.assertFalse(self.converter.convert_file(input_path, output_dir / "broken.gltf"))
+
+        mock_convert.assert_not_called()
+        self.assertIn("/asset: 'version' is a required property", self.converter.last_result.error)
+        self.assertIn("/accessors/0/count: -3 is less than the minimum of 1", self.converter.last_result.error)
+        self.assertEqual(list(output_dir.iterdir()), [])
+
+    def test_unparseable_input_fails_before_backends(self):
+        """No backend runs and no output is created for input that is not a JSON object"""
+        output_dir = self.test_dir / "output"
+        for name, content in (("broken.gltf", "{not json"), ("list.gltf", "[1, 2]")):
+            input_path = self.test_dir / name
+            input_path.write_text(content)
+            with self.assertRaises(InputValidationError):
+                self.converter.check_input_schema(input_path)
+
+            with patch.object(self.converter, '_convert_with_fallbacks') as mock_convert:
+                self.assertFalse(self.converter.convert_file(input_path, output_dir / name))
+            mock_convert.assert_not_called()
+            self.assertFalse(self.converter.last_result.success)
+            self.assertIn(name, self.converter.last_result.error)
+            self.assertEqual(list(output_dir.iterdir()), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge startup cost
+"""
+
+import unittest
+from pathlib import Path
+import subprocess
+import time
+
+# Import the voxbridge package
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+ROOT = Path(__file__).parent.parent
+
+# Dependencies that only a conversion needs
+HEAVY_MODULES = ('numpy', 'PIL', 'pygltflib', 'jsonschema', 'voxbridge.converter', 'http.server')
+
+# Seconds on top of a bare interpreter start, best of STARTUP_RUNS; loading the
+# converter eagerly put `voxbridge --help` at about twice its budget
+IMPORT_BUDGET = 0.15
+HELP_BUDGET = 0.6
+STARTUP_RUNS = 3
+
+
+def run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, timeout=60)
+
+
+def startup_time(*args):
+    """Best wall time of STARTUP_RUNS interpreter runs"""
+    times = []
+    for _ in range(STARTUP_RUNS):
+        start = time.perf_counter()
+        result = run_python(*args)
+        times.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise AssertionError(result.stderr)
+    return min(times)
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test cases for deferred imports"""
+
+    def test_import_is_light(self):
+        """Importing the package or the CLI loads none of the conversion dependencies"""
+        for statement in ('import voxbridge', 'import voxbridge.cli'):
+            result = run_python('-c', f"{statement}; import sys; "
+                                      f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertEqual(result.stdout.strip(), '', statement)
+
+    def test_lazy_attribute(self):
+        import voxbridge
+        from voxbridge.converter import VoxBridgeConverter
+        self.assertIs(voxbridge.VoxBridgeConverter, VoxBridgeConverter)
+        self.assertIn('VoxBridgeConverter', dir(voxbridge))
+        with self.assertRaises(AttributeError):
+            voxbridge.NotAThing
+
+    def test_startup_budget(self):
+        """`import voxbridge` and `voxbridge --help` stay within a fixed time over interpreter start"""
+        baseline = startup_time('-c', 'pass')
+        self.assertLess(startup_time('-c', 'import voxbridge') - baseline, IMPORT_BUDGET)
+        self.assertLess(startup_time('-m', 'voxbridge.cli', '--help') - baseline, HELP_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge statistics engine
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+import struct
+import io
+
+import numpy as np
+
+# Import the stats module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.stats import compute_stats, compute_file_stats, mip_chain_pixels, texture_gpu_bytes
+from voxbridge.benchmark import ModelBenchmark
+from voxbridge.converter import VoxBridgeConverter
+from voxbridge.schemas import check_report_schema
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+def quad_document():
+    """A quad drawn as an indexed triangle list, plus a strip and a point cloud reusing its vertices"""
+    positions = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 0]], dtype='<f4')
+    indices = np.array([0, 1, 2, 0, 2, 3], dtype='<u2')
+    data = positions.tobytes() + indices.tobytes()
+    gltf_data = {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0, 1]}],
+        "nodes": [{"mesh": 0}, {"children": [2]}, {"mesh": 0}, {"mesh": 1}],
+        "meshes": [
+            {"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]},
+            {"primitives": [{"attributes": {"POSITION": 0}, "mode": 5},
+                            {"attributes": {"POSITION": 0}, "mode": 0}]},
+        ],
+        "accessors": [
+            {"bufferView": 0, "componentType": 5126, "count": 5, "type": "VEC3"},
+            {"bufferView": 1, "componentType": 5123, "count": 6, "type": "SCALAR"},
+        ],
+        "bufferViews": [
+            {"buffer": 0, "byteLength": 60},
+            {"buffer": 0, "byteOffset": 60, "byteLength": 12},
+        ],
+        "buffers": [{"byteLength": len(data)}],
+    }
+    return gltf_data, data
+
+
+class TestStatsEngine(unittest.TestCase):
+    """Test cases for geometry and memory statistics"""
+
+    def test_triangles_per_mode(self):
+        """Lists, strips and points are counted from accessor counts, not JSON lengths"""
+        gltf_data, _ = quad_document()
+        stats = compute_stats(gltf_data)
+
+        self.assertEqual(stats['triangles'], 2 + 3)
+        self.assertEqual(stats['triangles_by_mode'], {'4': 2, '5': 3, '0': 0})
+        self.assertEqual(stats['vertices'], 15)
+        self.assertIsNone(stats['unique_vertices'])
+
+    def test_draw_calls_follow_scene(self):
+        """Only meshes instanced by the default scene are drawn, once per instance"""
+        gltf_data, _ = quad_document()
+        stats = compute_stats(gltf_data)
+        self.assertEqual(stats['primitives'], 3)
+        self.assertEqual(stats['draw_calls'], 2)
+        self.assertEqual(stats['scene_triangles'], 4)
+
+        del gltf_data['scenes']
+        self.assertEqual(compute_stats(gltf_data)['draw_calls'], 1 + 1 + 2)
+
+    def test_buffers(self):
+        """Unique positions are decoded from the buffer and bytes are grouped by semantic"""
+        gltf_data, data = quad_document()
+        stats = compute_stats(gltf_data, [data])
+
+        self.assertEqual(stats['unique_vertices'], 4)
+        self.assertEqual(stats['buffer_bytes'], {'POSITION': 60, 'indices': 12})
+
+        cheap = compute_stats(gltf_data, [data], detailed=False)
+        self.assertIsNone(cheap['unique_vertices'])
+        self.assertIsNone(cheap['texture_memory'])
+        self.assertEqual(cheap['triangles'], stats['triangles'])
+        self.assertEqual(cheap['buffer_bytes'], stats['buffer_bytes'])
+
+    def test_mip_chain(self):
+        """Full chains run down to 1x1 on the longer axis; KTX2 keeps its stored levels"""
+        self.assertEqual(mip_chain_pixels(1, 1), 1)
+        self.assertEqual(mip_chain_pixels(4, 4), 16 + 4 + 1)
+        self.assertEqual(mip_chain_pixels(4, 1), 4 + 2 + 1)
+        self.assertEqual(texture_gpu_bytes('PNG', 4, 4), 21 * 4)
+        self.assertEqual(texture_gpu_bytes('KTX2', 4, 4, levels=2), 16 + 4)
+
+    @unittest.skipUnless(PIL_AVAILABLE, "Pillow not installed")
+    def test_glb_embedded_texture(self):
+        """Images stored in a GLB bufferView are probed in memory"""
+        png = io.BytesIO()
+        Image.new('RGB', (8, 8)).save(png, format='PNG')
+        png = png.getvalue()
+        png += b'\x00' * (-len(png) % 4)
+        gltf_data, data = quad_document()
+        gltf_data['bufferViews'].append({"buffer": 0, "byteOffset": len(data), "byteLength": len(png)})
+        gltf_data['images'] = [{"bufferView": 2, "mimeType": "image/png"}]
+        gltf_data['buffers'][0]['byteLength'] = len(data) + len(png)
+        json_chunk = json.dumps(gltf_data).encode('utf-8')
+        json_chunk += b' ' * (-len(json_chunk) % 4)
+        binary = data + png
+        chunks = (struct.pack('<II', len(json_chunk), 0x4E4F534A) + json_chunk +
+                  struct.pack('<II', len(binary), 0x004E4942) + binary)
+        test_dir = Path(tempfile.mkdtemp())
+        try:
+            glb_path = test_dir / "quad.glb"
+            glb_path.write_bytes(struct.pack('<4sII', b'glTF', 2, 12 + len(chunks)) + chunks)
+
+            stats = compute_file_stats(glb_path)
+            self.assertEqual(stats['texture_memory'], (64 + 16 + 4 + 1) * 4)
+            self.assertEqual(stats['buffer_bytes']['images'], len(png))
+
+            benchmark_stats = ModelBenchmark().measure_model_stats(glb_path)
+            self.assertEqual(benchmark_stats['total_triangles'], 5)
+            self.assertEqual(benchmark_stats['file_size'], glb_path.stat().st_size)
+        finally:
+            shutil.rmtree(test_dir)
+
+
+class TestConverterStats(unittest.TestCase):
+    """Test cases for statistics in conversion summaries and reports"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_report_triangles(self):
+        """Conversion stats and the performance report carry triangle and draw call counts"""
+        gltf_data, data = quad_document()
+        gltf_data['buffers'][0]['uri'] = "quad.bin"
+        (self.test_dir / "quad.bin").write_bytes(data)
+        input_path = self.test_dir / "quad.gltf"
+        input_path.write_text(json.dumps(gltf_data))
+        output_path = self.test_dir / "out" / "quad.gltf"
+
+        converter = VoxBridgeConverter()
+        self.assertTrue(converter.convert_file(input_path, output_path, use_blender=False))
+        stats = converter.get_last_conversion_stats()
+        self.assertEqual(stats['triangles'], 5)
+        self.assertEqual(stats['draw_calls'], 2)
+        self.assertIsNone(stats['unique_vertices'])
+        # The published package, not the bare .gltf JSON
+        self.assertEqual(stats['file_size'], (self.test_dir / "out" / "quad.zip").stat().st_size)
+
+        # A report asks for the fields that read the buffers
+        converter.detailed_stats = True
+        self.assertTrue(converter.convert_file(input_path, output_path, use_blender=False))
+        stats = converter.get_last_conversion_stats()
+        self.assertEqual(stats['unique_vertices'], 4)
+
+        report = converter.generate_performance_report(input_path, output_path, stats)
+        self.assertEqual((report['triangles_before'], report['triangles_after']), (5, 5))
+        self.assertEqual(check_report_schema(report), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
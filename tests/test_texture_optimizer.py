@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge texture optimizer module
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+
+# Import the texture optimizer module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import struct
+import zlib
+
+try:
+    import numpy as np
+    from PIL import Image  # type: ignore
+    from voxbridge.texture_optimizer import quantize_to_palette, optimize_png, deduplicate_textures
+    from voxbridge.texture_optimizer import build_shared_atlas, remap_gltf_to_atlas
+    from voxbridge.converter import VoxBridgeConverter
+    TEXTURE_DEPS_AVAILABLE = True
+except ImportError:
+    TEXTURE_DEPS_AVAILABLE = False
+
+
+def write_png16(path, pixels):
+    """Write an RGB uint16 array as a 16-bit PNG (Pillow cannot save 16-bit RGB)"""
+    height, width, _ = pixels.shape
+    rows = pixels.astype('>u2').reshape(height, width * 3)
+    raw = b''.join(b'\x00' + row.tobytes() for row in rows)
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+    path.write_bytes(b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 16, 2, 0, 0, 0))
+                     + chunk(b'IDAT', zlib.compress(raw, 0)) + chunk(b'IEND', b''))
+
+
+@unittest.skipUnless(TEXTURE_DEPS_AVAILABLE, "Pillow/numpy/pygltflib not installed")
+class TestPaletteQuantization(unittest.TestCase):
+    """Test cases for indexed PNG conversion"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def make_palette_texture(self, name, alpha=255, colors=16):
+        """Create an RGBA stripe texture with a fixed number of colors"""
+        rng = np.random.default_rng(0)
+        palette = rng.integers(0, 256, size=(colors, 3), dtype=np.uint8)
+        stripes = np.repeat(np.arange(colors), 4)
+        pixels = np.zeros((64, len(stripes), 4), dtype=np.uint8)
+        pixels[:, :, :3] = palette[stripes]
+        pixels[:, :, 3] = alpha
+        if alpha != 255:
+            pixels[::2, :, 3] = 255
+        path = self.test_dir / name
+        Image.fromarray(pixels).save(path)
+        return path, pixels
+
+    def test_opaque_texture_drops_alpha(self):
+        """Opaque low-color textures become palette PNGs without tRNS"""
+        path, pixels = self.make_palette_texture("opaque.png")
+
+        self.assertTrue(quantize_to_palette(str(path)))
+
+        with Image.open(path) as img:
+            self.assertEqual(img.mode, 'P')
+            self.assertNotIn('transparency', img.info)
+            np.testing.assert_array_equal(np.asarray(img.convert('RGBA')), pixels)
+
+    def test_translucent_texture_keeps_alpha(self):
+        """Per-entry alpha survives the conversion via tRNS"""
+        path, pixels = self.make_palette_texture("alpha.png", alpha=128)
+
+        self.assertTrue(quantize_to_palette(str(path)))
+
+        with Image.open(path) as img:
+            self.assertEqual(img.mode, 'P')
+            self.assertIn('transparency', img.info)
+            np.testing.assert_array_equal(np.asarray(img.convert('RGBA')), pixels)
+
+    def test_high_color_texture_untouched(self):
+        """Textures with more than 256 colors are left alone"""
+        rng = np.random.default_rng(1)
+        pixels = rng.integers(0, 256, size=(64, 64, 3), dtype=np.uint8)
+        path = self.test_dir / "noise.png"
+        Image.fromarray(pixels).save(path)
+        original = path.read_bytes()
+
+        self.assertFalse(quantize_to_palette(str(path)))
+        self.assertEqual(path.read_bytes(), original)
+
+    def test_non_png_untouched(self):
+        """JPEG textures are never rewritten as PNG data"""
+        path = self.test_dir / "flat.jpg"
+        Image.new('RGB', (32, 32), color=(10, 20, 30)).save(path)
+
+        self.assertFalse(quantize_to_palette(str(path)))
+
+    def test_16_bit_texture_untouched(self):
+        """Few colors at 16 bits per channel would lose precision as a palette"""
+        pixels = np.zeros((16, 16, 3), dtype=np.uint16)
+        pixels[:, 8:] = (1000, 2001, 65535)
+        path = self.test_dir / "deep.png"
+        write_png16(path, pixels)
+        original = path.read_bytes()
+
+        self.assertFalse(quantize_to_palette(str(path)))
+        self.assertEqual(path.read_bytes(), original)
+
+
+@unittest.skipUnless(TEXTURE_DEPS_AVAILABLE, "Pillow/numpy/pygltflib not installed")
+class TestPngReencoder(unittest.TestCase):
+    """Test cases for the lossless PNG re-encoder"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def save_uncompressed(self, img, name):
+        """Save a PNG with zlib level 0 so there is always room to shrink"""
+        path = self.test_dir / name
+        img.save(path, compress_level=0)
+        return path
+
+    def assert_reencoded_losslessly(self, path, effort):
+        with Image.open(path) as img:
+            expected = np.asarray(img.convert('RGBA'))
+        original_size = path.stat().st_size
+
+        saved = optimize_png(str(path), effort=effort)
+
+        self.assertGreater(saved, 0)
+        self.assertEqual(path.stat().st_size, original_size - saved)
+        with Image.open(path) as img:
+            np.testing.assert_array_equal(np.asarray(img.convert('RGBA')), expected)
+
+    def test_rgba_gradient_all_effort_levels(self):
+        """Every effort level produces a smaller, pixel-identical file"""
+        x = np.linspace(0, 255, 96, dtype=np.uint8)
+        pixels = np.zeros((80, 96, 4), dtype=np.uint8)
+        pixels[:, :, 0] = x
+        pixels[:, :, 1] = x[::-1]
+        pixels[:, :, 2] = 40
+        pixels[:, :, 3] = 200
+        for effort in (1, 2, 3):
+            with self.subTest(effort=effort):
+                path = self.save_uncompressed(Image.fromarray(pixels), f"gradient_{effort}.png")
+                self.assert_reencoded_losslessly(path, effort)
+
+    def test_palette_with_transparency(self):
+        """Indexed PNGs keep their palette and tRNS alpha"""
+        indices = (np.arange(64 * 64, dtype=np.uint8) % 8).reshape(64, 64)
+        img = Image.frombytes('P', (64, 64), indices.tobytes())
+        img.putpalette(bytes(range(24)))
+        img.info['transparency'] = bytes([0, 64, 128, 255, 255, 255, 255, 255])
+        path = self.save_uncompressed(img, "indexed.png")
+        self.assert_reencoded_losslessly(path, 3)
+
+    def test_16_bit_png_untouched(self):
+        """16-bit PNGs are never re-encoded at 8 bits"""
+        pixels = np.zeros((32, 32, 3), dtype=np.uint16)
+        pixels[:, :, 0] = np.arange(32) * 2000 + 1
+        path = self.test_dir / "deep.png"
+        write_png16(path, pixels)
+        original = path.read_bytes()
+
+        self.assertEqual(optimize_png(str(path), effort=3), 0)
+        self.assertEqual(path.read_bytes(), original)
+
+    def test_effort_zero_is_noop(self):
+        """Effort 0 disables the stage"""
+        path = self.save_uncompressed(Image.new('RGB', (16, 16), (1, 2, 3)), "flat.png")
+        original = path.read_bytes()
+        self.assertEqual(optimize_png(str(path), effort=0), 0)
+        self.assertEqual(path.read_bytes(), original)
+
+    def test_percent_encoded_uri(self):
+        """The converter finds textures whose URI is percent-encoded"""
+        self.save_uncompressed(Image.new('RGB', (16, 16), (1, 2, 3)), "my tex.png")
+        gltf_path = self.test_dir / "model.gltf"
+        gltf_path.write_text(json.dumps({"asset": {"version": "2.0"}, "images": [{"uri": "my%20tex.png"}]}))
+        converter = VoxBridgeConverter()
+        converter.optimization_settings['texture_effort'] = 1
+
+        self.assertGreater(converter._optimize_png_files(gltf_path), 0)
+
+
+@unittest.skipUnless(TEXTURE_DEPS_AVAILABLE, "Pillow/numpy/pygltflib not installed")
+class TestTextureDeduplication(unittest.TestCase):
+    """Test cases for content-hash texture deduplication"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_duplicates_collapse_to_first_image(self):
+        """Same pixels under different names and encodings share one image"""
+        Image.new('RGBA', (8, 8), (255, 0, 0, 255)).save(self.test_dir / "palette.png")
+        Image.new('RGB', (8, 8), (255, 0, 0)).save(self.test_dir / "palette_copy.png", compress_level=0)
+        Image.new('RGBA', (8, 8), (0, 0, 255, 255)).save(self.test_dir / "other.png")
+        gltf_data = {
+            "images": [{"uri": "palette.png"}, {"uri": "other.png"}, {"uri": "palette_copy.png"}],
+            "textures": [{"source": 2}, {"source": 1}, {"source": 0}],
+        }
+
+        dropped = deduplicate_textures(gltf_data, self.test_dir)
+
+        self.assertEqual(dropped, ["palette_copy.png"])
+        self.assertEqual(gltf_data["images"], [{"uri": "palette.png"}, {"uri": "other.png"}])
+        self.assertEqual([t["source"] for t in gltf_data["textures"]], [0, 1, 0])
+
+    def test_extension_sources_remapped(self):
+        """Image sources of texture extensions follow the compacted image indices"""
+        Image.new('RGBA', (8, 8), (255, 0, 0, 255)).save(self.test_dir / "a.png")
+        Image.new('RGBA', (8, 8), (255, 0, 0, 255)).save(self.test_dir / "b.png")
+        gltf_data = {
+            "images": [{"uri": "a.png"}, {"uri": "b.png"}, {"uri": "c.ktx2", "mimeType": "image/ktx2"}],
+            "textures": [{"source": 1, "extensions": {"KHR_texture_basisu": {"source": 2}}},
+                         {"extensions": {"EXT_texture_webp": {"source": 1}}}],
+        }
+
+        self.assertEqual(deduplicate_textures(gltf_data, self.test_dir), ["b.png"])
+        self.assertEqual(gltf_data["textures"], [
+            {"source": 0, "extensions": {"KHR_texture_basisu": {"source": 1}}},
+            {"extensions": {"EXT_texture_webp": {"source": 0}}}])
+
+    def test_unique_images_unchanged(self):
+        """Nothing changes when every image is distinct"""
+        Image.new('RGBA', (4, 4), (1, 1, 1, 255)).save(self.test_dir / "a.png")
+        Image.new('RGBA', (4, 4), (2, 2, 2, 255)).save(self.test_dir / "b.png")
+        gltf_data = {
+            "images": [{"uri": "a.png"}, {"uri": "b.png"}, {"bufferView": 3, "mimeType": "image/png"}],
+            "textures": [{"source": 0}, {"source": 1}, {"source": 2}],
+        }
+
+        self.assertEqual(deduplicate_textures(gltf_data, self.test_dir), [])
+        self.assertEqual(len(gltf_data["images"]), 3)
+        self.assertEqual([t["source"] for t in gltf_data["textures"]], [0, 1, 2])
+
+
+@unittest.skipUnless(TEXTURE_DEPS_AVAILABLE, "Pillow/numpy/pygltflib not installed")
+class TestSharedAtlas(unittest.TestCase):
+    """Test cases for the batch-wide shared atlas"""
+
+    def make_document(self, uvs):
+        """Build a glTF document with one textured primitive per UV set"""
+        data = bytearray()
+        gltf_data = {"accessors": [], "bufferViews": [], "meshes": [{"primitives": []}],
+                     "materials": [], "textures": [], "images": [],
+                     "buffers": [{"uri": "mesh.bin"}]}
+        for i, uv in enumerate(uvs):
+            raw = np.asarray(uv, dtype='<f4').tobytes()
+            gltf_data["bufferViews"].append({"buffer": 0, "byteOffset": len(data), "byteLength": len(raw)})
+            gltf_data["accessors"].append({"bufferView": i, "componentType": 5126,
+                                           "count": len(uv), "type": "VEC2"})
+            gltf_data["meshes"][0]["primitives"].append({"attributes": {"TEXCOORD_0": i}, "material": i})
+            gltf_data["materials"].append({"pbrMetallicRoughness": {"baseColorTexture": {"index": i}}})
+            gltf_data["textures"].append({"source": i})
+            gltf_data["images"].append({"uri": f"tex_{i}.png"})
+            data.extend(raw)
+        gltf_data["buffers"][0]["byteLength"] = len(data)
+        return gltf_data, [data]
+
+    def test_identical_images_share_a_tile(self):
+        """Duplicate textures across assets are packed once, at native size"""
+        red = Image.new('RGBA', (8, 8), (255, 0, 0, 255))
+        green = Image.new('RGB', (16, 4), (0, 255, 0))
+
+        atlas, rects = build_shared_atlas([red, green, red.copy()], padding=2)
+
+        self.assertEqual(len(rects), 2)
+        self.assertEqual(atlas.size[0], atlas.size[1])
+        pixels = np.asarray(atlas)
+        for rect, color in zip(sorted(rects.values()), ((255, 0, 0, 255), (0, 255, 0, 255))):
+            u0, v0, u1, v1 = (round(c * atlas.size[0]) for c in rect)
+            tile = pixels[v0:v1, u0:u1]
+            self.assertTrue((tile == color).all())
+
+    def test_too_large_for_max_size(self):
+        """Atlases that would exceed the platform limit are refused"""
+        with self.assertRaises(ValueError):
+            build_shared_atlas([Image.new('RGBA', (64, 64))], max_size=32)
+
+    def test_uvs_remapped_into_tiles(self):
+        """UVs move into each image's tile and images collapse to the atlas"""
+        gltf_data, buffers = self.make_document([[[0, 0], [1, 1]], [[0.5, 0.5], [1, 0]]])
+        rects = {0: [0.0, 0.0, 0.5, 0.5], 1: [0.5, 0.5, 1.0, 1.0]}
+
+        remapped, touched = remap_gltf_to_atlas(gltf_data, buffers, rects, "atlas.png")
+
+        self.assertEqual(remapped, [0, 1])
+        self.assertEqual(touched, {0})
+        self.assertEqual(gltf_data["images"], [{"uri": "atlas.png", "mimeType": "image/png"}])
+        self.assertEqual([t["source"] for t in gltf_data["textures"]], [0, 0])
+        uvs = np.frombuffer(bytes(buffers[0]), dtype='<f4').reshape(-1, 2)
+        np.testing.assert_allclose(uvs, [[0, 0], [0.5, 0.5], [0.75, 0.75], [1.0, 0.5]])
+
+    def test_wrapping_uvs_keep_image_standalone(self):
+        """UVs outside [0, 1] rely on REPEAT and cannot move into a tile"""
+        gltf_data, buffers = self.make_document([[[0, 0], [2, 1]], [[0, 0], [1, 1]]])
+        original = bytes(buffers[0])
+
+        remapped, _ = remap_gltf_to_atlas(gltf_data, buffers, {0: [0, 0, 0.5, 0.5], 1: [0.5, 0, 1, 0.5]},
+                                          "atlas.png")
+
+        self.assertEqual(remapped, [1])
+        self.assertEqual(gltf_data["images"][0], {"uri": "tex_0.png"})
+        self.assertEqual(bytes(buffers[0][:16]), original[:16])
+
+
+if __name__ == '__main__':
+    unittest.main()
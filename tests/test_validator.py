@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VoxBridge in-process glTF validator
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+
+import numpy as np
+
+# Import the validator module
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voxbridge.validator import validate_document, validate_file, ERROR
+
+
+def triangle_document():
+    """A valid single-triangle document and its buffer"""
+    positions = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype='<f4').tobytes()
+    indices = np.array([0, 1, 2], dtype='<u2').tobytes() + b'\x00\x00'
+    data = bytearray(positions + indices)
+    gltf_data = {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0}],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}],
+        "accessors": [
+            {"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3",
+             "min": [0, 0, 0], "max": [1, 1, 0]},
+            {"bufferView": 1, "componentType": 5123, "count": 3, "type": "SCALAR"},
+        ],
+        "bufferViews": [
+            {"buffer": 0, "byteLength": 36},
+            {"buffer": 0, "byteOffset": 36, "byteLength": 8},
+        ],
+        "buffers": [{"uri": "triangle.bin", "byteLength": len(data)}],
+    }
+    return gltf_data, data
+
+
+class TestValidator(unittest.TestCase):
+    """Test cases for structural and buffer validation"""
+
+    def codes(self, gltf_data, data):
+        report = validate_document(gltf_data, [data])
+        return {issue.code for issue in report.issues}
+
+    def test_valid_document(self):
+        """A well-formed triangle produces no issues"""
+        gltf_data, data = triangle_document()
+        report = validate_document(gltf_data, [data])
+        self.assertTrue(report.is_valid)
+        self.assertEqual(report.issues, [])
+        self.assertEqual(report.to_dict()['errors'], 0)
+
+    def test_structure_and_references(self):
+        """Missing asset version, required properties and dangling indices are errors"""
+        gltf_data, data = triangle_document()
+        del gltf_data['asset']['version']
+        gltf_data['nodes'].append({"children": [7]})
+        gltf_data['meshes'][0]['primitives'][0]['material'] = 0
+        del gltf_data['accessors'][1]['count']
+
+        report = validate_document(gltf_data, [data])
+
+        self.assertFalse(report.is_valid)
+        pointers = {issue.pointer for issue in report.errors}
+        self.assertIn('/asset', pointers)
+        self.assertIn('/nodes/1/children/0', pointers)
+        self.assertIn('/meshes/0/primitives/0/material', pointers)
+        self.assertIn('/accessors/1', pointers)
+
+    def test_accessor_range_and_alignment(self):
+        """Accessors must be aligned and fit inside their bufferView"""
+        gltf_data, data = triangle_document()
+        gltf_data['accessors'][1]['byteOffset'] = 1
+        gltf_data['accessors'][0]['count'] = 4
+        self.assertTrue({'ACCESSOR_OFFSET_ALIGNMENT', 'ACCESSOR_TOO_LONG'} <= self.codes(gltf_data, data))
+
+        gltf_data, data = triangle_document()
+        gltf_data['bufferViews'][1]['byteLength'] = 64
+        gltf_data['bufferViews'][0]['byteStride'] = 6
+        self.assertTrue({'BUFFER_VIEW_TOO_LONG', 'BUFFER_VIEW_INVALID_BYTE_STRIDE'} <= self.codes(gltf_data, data))
+
+    def test_buffer_contents(self):
+        """Out-of-range indices, wrong POSITION bounds and NaNs are found in the data"""
+        gltf_data, data = triangle_document()
+        data[36:38] = (9).to_bytes(2, 'little')
+        gltf_data['accessors'][0]['max'] = [2, 1, 0]
+        codes = self.codes(gltf_data, data)
+        self.assertIn('ACCESSOR_INDEX_OOB', codes)
+        self.assertIn('ACCESSOR_MAX_MISMATCH', codes)
+
+        gltf_data, data = triangle_document()
+        data[0:4] = np.array([np.nan], dtype='<f4').tobytes()
+        self.assertIn('ACCESSOR_INVALID_FLOAT', self.codes(gltf_data, data))
+
+    def test_malformed_collection(self):
+        """A collection that is not an array of objects is reported, not raised"""
+        report = validate_document({"asset": {"version": "2.0"}, "materials": [1]})
+        self.assertEqual([issue.code for issue in report.issues], ['TYPE_MISMATCH'])
+        self.assertEqual(report.issues[0].severity, ERROR)
+
+
+class TestValidateFile(unittest.TestCase):
+    """Test cases for validating files on disk"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_uri_resolution(self):
+        """Buffers are loaded from disk and missing images are reported"""
+        gltf_data, data = triangle_document()
+        gltf_data['images'] = [{"uri": "missing.png"}]
+        (self.test_dir / "triangle.bin").write_bytes(data)
+        gltf_path = self.test_dir / "triangle.gltf"
+        gltf_path.write_text(json.dumps(gltf_data))
+
+        report = validate_file(gltf_path)
+
+        self.assertEqual([(issue.code, issue.pointer) for issue in report.issues],
+                         [('IO_ERROR', '/images/0/uri')])
+
+    def test_unreadable_file(self):
+        """Invalid JSON gives a single error instead of an exception"""
+        gltf_path = self.test_dir / "broken.gltf"
+        gltf_path.write_text("{not json")
+        report = validate_file(gltf_path)
+        self.assertFalse(report.is_valid)
+        self.assertEqual(len(report.issues), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
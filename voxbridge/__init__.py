@@ -31,6 +31,25 @@ __author__ = "Abdulkareem Oyeneye/Dapps over Apps."
 __email__ = "team@dappsoverapps.com"
 __license__ = "MIT"
 
-from .converter import VoxBridgeConverter
+# Public names resolved on first use, so `import voxbridge` (and the CLI's
+# --help) does not load NumPy, Pillow, pygltflib and jsonschema up front
+_LAZY_ATTRIBUTES = {
+    "VoxBridgeConverter": ".converter",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = ["VoxBridgeConverter", "__version__"] 
\ No newline at end of file
@@ -0,0 +1,275 @@
+"""
+VoxBridge Accessor Engine
+NumPy-backed accessor layout checks, zero-copy decoding and bounds repair
+"""
+
+import math
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# componentType -> numpy dtype
+COMPONENT_DTYPES = {
+    5120: np.dtype('<i1'),
+    5121: np.dtype('<u1'),
+    5122: np.dtype('<i2'),
+    5123: np.dtype('<u2'),
+    5125: np.dtype('<u4'),
+    5126: np.dtype('<f4'),
+}
+TYPE_COMPONENTS = {'SCALAR': 1, 'VEC2': 2, 'VEC3': 3, 'VEC4': 4, 'MAT2': 4, 'MAT3': 9, 'MAT4': 16}
+INDEX_COMPONENT_TYPES = {5121, 5123, 5125}
+
+
+def _is_index(value, length: int) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and 0 <= value < length
+
+
+def element_size(component_size: int, type_name: str) -> int:
+    """Byte size of one accessor element, including matrix column padding"""
+    components = TYPE_COMPONENTS[type_name]
+    if type_name.startswith('MAT') and component_size < 4:
+        rows = int(math.isqrt(components))
+        column = component_size * rows
+        return ((column + 3) // 4 * 4) * rows
+    return component_size * components
+
+
+def is_decodable(accessor) -> bool:
+    """True for accessors with a known componentType/type, a positive count and a bufferView"""
+    return (isinstance(accessor, dict)
+            and accessor.get('componentType') in COMPONENT_DTYPES
+            and accessor.get('type') in TYPE_COMPONENTS
+            and isinstance(accessor.get('count'), int) and accessor['count'] >= 1
+            and isinstance(accessor.get('bufferView'), int))
+
+
+class AccessorLayout(NamedTuple):
+    """Byte layout of a set of accessors as parallel int64 arrays"""
+    indices: List[int]
+    component_sizes: np.ndarray
+    element_sizes: np.ndarray
+    counts: np.ndarray
+    offsets: np.ndarray           # accessor byteOffset within its bufferView
+    view_offsets: np.ndarray
+    view_lengths: np.ndarray
+    declared_strides: np.ndarray  # 0 when the bufferView is tightly packed
+    strides: np.ndarray
+
+    @property
+    def capacity(self) -> np.ndarray:
+        """Number of whole elements that fit in the bufferView after byteOffset"""
+        room = self.view_lengths - self.offsets - self.element_sizes
+        return np.where(room >= 0, room // self.strides + 1, 0)
+
+    @property
+    def misaligned(self) -> np.ndarray:
+        return self.offsets % self.component_sizes != 0
+
+    @property
+    def total_misaligned(self) -> np.ndarray:
+        return (self.offsets + self.view_offsets) % self.component_sizes != 0
+
+    @property
+    def stride_too_small(self) -> np.ndarray:
+        return (self.declared_strides > 0) & (self.declared_strides < self.element_sizes)
+
+    @property
+    def too_long(self) -> np.ndarray:
+        return self.counts > self.capacity
+
+
+def accessor_layout(gltf_data: Dict, indices: Optional[Sequence[int]] = None) -> AccessorLayout:
+    """
+    Layout of the given accessors (default: every decodable accessor whose
+    bufferView exists), gathered once so the range checks run vectorized.
+    """
+    accessors = gltf_data.get('accessors', []) or []
+    views = gltf_data.get('bufferViews', []) or []
+    if indices is None:
+        indices = [i for i, accessor in enumerate(accessors)
+                   if is_decodable(accessor) and _is_index(accessor['bufferView'], len(views))]
+    indices = list(indices)
+    selected = [accessors[i] for i in indices]
+    selected_views = [views[accessor['bufferView']] for accessor in selected]
+
+    def column(values) -> np.ndarray:
+        return np.fromiter(values, dtype=np.int64, count=len(indices))
+
+    component_sizes = column(COMPONENT_DTYPES[accessor['componentType']].itemsize for accessor in selected)
+    element_sizes = column(element_size(int(size), accessor['type'])
+                           for size, accessor in zip(component_sizes, selected))
+    declared_strides = column(view.get('byteStride', 0) for view in selected_views)
+    return AccessorLayout(
+        indices=indices,
+        component_sizes=component_sizes,
+        element_sizes=element_sizes,
+        counts=column(accessor['count'] for accessor in selected),
+        offsets=column(accessor.get('byteOffset', 0) for accessor in selected),
+        view_offsets=column(view.get('byteOffset', 0) for view in selected_views),
+        view_lengths=column(view.get('byteLength', 0) for view in selected_views),
+        declared_strides=declared_strides,
+        strides=np.where(declared_strides > 0, declared_strides, element_sizes),
+    )
+
+
+def accessor_array(gltf_data: Dict, index: int, buffers: Sequence[Optional[bytes]],
+                   stride: Optional[int] = None) -> Optional[np.ndarray]:
+    """
+    Strided, zero-copy (count, components) view of an accessor's data, or
+    None when its buffer is not loaded or the data does not fit. Matrices
+    with padded columns (byte/short MAT2/MAT3) are not decoded.
+    """
+    accessor = gltf_data['accessors'][index]
+    view = gltf_data['bufferViews'][accessor['bufferView']]
+    buffer_index = view.get('buffer')
+    data = buffers[buffer_index] if _is_index(buffer_index, len(buffers)) else None
+    if data is None:
+        return None
+    dtype = COMPONENT_DTYPES[accessor['componentType']]
+    components = TYPE_COMPONENTS[accessor['type']]
+    if accessor['type'].startswith('MAT') and dtype.itemsize < 4:
+        return None
+    if stride is None:
+        stride = view.get('byteStride') or dtype.itemsize * components
+    count = accessor['count']
+    start = view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+    if start + stride * (count - 1) + dtype.itemsize * components > len(data):
+        return None
+    return np.ndarray((count, components), dtype=dtype, buffer=data, offset=start,
+                      strides=(stride, dtype.itemsize))
+
+
+def _sparse_part(gltf_data: Dict, part: Dict, dtype: np.dtype, length: int,
+                 buffers: Sequence[Optional[bytes]]) -> Optional[np.ndarray]:
+    """length tightly packed values of a sparse indices/values block, or None when they cannot be read"""
+    views = gltf_data.get('bufferViews', []) or []
+    view_index = part.get('bufferView')
+    if not _is_index(view_index, len(views)):
+        return None
+    view = views[view_index]
+    buffer_index = view.get('buffer')
+    data = buffers[buffer_index] if _is_index(buffer_index, len(buffers)) else None
+    if data is None:
+        return None
+    start = view.get('byteOffset', 0) + part.get('byteOffset', 0)
+    end = min(len(data), view.get('byteOffset', 0) + view.get('byteLength', 0))
+    if start + dtype.itemsize * length > end:
+        return None
+    return np.frombuffer(data, dtype=dtype, count=length, offset=start)
+
+
+def sparse_accessor_array(gltf_data: Dict, index: int, array: np.ndarray,
+                          buffers: Sequence[Optional[bytes]]) -> Optional[np.ndarray]:
+    """
+    Copy of an accessor's decoded base data with its sparse substitutions
+    applied, or None when the sparse indices or values cannot be read
+    """
+    accessor = gltf_data['accessors'][index]
+    sparse = accessor['sparse']
+    if not isinstance(sparse, dict) or not isinstance(sparse.get('count'), int) or sparse['count'] < 1:
+        return None
+    indices, values = sparse.get('indices'), sparse.get('values')
+    if not isinstance(indices, dict) or not isinstance(values, dict):
+        return None
+    if indices.get('componentType') not in INDEX_COMPONENT_TYPES:
+        return None
+    count = sparse['count']
+    components = array.shape[1]
+    positions = _sparse_part(gltf_data, indices, COMPONENT_DTYPES[indices['componentType']], count, buffers)
+    substitutes = _sparse_part(gltf_data, values, array.dtype, count * components, buffers)
+    if positions is None or substitutes is None or int(positions.max()) >= len(array):
+        return None
+    result = array.copy()
+    result[positions] = substitutes.reshape(count, components)
+    return result
+
+
+def _bounds(array: np.ndarray) -> Optional[tuple]:
+    """Per-component (min, max) as plain lists, or None for non-finite data"""
+    if array.dtype.kind == 'f':
+        if not np.isfinite(array).all():
+            return None
+        return array.min(axis=0).astype(np.float64).tolist(), array.max(axis=0).astype(np.float64).tolist()
+    return array.min(axis=0).tolist(), array.max(axis=0).tolist()
+
+
+def repair_accessors(gltf_data: Dict, buffers: Sequence[Optional[bytes]]) -> List[str]:
+    """
+    Check and repair every accessor in one pass over the buffer data:
+    counts are clamped to what fits in the bufferView (honouring byteOffset
+    and byteStride), misaligned offsets and too-small strides are reported,
+    min/max of POSITION accessors (and of any accessor that declares
+    bounds) are recomputed from the data with sparse substitutions applied
+    (left alone when those cannot be read), and out-of-range indices are
+    flagged. Returns the list of changes and warnings.
+    """
+    changes = []
+    accessors = gltf_data.get('accessors')
+    if not isinstance(accessors, list) or not accessors:
+        return changes
+
+    layout = accessor_layout(gltf_data)
+    if not layout.indices:
+        return changes
+
+    capacity = layout.capacity
+    for k in np.flatnonzero(layout.too_long):
+        i = layout.indices[k]
+        if capacity[k] > 0:
+            changes.append(f"Fixed accessor {i}: count {layout.counts[k]} -> {capacity[k]} (bufferView holds {capacity[k]} elements)")
+            accessors[i]['count'] = int(capacity[k])
+        else:
+            changes.append(f"Warning: Accessor {i} does not fit in its bufferView")
+    for k in np.flatnonzero(layout.misaligned | layout.total_misaligned):
+        changes.append(f"Warning: Accessor {layout.indices[k]} is not aligned to its component size")
+    for k in np.flatnonzero(layout.stride_too_small):
+        changes.append(f"Warning: Accessor {layout.indices[k]} has a byteStride smaller than its element size")
+
+    # Accessors referenced as POSITION must carry exact bounds
+    positions = set()
+    for mesh in gltf_data.get('meshes', []) or []:
+        for primitive in mesh.get('primitives', []) or []:
+            position = (primitive.get('attributes') or {}).get('POSITION')
+            if _is_index(position, len(accessors)):
+                positions.add(position)
+
+    # Decode each accessor at most once; min/max and index checks share the views
+    decodable = ~(layout.stride_too_small | (capacity == 0))
+    decoded = {}
+    for k in np.flatnonzero(decodable):
+        i = layout.indices[k]
+        array = accessor_array(gltf_data, i, buffers, int(layout.strides[k]))
+        if array is not None and 'sparse' in accessors[i]:
+            array = sparse_accessor_array(gltf_data, i, array, buffers)
+        if array is not None:
+            decoded[i] = array
+
+    for i, array in decoded.items():
+        accessor = accessors[i]
+        if i not in positions and 'min' not in accessor and 'max' not in accessor:
+            continue
+        bounds = _bounds(array)
+        if bounds is None:
+            changes.append(f"Warning: Accessor {i} contains NaN or infinite values")
+            continue
+        if [accessor.get('min'), accessor.get('max')] != list(bounds):
+            accessor['min'], accessor['max'] = bounds
+            changes.append(f"Recomputed min/max of accessor {i}")
+
+    largest_index = {}
+    for m, mesh in enumerate(gltf_data.get('meshes', []) or []):
+        for primitive in mesh.get('primitives', []) or []:
+            indices = primitive.get('indices')
+            position = (primitive.get('attributes') or {}).get('POSITION')
+            if not _is_index(indices, len(accessors)) or indices not in decoded or not _is_index(position, len(accessors)):
+                continue
+            if accessors[indices].get('componentType') not in INDEX_COMPONENT_TYPES:
+                continue
+            if indices not in largest_index:
+                largest_index[indices] = int(decoded[indices].max())
+            vertex_count = accessors[position].get('count', 0)
+            if largest_index[indices] >= vertex_count:
+                changes.append(f"Warning: Mesh {m}: index {largest_index[indices]} in accessor {indices} "
+                               f"is out of range for {vertex_count} vertices")
+    return changes
@@ -0,0 +1,183 @@
+"""
+VoxBridge Backends Module
+The conversion backends (Blender, Assimp, Trimesh, the basic Python converter) with their
+capabilities, cost estimates and timeouts, and subprocess runs bounded by a deadline and cancellable
+"""
+
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# How often a cancellable subprocess run checks whether its race was lost (seconds)
+POLL_INTERVAL = 0.1
+
+
+class BackendCancelled(Exception):
+    """Raised inside a backend whose race another backend already won"""
+    pass
+
+
+class Backend:
+    """
+    One conversion backend.
+
+    convert(converter, input_path, output_path, options, timeout, cancel)
+    returns True on success; available(converter, input_path, options) says
+    whether it can run for this input at all. option names the
+    convert_file option that switches it on (e.g. use_blender). cost is a
+    rough estimate of a typical conversion in seconds and decides which
+    backend races a slow one. timeout bounds an out-of-process backend,
+    including its setup steps (None = no limit); in-process backends
+    cannot be interrupted and declare None.
+    """
+
+    def __init__(self, name: str, label: str, convert: Callable, available: Callable,
+                 cost: float, timeout: Optional[float] = None, in_process: bool = True,
+                 option: Optional[str] = None):
+        self.name = name
+        self.label = label
+        self.convert = convert
+        self.available = available
+        self.cost = cost
+        self.timeout = timeout
+        self.in_process = in_process
+        self.option = option
+
+    def enabled(self, options: Dict) -> bool:
+        return self.option is None or bool(options.get(self.option))
+
+    def __repr__(self):
+        return f"Backend({self.name!r}, cost={self.cost}, timeout={self.timeout}, in_process={self.in_process})"
+
+
+class BackendRegistry:
+    """Backends in order of preference (best output first); the last one is the final fallback"""
+
+    def __init__(self, backends: Optional[List[Backend]] = None):
+        self._backends: Dict[str, Backend] = {}
+        for backend in backends or []:
+            self.register(backend)
+
+    def register(self, backend: Backend, before: Optional[str] = None):
+        """Add or replace a backend, at the end or in front of the backend called before"""
+        self._backends.pop(backend.name, None)
+        if before is None:
+            self._backends[backend.name] = backend
+            return
+        if before not in self._backends:
+            raise KeyError(f"Unknown backend: {before}")
+        ordered = list(self._backends.values())
+        ordered.insert(list(self._backends).index(before), backend)
+        self._backends = {entry.name: entry for entry in ordered}
+
+    def unregister(self, name: str) -> Backend:
+        return self._backends.pop(name)
+
+    def get(self, name: str) -> Backend:
+        return self._backends[name]
+
+    def names(self) -> List[str]:
+        return list(self._backends)
+
+    def __iter__(self) -> Iterator[Backend]:
+        return iter(list(self._backends.values()))
+
+    def __len__(self) -> int:
+        return len(self._backends)
+
+
+def race_pair(backends: List[Backend]) -> Optional[Tuple[Backend, Backend]]:
+    """
+    The preferred out-of-process backend and the cheapest in-process one
+    ranked below it, when the in-process one is expected to finish first
+    """
+    slow = next((backend for backend in backends if not backend.in_process), None)
+    if slow is None:
+        return None
+    following = backends[backends.index(slow) + 1:]
+    fast = min((backend for backend in following if backend.in_process), key=lambda backend: backend.cost, default=None)
+    if fast is None or fast.cost >= slow.cost:
+        return None
+    return slow, fast
+
+
+class Deadline:
+    """Time left of a backend's timeout across the several processes it runs"""
+
+    def __init__(self, timeout: Optional[float]):
+        self.timeout = timeout
+        self.end = None if timeout is None else time.monotonic() + timeout
+
+    def remaining(self, limit: Optional[float] = None) -> Optional[float]:
+        """Seconds left, capped at limit (None = unlimited)"""
+        if self.end is None:
+            return limit
+        left = max(self.end - time.monotonic(), 0.0)
+        return left if limit is None else min(limit, left)
+
+
+def run_process(cmd: List[str], timeout: Optional[float] = None,
+                cancel: Optional[threading.Event] = None) -> subprocess.CompletedProcess:
+    """
+    subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    that also kills the process once cancel is set (raising BackendCancelled)
+    """
+    if cancel is None:
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    if cancel.is_set():
+        raise BackendCancelled(f"{Path(cmd[0]).name} not started: race already won")
+    deadline = Deadline(timeout)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as process:
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=deadline.remaining(POLL_INTERVAL))
+                return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+            except subprocess.TimeoutExpired:
+                # communicate can be retried after a timeout without losing output
+                if cancel.is_set():
+                    process.kill()
+                    process.communicate()
+                    raise BackendCancelled(f"{Path(cmd[0]).name} killed: race already won")
+                if deadline.remaining() == 0.0:
+                    process.kill()
+                    process.communicate()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+
+
+def _convert_with_blender(converter, input_path: Path, output_path: Path, options: Dict,
+                          timeout: Optional[float], cancel: Optional[threading.Event]) -> bool:
+    return converter.convert_with_blender(input_path, output_path, optimize_mesh=options['optimize_mesh'],
+                                          platform=options['platform'], timeout=timeout, cancel=cancel)
+
+
+def _convert_with_assimp(converter, input_path: Path, output_path: Path, options: Dict,
+                         timeout: Optional[float], cancel: Optional[threading.Event]) -> bool:
+    return converter.convert_with_assimp(input_path, output_path, platform=options['platform'])
+
+
+def _convert_with_trimesh(converter, input_path: Path, output_path: Path, options: Dict,
+                          timeout: Optional[float], cancel: Optional[threading.Event]) -> bool:
+    return converter.convert_with_trimesh(input_path, output_path, platform=options['platform'])
+
+
+def _convert_gltf_json(converter, input_path: Path, output_path: Path, options: Dict,
+                       timeout: Optional[float], cancel: Optional[threading.Event]) -> bool:
+    return converter.convert_gltf_json(input_path, output_path, generate_atlas=options['generate_atlas'],
+                                       compress_textures=options['compress_textures'], platform=options['platform'])
+
+
+def default_backends() -> BackendRegistry:
+    """Blender → Assimp → Trimesh → basic converter, each converter gets its own (mutable) copy"""
+    return BackendRegistry([
+        Backend('blender', 'Blender', _convert_with_blender,
+                lambda converter, input_path, options: converter._can_use_blender(input_path),
+                cost=20.0, timeout=120.0, in_process=False, option='use_blender'),
+        Backend('assimp', 'Assimp', _convert_with_assimp,
+                lambda converter, input_path, options: converter._can_use_assimp(), cost=2.0),
+        Backend('trimesh', 'Trimesh', _convert_with_trimesh,
+                lambda converter, input_path, options: converter._can_use_trimesh(), cost=2.0),
+        Backend('python', 'the basic converter', _convert_gltf_json,
+                lambda converter, input_path, options: True, cost=0.5),
+    ])
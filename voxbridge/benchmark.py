@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import hashlib
 
+from .stats import compute_file_stats
+
 class ModelBenchmark:
     """Benchmarks 3D model optimization and conversion performance"""
     
@@ -28,61 +30,33 @@ class ModelBenchmark:
         })
         
     def measure_model_stats(self, gltf_path: Path) -> Dict:
-        """Measure model statistics from GLTF file"""
+        """Measure model statistics from a GLTF or GLB file"""
         try:
-            import json
-            
-            with open(gltf_path, 'r', encoding='utf-8') as f:
-                gltf_data = json.load(f)
-            
-            # Calculate file size
-            file_size = gltf_path.stat().st_size
-            
-            # Count meshes, materials, textures, nodes
-            mesh_count = len(gltf_data.get('meshes', []))
-            material_count = len(gltf_data.get('materials', []))
-            texture_count = len(gltf_data.get('textures', []))
-            node_count = len(gltf_data.get('nodes', []))
-            
-            # Calculate total triangle count
-            total_triangles = 0
-            for mesh in gltf_data.get('meshes', []):
-                for primitive in mesh.get('primitives', []):
-                    if 'indices' in primitive and primitive['indices'] is not None:
-                        # Each triangle has 3 indices
-                        triangle_count = len(primitive['indices']) // 3
-                        total_triangles += triangle_count
-            
-            # Calculate texture memory usage
-            texture_memory = 0
-            for image in gltf_data.get('images', []):
-                if 'uri' in image and image['uri']:
-                    img_path = gltf_path.parent / image['uri']
-                    if img_path.exists():
-                        try:
-                            from PIL import Image
-                            with Image.open(img_path) as img:
-                                # Estimate memory usage (RGBA = 4 bytes per pixel)
-                                texture_memory += img.width * img.height * 4
-                        except:
-                            pass
-            
-            return {
-                'file_size': file_size,
-                'mesh_count': mesh_count,
-                'material_count': material_count,
-                'texture_count': texture_count,
-                'node_count': node_count,
-                'total_triangles': total_triangles,
-                'texture_memory': texture_memory,
-                'timestamp': time.time()
-            }
+            return self.summarize_stats(compute_file_stats(gltf_path))
             
         except Exception as e:
             if self.debug:
                 print(f"Warning: Could not measure model stats: {e}")
             return {}
     
+    def summarize_stats(self, stats: Dict) -> Dict:
+        """Benchmark view of statistics from stats.compute_stats (plus 'file_size')"""
+        return {
+            'file_size': stats.get('file_size', 0),
+            'mesh_count': stats.get('meshes', 0),
+            'material_count': stats.get('materials', 0),
+            'texture_count': stats.get('textures', 0),
+            'node_count': stats.get('nodes', 0),
+            'total_triangles': stats.get('triangles', 0),
+            'total_vertices': stats.get('vertices', 0),
+            'unique_vertices': stats.get('unique_vertices'),
+            'draw_calls': stats.get('draw_calls', 0),
+            # Estimated GPU memory including mip chains
+            'texture_memory': stats.get('texture_memory', 0),
+            'buffer_bytes': stats.get('buffer_bytes', {}),
+            'timestamp': time.time()
+        }
+    
     def run_optimization_benchmark(self, asset_name: str, original_path: Path, 
                                  optimized_path: Path) -> Dict:
         """Run benchmark comparison between original and optimized models"""
@@ -95,7 +69,7 @@ class ModelBenchmark:
             
             # Calculate improvements
             improvements = {}
-            for key in ['file_size', 'total_triangles', 'texture_memory']:
+            for key in ['file_size', 'total_triangles', 'draw_calls', 'texture_memory']:
                 if key in original_stats and key in optimized_stats:
                     if original_stats[key] > 0:
                         improvement_pct = ((original_stats[key] - optimized_stats[key]) / original_stats[key]) * 100
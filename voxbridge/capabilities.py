@@ -0,0 +1,398 @@
+"""
+VoxBridge Capabilities Module
+Backend and tool discovery (Blender, Assimp, Trimesh, Node.js, gltf-validator, gltf-pipeline),
+probed once per process and cached on disk with a TTL and tool-mtime invalidation
+"""
+
+import hashlib
+import importlib.util
+import json
+import math
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+CACHE_VERSION = 1
+
+# Re-probe at least once a day even when nothing observable changed (e.g. a new Blender under /opt)
+DEFAULT_TTL = 24 * 60 * 60
+
+# A "not found" has nothing to fingerprint, so only its age can notice an install outside PATH
+NEGATIVE_TTL = 5 * 60
+
+
+
+def find_blender(debug: bool = False) -> Optional[str]:
+    """Find Blender executable in common locations with platform detection (uncached)"""
+
+    # Check environment variable override first
+    blender_path = os.environ.get('BLENDER_PATH')
+    if blender_path and os.path.exists(blender_path):
+        return blender_path
+
+    # Detect platform
+    system = platform.system()
+    is_wsl = _is_wsl()
+
+    if debug:
+        print(f"Platform detection: {system}, WSL: {is_wsl}")
+
+    # Check if blender is in PATH first
+    if shutil.which("blender"):
+        return "blender"
+
+    # Platform-specific paths
+    if system == "Windows":
+        possible_paths = _get_windows_blender_paths()
+    elif system == "Darwin":  # macOS
+        possible_paths = _get_macos_blender_paths()
+    elif system == "Linux":
+        if is_wsl:
+            possible_paths = _get_wsl_blender_paths(debug)
+        else:
+            possible_paths = _get_linux_blender_paths()
+    else:
+        possible_paths = []
+
+    # Check common installation paths
+    for path in possible_paths:
+        if os.path.exists(path):
+            if debug:
+                print(f"Found Blender at: {path}")
+            return path
+
+    if debug:
+        print("No Blender installation found")
+    return None
+
+
+def _is_wsl() -> bool:
+    """Detect if running under WSL"""
+    try:
+        # Check for WSL-specific environment variables
+        if os.environ.get("WSL_DISTRO_NAME"):
+            return True
+
+        # Check /proc/version for WSL indicators
+        if os.path.exists("/proc/version"):
+            with open("/proc/version", "r") as f:
+                version_info = f.read().lower()
+                if "microsoft" in version_info or "wsl" in version_info:
+                    return True
+
+        return False
+    except:
+        return False
+
+
+def _get_windows_blender_paths() -> List[str]:
+    """Get Windows Blender installation paths"""
+    paths = []
+
+    # Common Windows installation paths
+    program_files = os.environ.get('ProgramFiles', 'C:\\Program Files')
+    program_files_x86 = os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)')
+
+    # Check both Program Files directories
+    for base_path in [program_files, program_files_x86]:
+        if os.path.exists(base_path):
+            # Look for Blender Foundation folder
+            blender_foundation = os.path.join(base_path, "Blender Foundation")
+            if os.path.exists(blender_foundation):
+                # Check for versioned folders
+                for item in os.listdir(blender_foundation):
+                    if item.startswith("Blender "):
+                        blender_exe = os.path.join(blender_foundation, item, "blender.exe")
+                        if os.path.exists(blender_exe):
+                            paths.append(blender_exe)
+
+    # Add specific known paths
+    specific_paths = [
+        r"C:\Program Files\Blender Foundation\Blender 3.6\blender.exe",
+        r"C:\Program Files\Blender Foundation\Blender 4.0\blender.exe",
+        r"C:\Program Files\Blender Foundation\Blender 4.1\blender.exe",
+        r"C:\Program Files\Blender Foundation\Blender 4.2\blender.exe",
+        r"C:\Program Files\Blender Foundation\Blender 4.3\blender.exe",
+    ]
+
+    for path in specific_paths:
+        if os.path.exists(path):
+            paths.append(path)
+
+    return paths
+
+
+def _get_macos_blender_paths() -> List[str]:
+    """Get macOS Blender installation paths"""
+    paths = [
+        "/Applications/Blender.app/Contents/MacOS/Blender",
+        "/Applications/Blender.app/Contents/MacOS/blender",
+        "/opt/homebrew/bin/blender",  # Homebrew installation
+        "/usr/local/bin/blender",     # Local installation
+    ]
+    return paths
+
+
+def _get_linux_blender_paths() -> List[str]:
+    """Get Linux Blender installation paths"""
+    paths = [
+        "/usr/bin/blender",
+        "/usr/local/bin/blender",
+        "/snap/bin/blender",
+        "/var/lib/flatpak/exports/bin/org.blender.Blender",
+        "/opt/blender/blender",  # Manual installation
+    ]
+    return paths
+
+
+def _get_wsl_blender_paths(debug: bool = False) -> List[str]:
+    """Get WSL Blender installation paths (Linux + Windows fallback)"""
+    paths = []
+
+    # First, try Linux-style paths (in case user installed Blender inside WSL)
+    linux_paths = _get_linux_blender_paths()
+    paths.extend(linux_paths)
+
+    # Then, try Windows paths accessible from WSL
+    try:
+        # Check if Windows drives are mounted
+        windows_paths = [
+            "/mnt/c/Program Files/Blender Foundation",
+            "/mnt/c/Program Files (x86)/Blender Foundation",
+        ]
+
+        for base_path in windows_paths:
+            if os.path.exists(base_path):
+                # Look for versioned folders
+                for item in os.listdir(base_path):
+                    if item.startswith("Blender "):
+                        blender_exe = os.path.join(base_path, item, "blender.exe")
+                        if os.path.exists(blender_exe):
+                            paths.append(blender_exe)
+                            if debug:
+                                print(f"Found Windows Blender in WSL: {blender_exe}")
+    except Exception as e:
+        if debug:
+            print(f"Error checking Windows paths in WSL: {e}")
+
+    return paths
+
+
+def _blender_probe() -> Tuple[bool, Optional[str], Optional[str]]:
+    path = find_blender()
+    if path == "blender":
+        path = shutil.which("blender")
+    return path is not None, path, None
+
+
+def _module_origin(module: str) -> Optional[str]:
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec is not None else None
+
+
+def _module_version(module: str) -> Optional[str]:
+    try:
+        from importlib.metadata import version
+        return version(module)
+    except Exception:
+        return None
+
+
+def _assimp_probe() -> Tuple[bool, Optional[str], Optional[str]]:
+    # Importing pyassimp loads the C++ library, which is the slow part this cache avoids
+    origin = _module_origin('pyassimp')
+    if origin is None:
+        return False, None, "pyassimp not installed"
+    try:
+        from pyassimp import helper
+        helper.search_library()
+    except Exception as e:
+        return False, origin, f"Assimp library not found: {e}"
+    return True, origin, _module_version('pyassimp')
+
+
+def _trimesh_probe() -> Tuple[bool, Optional[str], Optional[str]]:
+    origin = _module_origin('trimesh')
+    return origin is not None, origin, _module_version('trimesh') if origin else "trimesh not installed"
+
+
+def _tool_probe(tool: str) -> Callable[[], Tuple[bool, Optional[str], Optional[str]]]:
+    def probe():
+        path = shutil.which(tool)
+        return path is not None, path, None
+    return probe
+
+
+# name -> (probe returning (available, path, detail), what identifies the installation being probed)
+PROBES: Dict[str, Tuple[Callable, Callable[[Optional[str]], list]]] = {}
+
+
+def _stat_fingerprint(path: Optional[str]) -> list:
+    """[path, mtime_ns, size] of a probed file; a reinstall or upgrade changes it"""
+    try:
+        stat = os.stat(path) if path else None
+    except OSError:
+        stat = None
+    return [path, stat.st_mtime_ns if stat else None, stat.st_size if stat else None]
+
+
+def _module_fingerprint(module: str) -> Callable[[Optional[str]], list]:
+    # Looked up again so installing or removing the package invalidates the entry
+    return lambda path: _stat_fingerprint(_module_origin(module))
+
+
+def _tool_fingerprint(tool: str) -> Callable[[Optional[str]], list]:
+    return lambda path: _stat_fingerprint(shutil.which(tool))
+
+
+PROBES.update({
+    'blender': (_blender_probe, _stat_fingerprint),
+    'assimp': (_assimp_probe, _module_fingerprint('pyassimp')),
+    'trimesh': (_trimesh_probe, _module_fingerprint('trimesh')),
+    'node': (_tool_probe('node'), _tool_fingerprint('node')),
+    'gltf-validator': (_tool_probe('gltf-validator'), _tool_fingerprint('gltf-validator')),
+    'gltf-pipeline': (_tool_probe('gltf-pipeline'), _tool_fingerprint('gltf-pipeline')),
+})
+
+
+def default_cache_path() -> Path:
+    """VOXBRIDGE_CACHE_DIR, else the platform user cache directory"""
+    base = os.environ.get('VOXBRIDGE_CACHE_DIR')
+    if not base:
+        if sys.platform == 'win32':
+            base = os.path.join(os.environ.get('LOCALAPPDATA', str(Path.home())), 'voxbridge', 'Cache')
+        else:
+            base = os.path.join(os.environ.get('XDG_CACHE_HOME', str(Path.home() / '.cache')), 'voxbridge')
+    return Path(base) / 'capabilities.json'
+
+
+def _environment_key() -> str:
+    """Settings that change what the probes find: search path, Blender override and interpreter"""
+    key = json.dumps([os.environ.get('PATH', ''), os.environ.get('BLENDER_PATH', ''), sys.executable, sys.version])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+class CapabilityRegistry:
+    """
+    Probes each backend or tool once per process. Results are also kept in
+    a JSON cache (cache_path=None disables it) so later processes skip the
+    probe while the entry is younger than ttl seconds (negative_ttl for a
+    capability that was not found), PATH/BLENDER_PATH and the interpreter
+    are unchanged, and the probed file has the same mtime and size.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None, ttl: float = DEFAULT_TTL, persist: bool = True,
+                 negative_ttl: float = NEGATIVE_TTL):
+        self.cache_path = Path(cache_path) if cache_path else default_cache_path()
+        self.persist = persist
+        self.ttl = ttl
+        self.negative_ttl = min(negative_ttl, ttl)
+        self._entries: Dict[str, Dict] = {}
+        self._disk: Optional[Dict[str, Dict]] = None
+        self._lock = threading.RLock()
+
+    def get(self, name: str) -> Dict:
+        """The capability record: name, available, path, detail, probed_at and source (memory/disk/probe)"""
+        if name not in PROBES:
+            raise KeyError(f"Unknown capability '{name}' (known: {', '.join(PROBES)})")
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                entry = self._from_disk(name) or self._probe(name)
+                self._entries[name] = entry
+            return entry
+
+    def available(self, name: str) -> bool:
+        return self.get(name)['available']
+
+    def path(self, name: str) -> Optional[str]:
+        return self.get(name)['path']
+
+    def all(self) -> Dict[str, Dict]:
+        return {name: self.get(name) for name in PROBES}
+
+    def refresh(self, names: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """Probe again, ignoring both caches"""
+        names = list(names or PROBES)
+        with self._lock:
+            for name in names:
+                self._entries[name] = self._probe(name)
+            return {name: self._entries[name] for name in names}
+
+    def _load_disk(self) -> Dict[str, Dict]:
+        if self._disk is None:
+            self._disk = {}
+            if self.persist:
+                try:
+                    with open(self.cache_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if data.get('version') == CACHE_VERSION and isinstance(data.get('entries'), dict):
+                        self._disk = data['entries']
+                except (OSError, ValueError, AttributeError):
+                    pass
+        return self._disk
+
+    def _from_disk(self, name: str) -> Optional[Dict]:
+        entry = self._load_disk().get(name)
+        if not isinstance(entry, dict):
+            return None
+        fingerprint = PROBES[name][1]
+        ttl = self.ttl if entry.get('available') else self.negative_ttl
+        if (entry.get('environment') != _environment_key()
+                or not (0 <= time.time() - entry.get('probed_at', 0) < ttl)
+                or entry.get('fingerprint') != fingerprint(entry.get('path'))):
+            return None
+        return dict(entry, source='disk')
+
+    def _probe(self, name: str) -> Dict:
+        probe, fingerprint = PROBES[name]
+        available, path, detail = probe()
+        entry = {
+            'name': name,
+            'available': bool(available),
+            'path': path,
+            'detail': detail,
+            # Rounded down: rounding up could date the entry in the future and void it
+            'probed_at': math.floor(time.time() * 1000) / 1000,
+            'environment': _environment_key(),
+            'fingerprint': fingerprint(path),
+        }
+        self._save(name, entry)
+        return dict(entry, source='probe')
+
+    def _save(self, name: str, entry: Dict):
+        """Merge one entry into the disk cache; an unwritable cache only costs a re-probe next time"""
+        entries = self._load_disk()
+        entries[name] = entry
+        if not self.persist:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{self.cache_path.name}.", dir=self.cache_path.parent)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'entries': entries}, f, indent=2, sort_keys=True)
+            os.replace(tmp_name, self.cache_path)
+        except OSError:
+            pass
+
+
+_registry: Optional[CapabilityRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_capabilities() -> CapabilityRegistry:
+    """The process-wide registry shared by the converter, CLI and GUI"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = CapabilityRegistry()
+        return _registry
@@ -3,10 +3,11 @@
 VoxBridge CLI - Command Line Interface for VoxEdit to Unity/Roblox Converter
 """
 
+import json
 import sys
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 import logging
 
 try:
@@ -22,11 +23,20 @@ try:
     from rich.panel import Panel
     from rich.text import Text
     from rich.table import Table
+    from rich.markup import escape
     RICH_AVAILABLE = True
 except ImportError:
     RICH_AVAILABLE = False
 
-from .converter import VoxBridgeConverter
+from .capabilities import get_capabilities
+from .events import EventLog, read_events, summarize_events
+from .metrics import ConversionMetrics
+from .packaging import COMPRESSION_MODES, ZSTD_AVAILABLE
+from .profiling import MemoryProfiler, Profiler
+
+# The converter pulls in NumPy, Pillow, pygltflib and jsonschema; commands import it when they run
+if TYPE_CHECKING:
+    from .converter import VoxBridgeConverter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -81,6 +91,13 @@ def print_step_info(message: str, indent: int = 0):
     indent_str = "   " * indent
     console.print(f"{indent_str}-> {message}", style="dim")
 
+def format_size(num_bytes: int) -> str:
+    """Format a byte count as KB or MB."""
+    size_kb = num_bytes / 1024
+    if size_kb >= 1024:
+        return f"{size_kb/1024:.1f} MB"
+    return f"{size_kb:.0f} KB"
+
 def print_validation_summary(validation_results: dict, verbose: bool = False):
     """Print validation results in a structured format."""
     if not validation_results:
@@ -92,25 +109,47 @@ def print_validation_summary(validation_results: dict, verbose: bool = False):
     error_count = validation_results.get('errors', 0)
     warning_count = validation_results.get('warnings', 0)
     
+    if not validation_results.get('validated', True):
+        print_step_info("Validation not run for this conversion path", 1)
+        return
+    
     if verbose:
         # Show detailed validation in verbose mode
         if 'details' in validation_results:
             for detail in validation_results['details']:
                 if detail.get('type') == 'error':
-                    print_step_info(f"❌ {detail.get('message', 'Unknown error')}", 1)
+                    print_step_info(f"❌ {escape(detail.get('message', 'Unknown error'))}", 1)
                 elif detail.get('type') == 'warning':
-                    print_step_info(f"⚠️  {detail.get('message', 'Unknown warning')}", 1)
+                    print_step_info(f"⚠️  {escape(detail.get('message', 'Unknown warning'))}", 1)
+        if not validation_results.get('details'):
+            print_step_info("All validations passed", 1)
+        if 'time' in validation_results:
+            print_step_info(f"Validated in {validation_results['time']:.3f}s", 1)
     else:
         # Show summary in default mode
         if error_count > 0 or warning_count > 0:
-            print_step_info(f"UV maps: OK", 1)
-            print_step_info(f"Buffers: OK", 1)
-            print_step_info(f"Accessors: {error_count} errors, {warning_count} warnings", 1)
+            print_step_info(f"{error_count} errors, {warning_count} warnings", 1)
             print_step_info("(run with --verbose for details)", 2)
         else:
             print_step_info("All validations passed", 1)
 
-def print_conversion_summary(converter: VoxBridgeConverter, output_path: Path, verbose: bool = False):
+def collect_validation_results(converter: 'VoxBridgeConverter') -> dict:
+    """Turn the validation cached on the last conversion result into the CLI summary shape."""
+    result = converter.last_result
+    report = result.validation if result else None
+    if report is None:
+        return {'validated': False, 'errors': 0, 'warnings': 0, 'details': []}
+    
+    details = [{'type': issue.severity, 'message': str(issue)} for issue in report.errors + report.warnings]
+    return {
+        'validated': True,
+        'errors': len(report.errors),
+        'warnings': len(report.warnings),
+        'details': details,
+        'time': sum(report.timings.values())
+    }
+
+def print_conversion_summary(converter: 'VoxBridgeConverter', output_path: Path, verbose: bool = False):
     """Print the final conversion summary."""
     print_step_header(4, 4, "Summary")
     
@@ -151,8 +190,47 @@ def print_conversion_summary(converter: VoxBridgeConverter, output_path: Path, v
     print_step_info(f"Materials: {materials}", 1)
     print_step_info(f"Textures:  {textures}", 1)
     print_step_info(f"Nodes:     {nodes}", 1)
+    if 'triangles' in stats:
+        print_step_info(f"Triangles: {stats['triangles']:,}", 1)
+        print_step_info(f"Vertices:  {stats.get('vertices', 0):,}", 1)
+        print_step_info(f"Draw calls: {stats.get('draw_calls', 0)}", 1)
+        if stats.get('texture_memory') is not None:
+            print_step_info(f"Texture memory: {format_size(stats['texture_memory'])} (with mips)", 1)
     print_step_info(f"File size: {size_str}", 1)
 
+def print_profile_summary(profiler: Profiler, files: List[Path], limit: int = 12):
+    """Print the slowest spans and where the profile files were written."""
+    table = Table(title="Profile (slowest spans)")
+    table.add_column("Span")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Self", justify="right")
+    for entry in profiler.summary()[:limit]:
+        indent = "  " * (len(entry['path']) - 1)
+        table.add_row(f"{indent}{entry['path'][-1]}", str(entry['calls']),
+                      f"{entry['total'] * 1000:.1f} ms", f"{entry['self'] * 1000:.1f} ms")
+    console.print(table)
+    for path in files:
+        print_step_info(f"Profile written: {path}", 1)
+
+def print_memory_summary(memory_profile: dict, report_path: Path, sites: int = 3):
+    """Print peak and retained traced memory per stage with the largest allocation sites."""
+    table = Table(title=f"Memory (peak {format_size(memory_profile['peak_bytes'])} in {memory_profile['peak_stage']})")
+    table.add_column("Stage")
+    table.add_column("Peak", justify="right")
+    table.add_column("Retained", justify="right")
+    table.add_column("Top allocation sites")
+    for entry in memory_profile['stages']:
+        retained = entry['retained_bytes']
+        table.add_row(
+            entry['stage'],
+            format_size(entry['peak_bytes']),
+            f"-{format_size(-retained)}" if retained < 0 else format_size(retained),
+            "\n".join(f"{site['site']} ({format_size(site['size_bytes'])})" for site in entry['top_allocations'][:sites]),
+        )
+    console.print(table)
+    print_step_info(f"Performance report written: {report_path}", 1)
+
 def print_final_status(success: bool, validation_results: dict = None):
     """Print the final status with box-drawing borders."""
     if success:
@@ -184,7 +262,20 @@ def handle_conversion(
     generate_atlas: bool = False,
     no_blender: bool = False,
     verbose: bool = False,
-    debug: bool = False
+    debug: bool = False,
+    texture_effort: int = 0,
+    shared_atlas: Optional[dict] = None,
+    zip_compression: str = 'deflate',
+    zip_level: Optional[int] = None,
+    deterministic: bool = False,
+    external_validation: bool = False,
+    race: bool = False,
+    blender_timeout: Optional[float] = None,
+    profile: bool = False,
+    cprofile: bool = False,
+    memprofile: bool = False,
+    report_name: str = "performance_report.json",
+    events: Optional[EventLog] = None
 ) -> bool:
     """Handle the conversion process with clean output and proper logging."""
     # Set logging level based on flags
@@ -199,18 +290,12 @@ def handle_conversion(
         # Step 1: Environment Setup
         print_step_header(1, 4, "Environment Setup")
         
-        # Check Blender availability
-        blender_path = None
-        try:
-            import subprocess
-            result = subprocess.run(['which', 'blender'], capture_output=True, text=True)
-            if result.returncode == 0:
-                blender_path = result.stdout.strip()
-                print_step_info(f"Blender: detected at {blender_path}", 1)
-            else:
-                print_step_info("Blender: not found", 1)
-        except:
-            print_step_info("Blender: detection failed", 1)
+        # Check Blender availability (probed once per process and cached on disk)
+        blender_path = get_capabilities().path('blender')
+        if blender_path:
+            print_step_info(f"Blender: detected at {blender_path}", 1)
+        else:
+            print_step_info("Blender: not found", 1)
         
         if blender_path and not no_blender:
             print_step_info("Cleanup script: voxbridge/blender_cleanup.py", 1)
@@ -223,24 +308,57 @@ def handle_conversion(
         print_step_header(2, 4, "File Processing")
         
         # Initialize converter
+        from .converter import VoxBridgeConverter
         converter = VoxBridgeConverter(debug=debug)
+        converter.optimization_settings['texture_effort'] = texture_effort
+        converter.shared_atlas = shared_atlas
+        converter.optimization_settings['zip_compression'] = zip_compression
+        converter.optimization_settings['zip_level'] = zip_level
+        converter.optimization_settings['deterministic'] = deterministic
+        converter.optimization_settings['external_validation'] = external_validation
+        converter.optimization_settings['race_backends'] = race
+        if blender_timeout is not None:
+            converter.backends.get('blender').timeout = blender_timeout
+        if profile:
+            converter.profiler = Profiler(enabled=True, cprofile=cprofile)
+            converter.profiler.start()
+        if memprofile:
+            converter.memory_profiler = MemoryProfiler(enabled=True)
+            converter.detailed_stats = True
+        if events is not None:
+            converter.events = events
         
-        # Show progress bar for file processing
-        if RICH_AVAILABLE and not verbose:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TimeElapsedColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task("Processing GLB file...", total=100)
-                
-                # Simulate progress updates
-                progress.update(task, advance=25)
-                time.sleep(0.1)
-                
-                # Process the file
+        # Stopped even when convert_file raises, so cProfile is never left running
+        profile_files = []
+        try:
+            # Show progress bar for file processing
+            if RICH_AVAILABLE and not verbose:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TimeElapsedColumn(),
+                    console=console
+                ) as progress:
+                    task = progress.add_task("Processing GLB file...", total=100)
+                    
+                    # Simulate progress updates
+                    progress.update(task, advance=25)
+                    time.sleep(0.1)
+                    
+                    # Process the file
+                    result = converter.convert_file(
+                        input_path,
+                        output_path,
+                        use_blender=not no_blender,
+                        optimize_mesh=optimize_mesh,
+                        generate_atlas=generate_atlas,
+                        platform=target
+                    )
+                    
+                    progress.update(task, completed=100, description="[bold green]Completed!")
+            else:
+                # No progress bar in verbose mode
                 result = converter.convert_file(
                     input_path,
                     output_path,
@@ -249,18 +367,10 @@ def handle_conversion(
                     generate_atlas=generate_atlas,
                     platform=target
                 )
-                
-                progress.update(task, completed=100, description="[bold green]Completed!")
-        else:
-            # No progress bar in verbose mode
-            result = converter.convert_file(
-                input_path,
-                output_path,
-                use_blender=not no_blender,
-                optimize_mesh=optimize_mesh,
-                generate_atlas=generate_atlas,
-                platform=target
-            )
+        finally:
+            if converter.profiler.enabled:
+                converter.profiler.stop()
+                profile_files = converter.profiler.write(output_path.parent, output_path.stem)
         
         if not result:
             print_step_info("Conversion failed", 1)
@@ -293,17 +403,25 @@ def handle_conversion(
         else:
             print_step_info(f"GLTF written: {final_output_path.name}", 1)
         
-        # Step 3: Validation (placeholder for now)
-        validation_results = {
-            'errors': 0,
-            'warnings': 0,
-            'details': []
-        }
+        # Step 3: Validation (already run once during the conversion)
+        validation_results = collect_validation_results(converter)
         print_validation_summary(validation_results, verbose)
         
         # Step 4: Summary
         print_conversion_summary(converter, final_output_path, verbose)
         
+        if converter.profiler.enabled:
+            print_profile_summary(converter.profiler, profile_files)
+        
+        if memprofile:
+            report = converter.generate_performance_report(
+                input_path, final_output_path, converter.get_last_conversion_stats(), converter.last_changes)
+            report['processing_time'] = converter.last_result.timings['conversion'] if converter.last_result else None
+            report['platform'] = target
+            report_path = converter.save_performance_report(report, output_path.parent, report_name)
+            if report.get('memory_profile'):
+                print_memory_summary(report['memory_profile'], report_path)
+        
         # Final status
         print_final_status(True, validation_results)
         
@@ -313,9 +431,24 @@ def handle_conversion(
         if debug:
             logger.exception("Conversion failed with exception:")
         else:
-            console.print(f"\n[bold red]Error: {str(e)}")
+            console.print(f"\n[bold red]Error: {escape(str(e))}")
         return False
 
+def check_zip_options(zip_compression: str, zip_level: Optional[int]):
+    """Reject ZIP compression settings the packager cannot honour before any work starts"""
+    if zip_compression not in COMPRESSION_MODES:
+        console.print(f"[bold red]Error: Unknown ZIP compression '{zip_compression}' (use {', '.join(COMPRESSION_MODES)})")
+        raise typer.Exit(1)
+    if zip_compression == 'zstd' and not ZSTD_AVAILABLE:
+        console.print("[bold red]Error: --zip-compression zstd requires the 'zstandard' package (pip install \"voxbridge\\[zstd]\")")
+        raise typer.Exit(1)
+    if zip_compression == 'deflate' and zip_level is not None and zip_level > 9:
+        console.print("[bold red]Error: deflate --zip-level must be between 0 and 9")
+        raise typer.Exit(1)
+    if zip_compression == 'zstd' and zip_level == 0:
+        console.print("[bold red]Error: zstd --zip-level must be between 1 and 22")
+        raise typer.Exit(1)
+
 @app.command()
 def convert(
     input_file: Path = typer.Option(..., "--input", "-i", help="Input GLB file path"),
@@ -324,6 +457,18 @@ def convert(
     optimize_mesh: bool = typer.Option(False, "--optimize-mesh", help="Enable mesh optimization"),
     generate_atlas: bool = typer.Option(False, "--generate-atlas", help="Generate texture atlas for optimization"),
     no_blender: bool = typer.Option(False, "--no-blender", help="Skip Blender processing"),
+    texture_effort: int = typer.Option(0, "--texture-effort", min=0, max=3, help="Lossless PNG re-encoding effort (0 = off, 3 = smallest)"),
+    zip_compression: str = typer.Option("deflate", "--zip-compression", help="ZIP member compression (deflate/zstd/store)"),
+    zip_level: Optional[int] = typer.Option(None, "--zip-level", min=0, max=22, help="ZIP compression level (deflate 0-9, zstd 1-22)"),
+    deterministic: bool = typer.Option(False, "--deterministic", help="Reproducible output: sorted JSON keys and ZIP members, fixed timestamps (SOURCE_DATE_EPOCH)"),
+    external_validation: bool = typer.Option(False, "--external-validation", help="Also cross-check output with gltf-validator / Node.js when installed"),
+    race: bool = typer.Option(False, "--race", help="Run the basic converter alongside Blender and keep whichever valid result comes first"),
+    blender_timeout: Optional[float] = typer.Option(None, "--blender-timeout", min=1, help="Seconds Blender may take in total before the next backend is tried (default 120)"),
+    profile: bool = typer.Option(False, "--profile", help="Write span timings (<name>.profile.json) and collapsed stacks for flamegraphs (<name>.folded) next to the output"),
+    cprofile: bool = typer.Option(False, "--cprofile", help="With --profile, also write a cProfile <name>.pstats file"),
+    memprofile: bool = typer.Option(False, "--memprofile", help="Trace memory per stage with tracemalloc and write it into the performance report"),
+    events: Optional[str] = typer.Option(None, "--events", help="Append JSONL job events to this file ('-' for stderr); summarize with 'voxbridge stats'"),
+    metrics_file: Optional[Path] = typer.Option(None, "--metrics-file", help="Write Prometheus metrics to this file (node_exporter textfile collector, *.prom)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
     debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug output")
 ):
@@ -348,6 +493,8 @@ def convert(
             # Convert .glb to .gltf since we don't generate GLB files
             output = output.with_suffix('.gltf')
     
+    check_zip_options(zip_compression, zip_level)
+    
     # Check if input file exists
     if not input_file.exists():
         console.print(f"[bold red]Error: Input file '{input_file}' does not exist")
@@ -374,16 +521,37 @@ def convert(
     print_file_config(input_file, output, target, optimize_mesh)
     
     # Handle conversion
-    success = handle_conversion(
-        input_path=input_file,
-        output_path=output,
-        target=target,
-        optimize_mesh=optimize_mesh,
-        generate_atlas=generate_atlas,
-        no_blender=no_blender,
-        verbose=verbose,
-        debug=debug
-    )
+    event_log = EventLog(events)
+    metrics = None
+    if metrics_file:
+        metrics = ConversionMetrics()
+        metrics.attach(event_log)
+    try:
+        success = handle_conversion(
+            input_path=input_file,
+            output_path=output,
+            target=target,
+            optimize_mesh=optimize_mesh,
+            generate_atlas=generate_atlas,
+            no_blender=no_blender,
+            verbose=verbose,
+            debug=debug,
+            texture_effort=texture_effort,
+            zip_compression=zip_compression,
+            zip_level=zip_level,
+            deterministic=deterministic,
+            external_validation=external_validation,
+            race=race,
+            blender_timeout=blender_timeout,
+            profile=profile,
+            cprofile=cprofile,
+            memprofile=memprofile,
+            events=event_log
+        )
+    finally:
+        event_log.close()
+        if metrics is not None:
+            metrics.registry.write_textfile(metrics_file)
     
     if not success:
         raise typer.Exit(1)
@@ -395,10 +563,26 @@ def batch(
     target: str = typer.Option("unity", "--target", "-t", help="Target platform (unity/roblox)"),
     optimize_mesh: bool = typer.Option(False, "--optimize-mesh", help="Enable mesh optimization"),
     no_blender: bool = typer.Option(False, "--no-blender", help="Skip Blender processing"),
+    texture_effort: int = typer.Option(0, "--texture-effort", min=0, max=3, help="Lossless PNG re-encoding effort (0 = off, 3 = smallest)"),
+    zip_compression: str = typer.Option("deflate", "--zip-compression", help="ZIP member compression (deflate/zstd/store)"),
+    zip_level: Optional[int] = typer.Option(None, "--zip-level", min=0, max=22, help="ZIP compression level (deflate 0-9, zstd 1-22)"),
+    deterministic: bool = typer.Option(False, "--deterministic", help="Reproducible output: sorted JSON keys and ZIP members, fixed timestamps (SOURCE_DATE_EPOCH)"),
+    external_validation: bool = typer.Option(False, "--external-validation", help="Also cross-check output with gltf-validator / Node.js when installed"),
+    race: bool = typer.Option(False, "--race", help="Run the basic converter alongside Blender and keep whichever valid result comes first"),
+    blender_timeout: Optional[float] = typer.Option(None, "--blender-timeout", min=1, help="Seconds Blender may take in total before the next backend is tried (default 120)"),
+    profile: bool = typer.Option(False, "--profile", help="Write span timings (<name>.profile.json) and collapsed stacks for flamegraphs (<name>.folded) next to the output"),
+    cprofile: bool = typer.Option(False, "--cprofile", help="With --profile, also write a cProfile <name>.pstats file"),
+    memprofile: bool = typer.Option(False, "--memprofile", help="Trace memory per stage with tracemalloc and write it into the performance report"),
+    events: Optional[str] = typer.Option(None, "--events", help="Append JSONL job events to this file ('-' for stderr); summarize with 'voxbridge stats'"),
+    metrics_file: Optional[Path] = typer.Option(None, "--metrics-file", help="Write Prometheus metrics to this file (node_exporter textfile collector, *.prom)"),
+    metrics_port: Optional[int] = typer.Option(None, "--metrics-port", help="Serve Prometheus metrics on this port at /metrics while the batch runs"),
+    shared_atlas: bool = typer.Option(False, "--shared-atlas", help="Pack the textures of all assets into one shared atlas"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output")
 ):
     """Convert multiple GLB files in batch."""
     
+    check_zip_options(zip_compression, zip_level)
+    
     if not input_dir.exists():
         console.print(f"[bold red]Error: Input directory '{input_dir}' does not exist")
         raise typer.Exit(1)
@@ -407,85 +591,261 @@ def batch(
         output_dir.mkdir(parents=True, exist_ok=True)
     
     # Find all GLB files
-    glb_files = list(input_dir.glob("*.glb"))
+    # Sorted so batch order (and the shared atlas layout) does not depend on the filesystem
+    glb_files = sorted(input_dir.glob("*.glb"))
     if not glb_files:
         console.print(f"[yellow]No GLB files found in '{input_dir}'")
         return
     
     console.print(f"Found {len(glb_files)} GLB files to convert")
     
+    # Build one atlas over every asset so the outputs share a single texture
+    atlas_info = None
+    if shared_atlas:
+        from .converter import VoxBridgeConverter
+        atlas_converter = VoxBridgeConverter(debug=verbose)
+        atlas_converter.optimization_settings['texture_effort'] = texture_effort
+        atlas_info = atlas_converter.prepare_shared_atlas(glb_files, output_dir, target)
+        if atlas_info:
+            console.print(f"Shared atlas: {atlas_info['path']} ({len(atlas_info['rects'])} unique textures)")
+        else:
+            console.print("[yellow]Shared atlas not created; converting with per-asset textures")
+    
     success_count = 0
-    for glb_file in glb_files:
-        output_file = output_dir / f"{glb_file.stem}.gltf"
-        console.print(f"\nConverting {glb_file.name}...")
+    event_log = EventLog(events)
+    metrics = metrics_server = None
+    if metrics_file or metrics_port is not None:
+        metrics = ConversionMetrics()
+        metrics.attach(event_log)
+        metrics.queue_depth.set(len(glb_files))
+    try:
+        if metrics_port is not None:
+            metrics_server = metrics.registry.serve(metrics_port)
+            console.print(f"Serving metrics on http://localhost:{metrics_server.server_address[1]}/metrics")
+        for index, glb_file in enumerate(glb_files):
+            output_file = output_dir / f"{glb_file.stem}.gltf"
+            console.print(f"\nConverting {glb_file.name}...")
+            if metrics is not None:
+                metrics.queue_depth.set(len(glb_files) - index - 1)
         
-        success = handle_conversion(
-            input_path=glb_file,
-            output_path=output_file,
-            target=target,
-            optimize_mesh=optimize_mesh,
-            no_blender=no_blender,
-            verbose=verbose,
-            debug=False
-        )
+            success = handle_conversion(
+                input_path=glb_file,
+                output_path=output_file,
+                target=target,
+                optimize_mesh=optimize_mesh,
+                no_blender=no_blender,
+                verbose=verbose,
+                debug=False,
+                texture_effort=texture_effort,
+                shared_atlas=atlas_info,
+                zip_compression=zip_compression,
+                zip_level=zip_level,
+                deterministic=deterministic,
+                external_validation=external_validation,
+                race=race,
+                blender_timeout=blender_timeout,
+                profile=profile,
+                cprofile=cprofile,
+                memprofile=memprofile,
+                report_name=f"{glb_file.stem}.performance_report.json",
+                events=event_log
+            )
         
-        if success:
-            success_count += 1
+            if success:
+                success_count += 1
+            if metrics_file:
+                metrics.registry.write_textfile(metrics_file)
+    finally:
+        event_log.close()
+        if metrics_file:
+            metrics.registry.write_textfile(metrics_file)
+        if metrics_server is not None:
+            metrics_server.shutdown()
+            metrics_server.server_close()
     
     console.print(f"\n[bold green]Batch conversion completed: {success_count}/{len(glb_files)} files converted successfully")
 
+def print_performance_table(results: List[dict]):
+    """Print wall time, memory and the slowest stage for each benchmarked asset."""
+    table = Table(title="Performance")
+    table.add_column("Asset")
+    table.add_column("Median", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Peak heap", justify="right")
+    table.add_column("Slowest stage")
+    for record in results:
+        wall_time = record['wall_time']
+        stages = {name: timing['median'] for name, timing in record['stages'].items() if timing['median'] is not None}
+        slowest = max(stages, key=stages.get) if stages else None
+        peak = record['memory']['peak_traced_bytes']
+        table.add_row(
+            record['asset'],
+            f"{wall_time['median']:.3f}s" if wall_time['median'] is not None else "-",
+            f"{wall_time['p95']:.3f}s" if wall_time['p95'] is not None else "-",
+            format_size(peak) if peak is not None else "-",
+            f"{slowest} ({stages[slowest]:.3f}s)" if slowest else "-",
+        )
+    console.print(table)
+
+def print_sweep_table(sweep_results: dict):
+    """Print the fitted growth of the wall time and of each stage across a size sweep."""
+    sizes = ', '.join(str(size) for size in sweep_results['sizes'])
+    table = Table(title=f"Scaling (voxels: {sizes})")
+    table.add_column("Stage")
+    table.add_column("Exponent", justify="right")
+    table.add_column("R²", justify="right")
+    table.add_column("Complexity")
+    rows = [('total', sweep_results['wall_time'])] + list(sweep_results['stages'].items())
+    for name, fit in rows:
+        if fit is None:
+            table.add_row(name, "-", "-", "-")
+            continue
+        style = "bold red" if fit['superlinear'] else None
+        table.add_row(name, f"{fit['exponent']:.2f}", f"{fit['r2']:.2f}", fit['complexity'], style=style)
+    console.print(table)
+
+def print_comparison_table(comparison: dict, baseline: Path):
+    """Print the regressions and improvements found against a baseline report."""
+    if not comparison['same_machine']:
+        console.print("[yellow]Warning: baseline was recorded on a different machine or Python version")
+    for asset in comparison['missing_assets']:
+        console.print(f"[yellow]Warning: {asset} is in the baseline but was not benchmarked")
+    changed = [row for row in comparison['rows'] if row['status'] != 'unchanged']
+    if not changed:
+        console.print(f"\nNo changes beyond {comparison['threshold']:.0%} against {baseline}")
+        return
+    table = Table(title=f"Against {baseline.name} (threshold {comparison['threshold']:.0%}, {comparison['test']})")
+    table.add_column("Asset")
+    table.add_column("Metric")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("p", justify="right")
+    for row in changed:
+        style = "red" if row['status'] == 'regression' else "green"
+        timing = row['metric'] == 'wall_time' or row['metric'].startswith('stage:')
+        values = [f"{row[key]:.3f}s" if timing else f"{row[key]:,}" for key in ('baseline', 'current')]
+        change = f"{row['change']:+.1%}" if row['change'] is not None else "new"
+        p_value = f"{row['p_value']:.3f}" if row['p_value'] is not None else "-"
+        table.add_row(row['asset'], row['metric'], *values, change, p_value, style=style)
+    console.print(table)
+
 @app.command()
 def benchmark(
-    input_dir: Path = typer.Option(..., "--input-dir", "-i", help="Input directory with test assets"),
+    input_dir: Optional[Path] = typer.Option(None, "--input-dir", "-i", help="Input directory with test assets"),
     output_dir: Path = typer.Option(..., "--output-dir", "-o", help="Output directory for benchmark results"),
     target: str = typer.Option("unity", "--target", "-t", help="Target platform (unity/roblox)"),
     optimize_mesh: bool = typer.Option(True, "--optimize-mesh", help="Enable mesh optimization"),
+    repetitions: int = typer.Option(5, "--repetitions", "-n", min=1, help="Timed conversions per asset"),
+    warmup: int = typer.Option(1, "--warmup", min=0, help="Untimed warmup conversions per asset"),
+    trace_memory: bool = typer.Option(True, "--trace-memory/--no-trace-memory", help="Measure peak Python heap with one extra traced run"),
+    no_blender: bool = typer.Option(False, "--no-blender", help="Skip Blender and use the Python pipeline"),
+    sweep: bool = typer.Option(False, "--sweep", help="Benchmark generated VoxEdit-style assets of increasing size and fit per-stage complexity"),
+    sweep_sizes: str = typer.Option("1000,4000,16000", "--sweep-sizes", help="Comma-separated voxel counts for --sweep"),
+    sweep_parts: int = typer.Option(8, "--sweep-parts", min=1, help="Parts (bones) per generated asset"),
+    sweep_palette: int = typer.Option(32, "--sweep-palette", min=1, help="Palette size of generated assets"),
+    sweep_textures: int = typer.Option(1, "--sweep-textures", min=1, help="Textures per generated asset"),
+    sweep_texture_size: int = typer.Option(256, "--sweep-texture-size", min=1, help="Texture resolution of generated assets"),
+    sweep_animations: int = typer.Option(0, "--sweep-animations", min=0, help="Animations per generated asset"),
+    baseline: Optional[Path] = typer.Option(None, "--baseline", help="performance_benchmark.json of an earlier run to compare against"),
+    fail_on_regression: Optional[str] = typer.Option(None, "--fail-on-regression", help="Exit non-zero when a metric regresses by more than this (e.g. 10%)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output")
 ):
-    """Run optimization benchmarks on test assets."""
+    """Run optimization and performance benchmarks on test assets."""
     console.print("[bold blue]VoxBridge Benchmark - Optimization Testing")
     
-    if not input_dir.exists():
-        console.print(f"[bold red]Error: Input directory '{input_dir}' does not exist")
-        raise typer.Exit(1)
+    # Check the regression gate settings before spending time on conversions
+    from .perf import DEFAULT_THRESHOLD, compare_reports, parse_threshold
+    threshold = DEFAULT_THRESHOLD
+    if fail_on_regression is not None:
+        if baseline is None:
+            console.print("[bold red]Error: --fail-on-regression needs --baseline")
+            raise typer.Exit(1)
+        try:
+            threshold = parse_threshold(fail_on_regression)
+        except ValueError:
+            console.print(f"[bold red]Error: Invalid --fail-on-regression '{escape(fail_on_regression)}' (use e.g. 10%)")
+            raise typer.Exit(1)
+    baseline_report = None
+    if baseline is not None:
+        try:
+            with open(baseline, 'r', encoding='utf-8') as f:
+                baseline_report = json.load(f)
+            if not isinstance(baseline_report.get('assets'), list):
+                raise ValueError("no 'assets' list")
+        except (OSError, ValueError, AttributeError) as e:
+            console.print(f"[bold red]Error: Cannot read baseline '{baseline}': {escape(str(e))}")
+            raise typer.Exit(1)
     
     if not output_dir.exists():
         output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Find all GLB files
-    glb_files = list(input_dir.glob("*.glb"))
-    if not glb_files:
-        console.print(f"[yellow]No GLB files found in '{input_dir}'")
-        return
+    sizes = []
+    if sweep:
+        # Generated assets, smallest first; the same settings always give the same files
+        from .synthetic import generate_voxel_glb
+        try:
+            sizes = sorted({int(size) for size in sweep_sizes.split(',') if size.strip()})
+        except ValueError:
+            console.print(f"[bold red]Error: Invalid --sweep-sizes '{sweep_sizes}'")
+            raise typer.Exit(1)
+        if len(sizes) < 2 or sizes[0] < sweep_parts:
+            console.print("[bold red]Error: --sweep needs at least two sizes, each with one voxel per part")
+            raise typer.Exit(1)
+        synthetic_dir = output_dir / "synthetic"
+        glb_files = []
+        for size in sizes:
+            glb_path = synthetic_dir / f"voxels_{size:08d}.glb"
+            generate_voxel_glb(glb_path, voxels=size, parts=sweep_parts, palette_size=sweep_palette,
+                               textures=sweep_textures, texture_size=sweep_texture_size,
+                               animations=sweep_animations)
+            glb_files.append(glb_path)
+    else:
+        if input_dir is None or not input_dir.exists():
+            console.print(f"[bold red]Error: Input directory '{input_dir}' does not exist")
+            raise typer.Exit(1)
+        
+        # Find all GLB files
+        # Sorted so batch order (and the shared atlas layout) does not depend on the filesystem
+        glb_files = sorted(input_dir.glob("*.glb"))
+        if not glb_files:
+            console.print(f"[yellow]No GLB files found in '{input_dir}'")
+            return
     
     console.print(f"Found {len(glb_files)} test assets for benchmarking")
     
     # Initialize converter with benchmark support
     from .converter import VoxBridgeConverter
+    from .perf import ConversionBenchmark, sweep_report
     converter = VoxBridgeConverter(debug=verbose)
     
     # Enable optimizations for benchmarking
     converter.optimization_settings['mesh_optimization'] = optimize_mesh
     converter.optimization_settings['texture_atlas'] = True
+    harness = ConversionBenchmark(converter, repetitions=repetitions, warmup=warmup, trace_memory=trace_memory)
     
     benchmark_results = {}
     success_count = 0
     
     for glb_file in glb_files:
-        console.print(f"\n[bold cyan]Benchmarking {glb_file.name}...")
+        console.print(f"\n[bold cyan]Benchmarking {glb_file.name} ({warmup} warmup, {repetitions} timed)...")
         
-        # Convert with optimizations
+        # Convert with optimizations, repeatedly
         output_file = output_dir / f"{glb_file.stem}_optimized"
-        success = converter.convert_file(
-            input_path=glb_file,
-            output_path=output_file,
+        record = harness.run_asset(
+            glb_file,
+            output_file,
             platform=target,
             optimize_mesh=optimize_mesh,
-            use_blender=True
+            use_blender=not no_blender
         )
+        for error in record['errors']:
+            console.print(f"  [red]Error: {escape(error)}")
         
-        if success:
+        if record['success']:
             success_count += 1
+            wall_time = record['wall_time']
+            console.print(f"  Wall time: median {wall_time['median']:.3f}s, p95 {wall_time['p95']:.3f}s")
             # Get benchmark results
             asset_results = converter.get_benchmark_results()
             if glb_file.stem in asset_results:
@@ -517,6 +877,26 @@ def benchmark(
                     console.print(f"    File size: {file_size_improvement:.1f}% improvement")
                     console.print(f"    Triangles: {triangle_improvement:.1f}% improvement")
     
+    # Timings, memory and per-stage breakdown for every asset
+    comparison = None
+    if harness.results:
+        perf_path = output_dir / "performance_benchmark.json"
+        settings = {'target': target, 'optimize_mesh': optimize_mesh, 'use_blender': not no_blender}
+        sweep_results = None
+        if sweep:
+            settings['sweep'] = {'parts': sweep_parts, 'palette_size': sweep_palette, 'textures': sweep_textures,
+                                 'texture_size': sweep_texture_size, 'animations': sweep_animations}
+            sweep_results = sweep_report(sizes, harness.results)
+        if baseline_report is not None:
+            comparison = compare_reports(baseline_report, harness.report(settings), threshold)
+        harness.save_report(perf_path, settings=settings, sweep=sweep_results, comparison=comparison)
+        print_performance_table(harness.results)
+        if sweep_results:
+            print_sweep_table(sweep_results)
+        if comparison is not None:
+            print_comparison_table(comparison, baseline)
+        console.print(f"\n[bold green]Performance report generated: {perf_path}")
+    
     # Also try to generate report from converter's benchmark data
     if converter.benchmark and hasattr(converter.benchmark, 'benchmark_results'):
         if converter.benchmark.benchmark_results:
@@ -525,9 +905,70 @@ def benchmark(
                 console.print(f"\n[bold green]Converter benchmark report generated: {report_path}")
     
     console.print(f"\n[bold green]Benchmark completed: {success_count}/{len(glb_files)} assets tested")
+    
+    if fail_on_regression is not None and comparison is not None and comparison['regressions']:
+        console.print(f"[bold red]{comparison['regressions']} regression(s) above {threshold:.0%}")
+        raise typer.Exit(1)
+
+def format_seconds(seconds: Optional[float]) -> str:
+    """Latency in ms below one second, otherwise in seconds."""
+    if seconds is None:
+        return "-"
+    return f"{seconds * 1000:.1f} ms" if seconds < 1 else f"{seconds:.2f} s"
+
+def print_event_summary(summary: dict, log_path: Path):
+    """Print job counts, throughput, latency percentiles, stages, backends and failure causes."""
+    throughput = summary['throughput']
+    console.print(f"[bold blue]Event log: {log_path}")
+    console.print(f"Jobs: {summary['jobs']} ({summary['succeeded']} succeeded, {summary['failed']} failed) "
+                  f"over {summary['wall_seconds']:.1f} s")
+    if throughput['jobs_per_second'] is not None:
+        console.print(f"Throughput: {throughput['jobs_per_second']:.2f} jobs/s, "
+                      f"{format_size(int(throughput['bytes_in_per_second']))}/s in")
+    console.print(f"Bytes: {format_size(throughput['bytes_in'])} in, {format_size(throughput['bytes_out'])} out")
+    
+    table = Table(title="Latency")
+    table.add_column("", no_wrap=True)
+    for column in ("Count", "Mean", "p50", "p90", "p95", "p99", "Max"):
+        table.add_column(column, justify="right")
+    for name, latency in [("job", summary['latency'])] + [(f"  {stage}", latency) for stage, latency in summary['stages'].items()]:
+        table.add_row(name, str(latency['count']), *(format_seconds(latency[key]) for key in ('mean', 'p50', 'p90', 'p95', 'p99', 'max')))
+    console.print(table)
+    
+    if summary['backends']:
+        table = Table(title="Backends")
+        table.add_column("Backend")
+        table.add_column("Outcomes")
+        for backend, outcomes in summary['backends'].items():
+            table.add_row(backend, ", ".join(f"{outcome}: {count}" for outcome, count in outcomes.items()))
+        console.print(table)
+    
+    for title, counts in (("Failure causes", summary['failure_causes']), ("Top warnings", summary['warnings'])):
+        if counts:
+            console.print(f"\n[bold]{title}:")
+            for cause, count in counts.items():
+                console.print(f"  {count:>5}  {escape(cause)}")
+
+@app.command()
+def stats(
+    log_file: Path = typer.Argument(..., help="JSONL event log written with --events"),
+    json_output: bool = typer.Option(False, "--json", help="Print the summary as JSON")
+):
+    """Summarize a conversion event log into throughput, latency percentiles and failure causes."""
+    if not log_file.exists():
+        console.print(f"[bold red]Error: Event log '{log_file}' does not exist")
+        raise typer.Exit(1)
+    
+    summary = summarize_events(read_events(log_file))
+    if json_output:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_event_summary(summary, log_file)
 
 @app.command()
-def doctor():
+def doctor(
+    refresh: bool = typer.Option(False, "--refresh", help="Probe backends and tools again instead of using the capability cache")
+):
     """Diagnose and fix common VoxBridge issues."""
     console.print("[bold blue]VoxBridge Doctor - System Diagnostics")
     
@@ -556,27 +997,18 @@ def doctor():
     except ImportError:
         console.print("  ✗ pygltflib (missing)")
     
-    # Check Blender
-    console.print("\nExternal Tools:")
-    try:
-        import subprocess
-        result = subprocess.run(['which', 'blender'], capture_output=True, text=True)
-        if result.returncode == 0:
-            console.print(f"  ✓ Blender: {result.stdout.strip()}")
-        else:
-            console.print("  ✗ Blender: not found")
-    except:
-        console.print("  ✗ Blender: detection failed")
-    
-    # Check Node.js
-    try:
-        result = subprocess.run(['which', 'node'], capture_output=True, text=True)
-        if result.returncode == 0:
-            console.print(f"  ✓ Node.js: {result.stdout.strip()}")
-        else:
-            console.print("  ✗ Node.js: not found")
-    except:
-        console.print("  ✗ Node.js: detection failed")
+    # Backends and external tools
+    capabilities = get_capabilities()
+    entries = capabilities.refresh() if refresh else capabilities.all()
+    console.print("\nBackends and External Tools:")
+    for name, entry in entries.items():
+        mark = "✓" if entry['available'] else "✗"
+        details = ", ".join(str(part) for part in (entry['path'], entry['detail']) if part) or "not found"
+        console.print(f"  {mark} {name}: {escape(details)}")
+    cached = [name for name, entry in entries.items() if entry['source'] == 'disk']
+    if cached:
+        console.print(f"\n[dim]From the capability cache ({capabilities.cache_path}): {', '.join(cached)}. "
+                      "Use --refresh to probe again.")
 
 def main():
     """Main entry point for the CLI."""
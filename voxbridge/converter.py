@@ -8,14 +8,18 @@ import json
 import os
 import shutil
 import subprocess
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import time
 import zipfile
+from urllib.parse import unquote
 
 # Try to import texture optimization modules (optional)
 try:
-    from .texture_optimizer import resize_texture, generate_texture_atlas, update_gltf_with_atlas
+    from .texture_optimizer import resize_texture, generate_texture_atlas, update_gltf_with_atlas, quantize_to_palette, optimize_png, deduplicate_textures
+    from .texture_optimizer import build_shared_atlas, load_gltf_images, pixel_hash, remap_gltf_to_atlas
     TEXTURE_OPTIMIZATION_AVAILABLE = True
 except ImportError:
     TEXTURE_OPTIMIZATION_AVAILABLE = False
@@ -34,6 +38,67 @@ try:
 except ImportError:
     PLATFORM_PROFILES_AVAILABLE = False
 
+from .accessors import repair_accessors
+from .backends import BackendCancelled, Deadline, default_backends, race_pair, run_process
+from .capabilities import find_blender as discover_blender, get_capabilities
+from .events import EventLog
+from .gltf_io import load_buffers, read_gltf_document, read_gltf_json, resolve_uri
+from .image_probe import probe_image, probe_stream
+from .packaging import PackageWriter, collect_package_files, package_manifest, reproducible_timestamp
+from .schemas import check_gltf_schema, check_report_schema
+from .profiling import MemoryProfiler, Profiler, traced
+from .stats import compute_file_stats, compute_stats
+from .validator import ERROR, WARNING, ValidationReport, validate_document
+
+# File name of the atlas shared by every asset of a batch (see prepare_shared_atlas)
+SHARED_ATLAS_FILENAME = 'shared_atlas.png'
+
+# Schema problems listed when an input is rejected
+SCHEMA_ERROR_LIMIT = 5
+
+PACKAGE_LICENSE_TEXT = (
+    "Creative Commons Attribution 4.0 International License\n"
+    "https://creativecommons.org/licenses/by/4.0/\n"
+    "\nModel created with VoxBridge converter."
+)
+
+
+class ConversionResult:
+    """
+    Outcome of one convert_file call: success, the single validation report
+    produced for the output, timings (overall and per pipeline stage) and
+    conversion statistics. The CLI, GUI and performance report all read
+    validation from here instead of re-validating the output. error says
+    why a conversion failed when the input was rejected or a step raised.
+    """
+    
+    def __init__(self, input_path: Path, output_path: Path, platform: str, success: bool,
+                 validation: Optional[ValidationReport] = None, timings: Optional[Dict[str, float]] = None,
+                 stats: Optional[Dict] = None, stages: Optional[Dict[str, float]] = None,
+                 error: Optional[str] = None):
+        self.input_path = Path(input_path)
+        self.output_path = Path(output_path)
+        self.platform = platform
+        self.success = success
+        self.validation = validation
+        self.timings = dict(timings or {})
+        self.stats = dict(stats or {})
+        self.stages = dict(stages or {})
+        self.error = error
+    
+    def to_dict(self) -> Dict:
+        return {
+            'input_file': str(self.input_path),
+            'output_file': str(self.output_path),
+            'platform': self.platform,
+            'success': self.success,
+            'validation': self.validation.to_dict() if self.validation else None,
+            'timings': {stage: round(seconds, 6) for stage, seconds in self.timings.items()},
+            'stats': self.stats,
+            'stages': {stage: round(seconds, 6) for stage, seconds in self.stages.items()},
+            'error': self.error,
+        }
+
 
 class VoxBridgeConverter:
     """Core converter class for VoxEdit glTF/glb files with platform-specific optimizations"""
@@ -53,8 +118,42 @@ class VoxBridgeConverter:
             if debug:
                 print("Platform profiles not available")
         
-        # Initialize conversion stats
+        # Initialize conversion stats (unique vertices, texture memory and the
+        # benchmark comparison only when a benchmark or report asks for them)
         self._last_conversion_stats = {}
+        self.detailed_stats = False
+        self.stage_timings = {}
+        
+        # Named spans around stages and steps (disabled unless a profiling Profiler is assigned)
+        self.profiler = Profiler()
+        
+        # tracemalloc snapshots at stage boundaries (disabled unless an enabled MemoryProfiler is assigned)
+        self.memory_profiler = MemoryProfiler()
+        
+        # Backend and tool availability, probed once per process and cached on disk
+        self.capabilities = get_capabilities()
+        
+        # Conversion backends in order of preference, with cost estimates and timeouts
+        self.backends = default_backends()
+        
+        # Structured JSONL job events (disabled unless an EventLog with a sink is assigned)
+        self.events = EventLog()
+        self._last_backend = None
+        
+        # Files this conversion wrote next to the output (safe to remove once packaged)
+        self._generated_files = set()
+        
+        # Batch-wide texture atlas prepared by prepare_shared_atlas (None = per-asset textures)
+        self.shared_atlas = None
+        
+        # Package members produced in memory (file name -> bytes), written straight into the ZIP
+        self._staged_members = {}
+        
+        # Result of the most recent in-process validation (validator.ValidationReport)
+        self.last_validation = None
+        
+        # Result of the most recent convert_file call (ConversionResult)
+        self.last_result = None
         
         # Initialize optimization settings
         self.optimization_settings = {
@@ -62,6 +161,14 @@ class VoxBridgeConverter:
             'texture_max_size': 1024,
             'mesh_optimization': True,
             'polygon_reduction': 0.3,  # Reduce polygons by 30%
+            'palette_quantization': True,  # Store low-color textures as indexed PNG
+            'texture_effort': 0,  # Lossless PNG re-encoding effort (0 = off, 1-3)
+            'texture_dedup': True,  # Merge images with identical decoded pixels
+            'zip_compression': 'deflate',  # ZIP member compression: deflate, zstd or store
+            'zip_level': None,  # Compression level (None = default for the mode)
+            'deterministic': False,  # Byte-identical output for identical input (no wall-clock data)
+            'external_validation': False,  # Also cross-check with gltf-validator / Node.js when installed
+            'race_backends': False,  # Race the basic converter against Blender; the first valid result wins
             'generate_lods': False  # Will be implemented in Milestone 3
         }
         
@@ -83,156 +190,35 @@ class VoxBridgeConverter:
             
         return True
     
-    def find_blender(self) -> Optional[str]:
-        """Find Blender executable in common locations with platform detection"""
-        import platform
-        
-        # Check environment variable override first
-        blender_path = os.environ.get('BLENDER_PATH')
-        if blender_path and os.path.exists(blender_path):
-            return blender_path
-        
-        # Detect platform
-        system = platform.system()
-        is_wsl = self._is_wsl()
-        
-        if self.debug:
-            print(f"Platform detection: {system}, WSL: {is_wsl}")
-        
-        # Check if blender is in PATH first
-        if shutil.which("blender"):
-            return "blender"
-        
-        # Platform-specific paths
-        if system == "Windows":
-            possible_paths = self._get_windows_blender_paths()
-        elif system == "Darwin":  # macOS
-            possible_paths = self._get_macos_blender_paths()
-        elif system == "Linux":
-            if is_wsl:
-                possible_paths = self._get_wsl_blender_paths()
-            else:
-                possible_paths = self._get_linux_blender_paths()
-        else:
-            possible_paths = []
-        
-        # Check common installation paths
-        for path in possible_paths:
-            if os.path.exists(path):
-                if self.debug:
-                    print(f"Found Blender at: {path}")
-                return path
+    @traced()
+    def check_input_schema(self, input_path: Path):
+        """
+        Check the JSON of a .gltf/.glb input against the bundled glTF 2.0
+        schema (relaxed for the empty arrays and null names the converters
+        cope with). Only the JSON chunk of a GLB is read. Raises
+        InputValidationError listing the first few problems.
+        """
+        if input_path.suffix.lower() not in self.supported_formats:
+            return
         
-        if self.debug:
-            print("No Blender installation found")
-        return None
-    
-    def _is_wsl(self) -> bool:
-        """Detect if running under WSL"""
         try:
-            # Check for WSL-specific environment variables
-            if os.environ.get("WSL_DISTRO_NAME"):
-                return True
-            
-            # Check /proc/version for WSL indicators
-            if os.path.exists("/proc/version"):
-                with open("/proc/version", "r") as f:
-                    version_info = f.read().lower()
-                    if "microsoft" in version_info or "wsl" in version_info:
-                        return True
-            
-            return False
-        except:
-            return False
-    
-    def _get_windows_blender_paths(self) -> List[str]:
-        """Get Windows Blender installation paths"""
-        paths = []
-        
-        # Common Windows installation paths
-        program_files = os.environ.get('ProgramFiles', 'C:\\Program Files')
-        program_files_x86 = os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)')
-        
-        # Check both Program Files directories
-        for base_path in [program_files, program_files_x86]:
-            if os.path.exists(base_path):
-                # Look for Blender Foundation folder
-                blender_foundation = os.path.join(base_path, "Blender Foundation")
-                if os.path.exists(blender_foundation):
-                    # Check for versioned folders
-                    for item in os.listdir(blender_foundation):
-                        if item.startswith("Blender "):
-                            blender_exe = os.path.join(blender_foundation, item, "blender.exe")
-                            if os.path.exists(blender_exe):
-                                paths.append(blender_exe)
-        
-        # Add specific known paths
-        specific_paths = [
-            r"C:\Program Files\Blender Foundation\Blender 3.6\blender.exe",
-            r"C:\Program Files\Blender Foundation\Blender 4.0\blender.exe",
-            r"C:\Program Files\Blender Foundation\Blender 4.1\blender.exe",
-            r"C:\Program Files\Blender Foundation\Blender 4.2\blender.exe",
-            r"C:\Program Files\Blender Foundation\Blender 4.3\blender.exe",
-        ]
+            gltf_data = read_gltf_json(input_path)
+        except (OSError, ValueError) as e:
+            raise InputValidationError(f"Cannot read {input_path.name}: {e}")
+        if not isinstance(gltf_data, dict):
+            raise InputValidationError(f"{input_path.name} is not a glTF document: top level is a {type(gltf_data).__name__}, not an object")
         
-        for path in specific_paths:
-            if os.path.exists(path):
-                paths.append(path)
+        errors = check_gltf_schema(gltf_data, limit=SCHEMA_ERROR_LIMIT)
+        if errors:
+            details = "\n".join(f"  - {error}" for error in errors)
+            raise InputValidationError(f"{input_path.name} is not a valid glTF 2.0 document:\n{details}")
         
-        return paths
-    
-    def _get_macos_blender_paths(self) -> List[str]:
-        """Get macOS Blender installation paths"""
-        paths = [
-            "/Applications/Blender.app/Contents/MacOS/Blender",
-            "/Applications/Blender.app/Contents/MacOS/blender",
-            "/opt/homebrew/bin/blender",  # Homebrew installation
-            "/usr/local/bin/blender",     # Local installation
-        ]
-        return paths
-    
-    def _get_linux_blender_paths(self) -> List[str]:
-        """Get Linux Blender installation paths"""
-        paths = [
-            "/usr/bin/blender",
-            "/usr/local/bin/blender",
-            "/snap/bin/blender",
-            "/var/lib/flatpak/exports/bin/org.blender.Blender",
-            "/opt/blender/blender",  # Manual installation
-        ]
-        return paths
+        if self.debug:
+            print(f"Input schema check passed: {input_path.name}")
     
-    def _get_wsl_blender_paths(self) -> List[str]:
-        """Get WSL Blender installation paths (Linux + Windows fallback)"""
-        paths = []
-        
-        # First, try Linux-style paths (in case user installed Blender inside WSL)
-        linux_paths = self._get_linux_blender_paths()
-        paths.extend(linux_paths)
-        
-        # Then, try Windows paths accessible from WSL
-        try:
-            # Check if Windows drives are mounted
-            windows_paths = [
-                "/mnt/c/Program Files/Blender Foundation",
-                "/mnt/c/Program Files (x86)/Blender Foundation",
-            ]
-            
-            for base_path in windows_paths:
-                if os.path.exists(base_path):
-                    # Look for versioned folders
-                    for item in os.listdir(base_path):
-                        if item.startswith("Blender "):
-                            blender_exe = os.path.join(base_path, item, "blender.exe")
-                            if os.path.exists(blender_exe):
-                                paths.append(blender_exe)
-                                if self.debug:
-                                    print(f"Found Windows Blender in WSL: {blender_exe}")
-        except Exception as e:
-            if self.debug:
-                print(f"Error checking Windows paths in WSL: {e}")
-        
-        return paths
+    def find_blender(self) -> Optional[str]:
+        """Find Blender executable in common locations with platform detection (uncached; see self.capabilities)"""
+        return discover_blender(debug=self.debug)
     
     def _can_use_blender(self, input_path: Path) -> bool:
         """Check if Blender can be used for the given input file"""
@@ -240,9 +226,8 @@ class VoxBridgeConverter:
         if input_path.suffix.lower() == '.glb':
             return True
         
-        # Check if Blender executable is available
-        blender_exe = self.find_blender()
-        if not blender_exe:
+        # Check if Blender executable is available (probed once per process)
+        if not self.capabilities.available('blender'):
             return False
         
         # Check if Blender script exists
@@ -253,22 +238,11 @@ class VoxBridgeConverter:
     
     def _can_use_assimp(self) -> bool:
         """Check if Assimp can be used (both pyassimp and C++ library)"""
-        try:
-            import pyassimp
-            # Try to load a simple test to see if the C++ library is available
-            from pyassimp import helper
-            helper.search_library()
-            return True
-        except:
-            return False
+        return self.capabilities.available('assimp')
     
     def _can_use_trimesh(self) -> bool:
         """Check if Trimesh can be used"""
-        try:
-            import trimesh
-            return True
-        except ImportError:
-            return False
+        return self.capabilities.available('trimesh')
     
     def _load_with_trimesh(self, file_path: str):
         """Helper function to load models with Trimesh, handling both Trimesh and Scene objects"""
@@ -326,6 +300,7 @@ class VoxBridgeConverter:
                 print(f"Trimesh loading failed: {e}")
             raise e
     
+    @traced('backend:assimp')
     def convert_with_assimp(self, input_path: Path, output_path: Path, platform: str = "unity") -> bool:
         """Convert using Assimp (pyassimp) library"""
         try:
@@ -374,6 +349,7 @@ class VoxBridgeConverter:
                     print("  Windows: Download from https://github.com/assimp/assimp/releases")
             return False
     
+    @traced('backend:trimesh')
     def convert_with_trimesh(self, input_path: Path, output_path: Path, platform: str = "unity") -> bool:
         """Convert using Trimesh library with consolidated binary output"""
         try:
@@ -428,7 +404,9 @@ class VoxBridgeConverter:
                     
                     # Create platform-specific output files
                     platform_outputs = self.platform_manager.create_platform_specific_outputs(
-                        gltf_data, output_path, platform
+                        gltf_data, output_path, platform,
+                        sort_keys=self.optimization_settings.get('deterministic', False),
+                        validate=False
                     )
                     
                     if self.debug:
@@ -438,57 +416,28 @@ class VoxBridgeConverter:
                     if platform_outputs:
                         gltf_output = platform_outputs[0]
                 
+                # Run automatic validation
+                stage_start = time.perf_counter()
+                self.memory_profiler.stage('backend:trimesh')
+                self._run_validation(gltf_output, input_path, platform)
+                stage_start = self._record_stage('validate', stage_start)
+                
                 # Capture conversion statistics for summary
                 if gltf_output.exists():
-                    try:
-                        # Read the final GLTF file to get accurate statistics
-                        with open(gltf_output, 'r', encoding='utf-8') as f:
-                            final_gltf_data = json.load(f)
-                        
-                        # Store statistics for summary display
-                        self._last_conversion_stats = {
-                            'meshes': len(final_gltf_data.get('meshes', [])),
-                            'materials': len(final_gltf_data.get('materials', [])),
-                            'textures': len(final_gltf_data.get('textures', [])),
-                            'nodes': len(final_gltf_data.get('nodes', [])),
-                            'file_size': gltf_output.stat().st_size
-                        }
-                        
-                        if self.debug:
-                            print(f"Captured conversion stats: {self._last_conversion_stats}")
-                            
-                    except Exception as e:
-                        if self.debug:
-                            print(f"Warning: Could not capture conversion stats: {e}")
-                        # Fallback to basic stats
-                        self._last_conversion_stats = {
-                            'meshes': 0,
-                            'materials': 0,
-                            'textures': 0,
-                            'nodes': 0,
-                            'file_size': 0
-                        }
+                    self._capture_conversion_stats(gltf_output, input_path)
+                stage_start = self._record_stage('stats', stage_start)
                 
                 # Package output files into ZIP
                 if gltf_output.exists():
-                    zip_path = self._package_output_files(output_path, gltf_output)
+                    zip_path = self._package_output_files(output_path, gltf_output, input_path)
+                    stage_start = self._record_stage('package', stage_start)
                     if zip_path.suffix == '.zip':
                         
                         # Track benchmark metrics if available
-                        if self.benchmark and BENCHMARK_AVAILABLE:
+                        if self.benchmark and BENCHMARK_AVAILABLE and self.detailed_stats:
                             try:
-                                # Measure original input stats (handle GLB files)
-                                original_stats = {}
-                                if input_path.suffix.lower() == '.glb':
-                                    # For GLB files, get basic file info
-                                    original_stats = {
-                                        'file_size': input_path.stat().st_size,
-                                        'file_type': 'GLB',
-                                        'timestamp': time.time()
-                                    }
-                                else:
-                                    # For GLTF files, measure full stats
-                                    original_stats = self.benchmark.measure_model_stats(input_path)
+                                # Measure original input stats (GLB inputs are read in full)
+                                original_stats = self.benchmark.measure_model_stats(input_path)
                                 
                                 # Find the final platform-specific GLTF file for stats
                                 final_gltf_path = None
@@ -505,14 +454,7 @@ class VoxBridgeConverter:
                                     optimized_stats = self.benchmark.measure_model_stats(final_gltf_path)
                                 else:
                                     # Fallback: use the stats we already captured
-                                    optimized_stats = {
-                                        'file_size': self._last_conversion_stats.get('file_size', 0),
-                                        'mesh_count': self._last_conversion_stats.get('meshes', 0),
-                                        'material_count': self._last_conversion_stats.get('materials', 0),
-                                        'texture_count': self._last_conversion_stats.get('textures', 0),
-                                        'node_count': self._last_conversion_stats.get('nodes', 0),
-                                        'timestamp': time.time()
-                                    }
+                                    optimized_stats = self.benchmark.summarize_stats(self._last_conversion_stats)
                                 
                                 # Store benchmark data
                                 asset_name = input_path.stem
@@ -531,6 +473,7 @@ class VoxBridgeConverter:
                             except Exception as e:
                                 if self.debug:
                                     print(f"Warning: Benchmark tracking failed: {e}")
+                        self.memory_profiler.stage('benchmark')
                     
                     if zip_path.suffix == '.zip':
                         print(f"Conversion complete. Your files are packaged into {zip_path.name}")
@@ -610,7 +553,7 @@ class VoxBridgeConverter:
             
             # Write updated GLTF
             with open(gltf_path, 'w') as f:
-                json.dump(gltf_data, f, indent=2)
+                json.dump(gltf_data, f, indent=2, sort_keys=self.optimization_settings.get('deterministic', False))
             
             # Clean up individual .bin files
             for bin_file in bin_files:
@@ -625,13 +568,15 @@ class VoxBridgeConverter:
                 print(f"Failed to consolidate buffers: {e}")
             # If consolidation fails, just continue with the original files
     
-    def clean_gltf_json(self, gltf_path: Path, output_path: Path = None) -> Tuple[Dict, List[str]]:
+    @traced()
+    def clean_gltf_json(self, gltf_path: Path, output_path: Path = None,
+                        stage_binary: bool = False) -> Tuple[Dict, List[str]]:
         """Clean glTF JSON for texture paths and material names"""
         # Handle GLB files differently - they need to be converted to glTF first
         if gltf_path.suffix.lower() == '.glb':
             if output_path is None:
                 output_path = gltf_path.with_suffix('.gltf')
-            return self._process_glb_file(gltf_path, output_path)
+            return self._process_glb_file(gltf_path, output_path, stage_binary)
         
         # Handle glTF files as before
         try:
@@ -677,8 +622,14 @@ class VoxBridgeConverter:
         
         return gltf_data, changes_made
     
-    def _process_glb_file(self, glb_path: Path, output_path: Path) -> Tuple[Dict, List[str]]:
-        """Process GLB file to extract glTF JSON and binary data"""
+    @traced('glb_parse')
+    def _process_glb_file(self, glb_path: Path, output_path: Path,
+                          stage_binary: bool = False) -> Tuple[Dict, List[str]]:
+        """
+        Process GLB file to extract glTF JSON and binary data.
+        With stage_binary the extracted .bin is kept in self._staged_members
+        for the packager instead of being written next to the output.
+        """
         try:
             if self.debug:
                 print(f"Processing GLB file: {glb_path}")
@@ -837,6 +788,10 @@ class VoxBridgeConverter:
                         accessor_dict = {}
                         if hasattr(accessor, 'bufferView') and accessor.bufferView is not None:
                             accessor_dict['bufferView'] = accessor.bufferView
+                        if hasattr(accessor, 'byteOffset') and accessor.byteOffset:
+                            accessor_dict['byteOffset'] = accessor.byteOffset
+                        if hasattr(accessor, 'normalized') and accessor.normalized:
+                            accessor_dict['normalized'] = True
                         if hasattr(accessor, 'componentType') and accessor.componentType is not None:
                             accessor_dict['componentType'] = accessor.componentType
                         if hasattr(accessor, 'count') and accessor.count is not None:
@@ -957,16 +912,25 @@ class VoxBridgeConverter:
                         buffer_view_offsets = {}
                         
                         # First pass: calculate total size and new offsets
+                        # (each bufferView starts on a 4-byte boundary so accessors stay aligned)
+                        chunks = []
                         for i, buffer_view in enumerate(gltf_data['bufferViews']):
                             if f'bufferView_{i}' in self._extracted_binary_data:
+                                padding = -total_size % 4
+                                chunks.append(b'\x00' * padding)
+                                total_size += padding
                                 buffer_view_offsets[i] = total_size
-                                total_size += len(self._extracted_binary_data[f'bufferView_{i}'])
+                                chunks.append(self._extracted_binary_data[f'bufferView_{i}'])
+                                total_size += len(chunks[-1])
                         
                         # Write the combined binary data
-                        with open(binary_path, 'wb') as f:
-                            for i, buffer_view in enumerate(gltf_data['bufferViews']):
-                                if f'bufferView_{i}' in self._extracted_binary_data:
-                                    f.write(self._extracted_binary_data[f'bufferView_{i}'])
+                        binary_data = b''.join(chunks)
+                        if stage_binary:
+                            self._staged_members[binary_filename] = binary_data
+                        else:
+                            with open(binary_path, 'wb') as f:
+                                f.write(binary_data)
+                            self._generated_files.add(binary_path)
                         
                         # Update buffer views with new offsets and byteLength
                         for i, buffer_view in enumerate(gltf_data['bufferViews']):
@@ -993,38 +957,6 @@ class VoxBridgeConverter:
                         if self.debug:
                             print(f"Created external binary file: {binary_filename} ({total_size:,} bytes)")
                 
-                # Validate and fix accessor counts to prevent Error 23
-                if self.debug:
-                    print("Starting accessor count validation...")
-                if 'accessors' in gltf_data:
-                    print(f"Found {len(gltf_data['accessors'])} accessors to validate")
-                    for i, accessor in enumerate(gltf_data['accessors']):
-                        if 'bufferView' in accessor and 'count' in accessor:
-                            buffer_view_idx = accessor['bufferView']
-                            if buffer_view_idx < len(gltf_data['bufferViews']):
-                                buffer_view = gltf_data['bufferViews'][buffer_view_idx]
-                                if 'byteLength' in buffer_view:
-                                    # Calculate correct count based on component type and size
-                                    component_type_size = self._get_component_type_size(accessor.get('componentType', 5126))
-                                    type_num_components = self._get_type_num_components(accessor.get('type', 'FLOAT'))
-                                    
-                                    if self.debug:
-                                        print(f"Accessor {i}: componentType={accessor.get('componentType', 5126)}, type={accessor.get('type', 'FLOAT')}")
-                                        print(f"  component_size={component_type_size}, num_components={type_num_components}")
-                                        print(f"  buffer_view_byteLength={buffer_view['byteLength']}")
-                                    
-                                    if component_type_size > 0 and type_num_components > 0:
-                                        max_count = buffer_view['byteLength'] // (component_type_size * type_num_components)
-                                        if self.debug:
-                                            print(f"  max_count={max_count}, current_count={accessor['count']}")
-                                        if accessor['count'] > max_count:
-                                            if self.debug:
-                                                print(f"Fixing accessor {i}: count {accessor['count']} exceeds buffer capacity, reducing to {max_count}")
-                                            accessor['count'] = max_count
-                else:
-                    if self.debug:
-                        print("No accessors found in gltf_data")
-                
                 return gltf_data, ["GLB file processed successfully using pygltflib"]
                 
             except ImportError:
@@ -1101,77 +1033,270 @@ class VoxBridgeConverter:
         return stats
     
     def convert_file(self, input_path: Path, output_path: Path, use_blender: bool = True, optimize_mesh: bool = False, generate_atlas: bool = False, compress_textures: bool = False, platform: str = "unity") -> bool:
-        """Main conversion logic with layered fallback system"""
+        """
+        Main conversion logic with layered fallback system.
+        Each conversion runs in its own private staging directory next to the
+        output; only its finished artifacts are moved into the output
+        directory, so concurrent conversions into one folder never see or
+        delete each other's intermediate files.
+        """
         # Set texture atlas generation flag
         self._generate_atlas_enabled = generate_atlas
         
         # Create output directory if it exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = Path(output_path)
+        output_dir = output_path.parent
+        output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Clean up old output files to prevent duplicates
-        self._cleanup_old_outputs(output_path)
+        # Validation runs once inside the conversion; never report a stale result
+        self.last_validation = None
+        self.last_result = None
+        self._last_conversion_stats = {}
+        self.stage_timings = {}
+        self._last_backend = None
+        self.memory_profiler.begin()
+        start = time.perf_counter()
         
-        # Layered fallback system: Blender → Assimp → Trimesh → Basic Converter
+        input_path = Path(input_path)
+        self.events.begin_job()
+        self.events.emit('job_start', input=str(input_path), output=str(output_path), platform=platform,
+                         bytes_in=input_path.stat().st_size if input_path.is_file() else None)
         
-        # Step 1: Try Blender CLI conversion (if enabled and supported)
-        if use_blender and self._can_use_blender(input_path):
-            try:
-                if self.debug:
-                    print("Attempting Blender conversion...")
-                if self.convert_with_blender(input_path, output_path, optimize_mesh=optimize_mesh, platform=platform):
-                    if self.debug:
-                        print("Blender conversion successful!")
+        # Malformed inputs fail here, before any backend is started
+        try:
+            self.check_input_schema(input_path)
+        except InputValidationError as e:
+            print(f"Error: {e}")
+            self.memory_profiler.end()
+            self.last_result = ConversionResult(input_path, output_path, platform, False,
+                                                timings={'schema': time.perf_counter() - start}, error=str(e))
+            self._emit_job_end(False, input_path, start, error=e)
+            return False
+        schema_time = time.perf_counter() - start
+        self.stage_timings['schema'] = schema_time
+        self.memory_profiler.stage('schema')
+        self.events.emit('stage', stage='schema', seconds=round(schema_time, 6))
+        
+        # Staged on the same filesystem as the output so publishing is a rename
+        staging_dir = Path(tempfile.mkdtemp(prefix=f".{output_path.stem}.", suffix=".staging", dir=output_dir))
+        success = False
+        published = []
+        error = None
+        try:
+            success = self._convert_with_fallbacks(
+                input_path, staging_dir / output_path.name, use_blender=use_blender,
+                optimize_mesh=optimize_mesh, generate_atlas=generate_atlas,
+                compress_textures=compress_textures, platform=platform)
+            if success:
+                published = self._publish_staged_outputs(staging_dir, output_dir)
+                self._cleanup_old_outputs(output_path, published, input_path)
+            return success
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            self.profiler.record('convert_file', start, time.perf_counter())
+            self.memory_profiler.stage('publish')
+            self.memory_profiler.end()
+            timings = {'schema': schema_time, 'conversion': time.perf_counter() - start}
+            if self.last_validation is not None:
+                timings['validation'] = sum(self.last_validation.timings.values())
+            self.last_result = ConversionResult(
+                input_path, output_path, platform, success, self.last_validation,
+                timings, self._last_conversion_stats, self.stage_timings,
+                error=f"{type(error).__name__}: {error}" if error is not None else None)
+            self._emit_job_end(success, input_path, start, published, error)
+    
+    def _emit_job_end(self, success: bool, input_path: Path, started: float,
+                      published: Optional[List[Path]] = None, error: Optional[Exception] = None):
+        """Emit the validation warnings and the closing job_end event of the current job"""
+        if not self.events.enabled:
+            return
+        report = self.last_validation
+        if report is not None:
+            for issue in report.warnings:
+                self.events.emit('warning', code=issue.code, message=issue.message, pointer=issue.pointer)
+        self.events.emit(
+            'job_end', success=success, seconds=round(time.perf_counter() - started, 6),
+            input=str(input_path), backend=self._last_backend,
+            bytes_in=input_path.stat().st_size if input_path.is_file() else None,
+            bytes_out=sum(path.stat().st_size for path in published or [] if path.is_file()),
+            stages={stage: round(seconds, 6) for stage, seconds in self.stage_timings.items()},
+            validation_errors=len(report.errors) if report is not None else None,
+            validation_warnings=len(report.warnings) if report is not None else None,
+            error=f"{type(error).__name__}: {error}" if error is not None else None)
+        self.events.job = None
+    
+    def _record_stage(self, stage: str, started: float) -> float:
+        """Add the time since started to a pipeline stage and return the current time"""
+        now = time.perf_counter()
+        self.stage_timings[stage] = self.stage_timings.get(stage, 0.0) + now - started
+        self.profiler.record(f"stage:{stage}", started, now)
+        self.memory_profiler.stage(stage)
+        self.events.emit('stage', stage=stage, seconds=round(now - started, 6))
+        return now
+    
+    def _emit_backend(self, backend: str, outcome: str, started: Optional[float] = None,
+                      error: Optional[Exception] = None, finished: Optional[float] = None):
+        """Emit one backend attempt (outcome: success, failed, error, unavailable or cancelled)"""
+        if outcome == 'success':
+            self._last_backend = backend
+        finished = finished if finished is not None else time.perf_counter()
+        self.events.emit('backend', backend=backend, outcome=outcome,
+                         seconds=round(finished - started, 6) if started is not None else None,
+                         error=f"{type(error).__name__}: {error}" if error is not None else None)
+    
+    @traced()
+    def _convert_with_fallbacks(self, input_path: Path, output_path: Path, use_blender: bool = True,
+                                optimize_mesh: bool = False, generate_atlas: bool = False,
+                                compress_textures: bool = False, platform: str = "unity") -> bool:
+        """
+        Run the backends of self.backends in order of preference until one
+        succeeds. With optimization_settings['race_backends'] the preferred
+        out-of-process backend (Blender) first races the cheapest in-process
+        one (the basic converter), and the rest follow only if both fail.
+        Errors of the final fallback are raised, the others' are reported.
+        """
+        options = {'use_blender': use_blender, 'optimize_mesh': optimize_mesh, 'generate_atlas': generate_atlas,
+                   'compress_textures': compress_textures, 'platform': platform}
+        registered = list(self.backends)
+        pending = [backend for backend in registered if backend.enabled(options)]
+        error = None
+        
+        if self.optimization_settings.get('race_backends'):
+            pair = race_pair([backend for backend in pending if backend.available(self, input_path, options)])
+            if pair is not None:
+                winner, error = self._race_backends(pair[0], pair[1], input_path, output_path, options)
+                if winner is not None:
                     return True
-                else:
-                    print("Blender conversion failed. Trying Assimp...")
-            except Exception as e:
-                if self.debug:
-                    print(f"Blender conversion failed with error: {e}")
-                print("Blender conversion failed. Trying Assimp...")
+                pending = [backend for backend in pending if backend not in pair]
         
-        # Step 2: Try Assimp conversion (if available)
-        if self._can_use_assimp():
+        for index, backend in enumerate(pending):
+            following = pending[index + 1] if index + 1 < len(pending) else None
+            next_step = f" Trying {following.label}..." if following is not None else ""
+            if not backend.available(self, input_path, options):
+                self._emit_backend(backend.name, 'unavailable')
+                print(f"Skipping {backend.label}: not available.{next_step}")
+                continue
+            
+            started = time.perf_counter()
             try:
                 if self.debug:
-                    print("Attempting Assimp conversion...")
-                if self.convert_with_assimp(input_path, output_path, platform=platform):
+                    print(f"Attempting conversion with {backend.label}...")
+                if backend.convert(self, input_path, output_path, options, backend.timeout, None):
                     if self.debug:
-                        print("Assimp conversion successful!")
+                        print(f"Conversion with {backend.label} successful!")
+                    self._emit_backend(backend.name, 'success', started)
                     return True
-                else:
-                    print("Assimp conversion failed. Trying Trimesh...")
+                self._emit_backend(backend.name, 'failed', started)
             except Exception as e:
+                self._emit_backend(backend.name, 'error', started, e)
+                if backend is registered[-1]:
+                    raise
                 if self.debug:
-                    print(f"Assimp conversion failed with error: {e}")
-                print("Assimp conversion failed. Trying Trimesh...")
-        else:
-            print("Assimp not available (missing C++ library). Trying Trimesh...")
+                    print(f"Conversion with {backend.label} failed with error: {e}")
+            print(f"Conversion with {backend.label} failed.{next_step}")
         
-        # Step 3: Try Trimesh conversion (if available)
-        if self._can_use_trimesh():
+        # The raced fallback failed with an error and nothing after it succeeded
+        if error is not None:
+            raise error
+        return False
+    
+    def _race_backends(self, slow, fast, input_path: Path, output_path: Path, options: Dict) -> Tuple[Optional[str], Optional[Exception]]:
+        """
+        Run an out-of-process backend in a worker thread, writing into a
+        private directory, while an in-process backend runs here. The first
+        valid result wins: a losing subprocess is killed, a losing in-process
+        result is discarded. Returns the winner's name (None if both failed)
+        and the in-process backend's error, if it raised one.
+        """
+        staging_dir = output_path.parent
+        race_dir = Path(tempfile.mkdtemp(prefix=f".{slow.name}.", suffix=".race", dir=staging_dir))
+        race_output = race_dir / output_path.name
+        cancel = threading.Event()
+        slow_result = {'outcome': 'failed', 'error': None, 'finished': None}
+        
+        def run_slow():
             try:
-                if self.debug:
-                    print("Attempting Trimesh conversion...")
-                if self.convert_with_trimesh(input_path, output_path, platform=platform):
-                    if self.debug:
-                        print("Trimesh conversion successful!")
-                    return True
-                else:
-                    print("Trimesh conversion failed. Using basic converter...")
+                if slow.convert(self, input_path, race_output, options, slow.timeout, cancel) and self._valid_race_output(race_output):
+                    slow_result['outcome'] = 'success'
+            except BackendCancelled:
+                slow_result['outcome'] = 'cancelled'
             except Exception as e:
-                if self.debug:
-                    print(f"Trimesh conversion failed with error: {e}")
-                print("Trimesh conversion failed. Using basic converter...")
-        else:
-            print("Trimesh not available. Using basic converter...")
+                slow_result.update(outcome='error', error=e)
+            slow_result['finished'] = time.perf_counter()
         
-        # Step 4: Final fallback to basic converter
-        print("All advanced converters failed. Using basic converter.")
-        return self.convert_gltf_json(input_path, output_path, generate_atlas=generate_atlas, compress_textures=compress_textures, platform=platform)
+        if self.debug:
+            print(f"Racing {slow.label} against {fast.label}...")
+        slow_started = time.perf_counter()
+        worker = threading.Thread(target=run_slow, name=f"voxbridge-{slow.name}", daemon=True)
+        worker.start()
+        try:
+            fast_ok, fast_error = False, None
+            fast_started = time.perf_counter()
+            try:
+                fast_ok = bool(fast.convert(self, input_path, output_path, options, fast.timeout, None))
+            except Exception as e:
+                fast_error = e
+            fast_finished = time.perf_counter()
+            if fast_ok:
+                cancel.set()
+            worker.join()
+            
+            slow_ok = slow_result['outcome'] == 'success'
+            slow_won = slow_ok and (not fast_ok or slow_result['finished'] < fast_finished)
+            fast_won = fast_ok and not slow_won
+            
+            if fast_error is not None:
+                self._emit_backend(fast.name, 'error', fast_started, fast_error, fast_finished)
+            else:
+                self._emit_backend(fast.name, 'success' if fast_won else 'cancelled' if fast_ok else 'failed',
+                                   fast_started, finished=fast_finished)
+            self._emit_backend(slow.name, 'success' if slow_won else 'cancelled' if slow_ok else slow_result['outcome'],
+                               slow_started, slow_result['error'], slow_result['finished'])
+            
+            if slow_won:
+                # The in-process result lost: drop its files and everything it recorded about the output
+                for path in staging_dir.iterdir():
+                    if path == race_dir:
+                        continue
+                    if path.is_dir():
+                        shutil.rmtree(path)
+                    else:
+                        path.unlink()
+                for path in race_dir.iterdir():
+                    os.replace(path, staging_dir / path.name)
+                self.last_validation = None
+                self._last_conversion_stats = {}
+                self._staged_members = {}
+                self._generated_files = set()
+            if slow_won or fast_won:
+                winner = slow if slow_won else fast
+                print(f"Race won by {winner.label}.")
+                return winner.name, None
+            print(f"Conversion with {slow.label} and {fast.label} failed.")
+            return None, fast_error
+        finally:
+            cancel.set()
+            worker.join()
+            shutil.rmtree(race_dir, ignore_errors=True)
     
-    def convert_with_blender(self, input_path: Path, output_path: Path, optimize_mesh: bool = False, platform: str = "unity") -> bool:
-        """Convert using Blender Python script with platform-specific settings"""
-        blender_exe = self.find_blender()
+    def _valid_race_output(self, output_path: Path) -> bool:
+        """A raced backend's output counts only if it exists and parses"""
+        stats = self.validate_output(output_path)
+        return stats['file_exists'] and 'error' not in stats
+    
+    @traced('backend:blender')
+    def convert_with_blender(self, input_path: Path, output_path: Path, optimize_mesh: bool = False, platform: str = "unity",
+                             timeout: Optional[float] = 120.0, cancel: Optional[threading.Event] = None) -> bool:
+        """
+        Convert using Blender Python script with platform-specific settings.
+        timeout bounds every Blender process of the conversion together,
+        including the numpy setup; setting cancel kills the running one.
+        """
+        deadline = Deadline(timeout)
+        blender_exe = self.capabilities.path('blender')
         if not blender_exe:
             if self.debug:
                 print("Blender not found, using basic conversion...")
@@ -1196,7 +1321,7 @@ class VoxBridgeConverter:
                 "--python-expr",
                 "import ensurepip; ensurepip.bootstrap()"
             ]
-            subprocess.run(pip_check_cmd, capture_output=True, text=True, timeout=30)
+            run_process(pip_check_cmd, timeout=deadline.remaining(30), cancel=cancel)
             
             # Then try to install numpy
             numpy_install_cmd = [
@@ -1205,7 +1330,7 @@ class VoxBridgeConverter:
                 "--python-expr",
                 "import subprocess; import sys; subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'numpy'])"
             ]
-            result = subprocess.run(numpy_install_cmd, capture_output=True, text=True, timeout=60)
+            result = run_process(numpy_install_cmd, timeout=deadline.remaining(60), cancel=cancel)
             if result.returncode == 0:
                 if self.debug:
                     print("Numpy installed successfully in Blender's Python environment")
@@ -1232,7 +1357,7 @@ class VoxBridgeConverter:
         try:
             if self.debug:
                 print("Running Blender conversion...")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = run_process(cmd, timeout=deadline.remaining(), cancel=cancel)
             
             if result.returncode == 0:
                 if self.debug:
@@ -1264,8 +1389,10 @@ class VoxBridgeConverter:
                 
         except subprocess.TimeoutExpired:
             if self.debug:
-                print("Blender processing timed out (120s). Using basic conversion...")
+                print(f"Blender processing timed out ({timeout:g}s). Using basic conversion...")
             return False
+        except BackendCancelled:
+            raise
         except Exception as e:
             if self.debug:
                 print(f"Blender execution failed: {e}. Using basic conversion...")
@@ -1273,6 +1400,7 @@ class VoxBridgeConverter:
         
         return False  # Fallback return
     
+    @traced('backend:python')
     def convert_gltf_json(self, input_path: Path, output_path: Path, generate_atlas: bool = False,
                           compress_textures: bool = False, platform: str = "unity") -> bool:
         """Convert glTF JSON data to output format with platform-specific optimizations"""
@@ -1281,11 +1409,21 @@ class VoxBridgeConverter:
             input_path = Path(input_path)
             output_path = Path(output_path)
             
-            # Get the cleaned glTF data first
-            gltf_data, changes = self.clean_gltf_json(input_path, output_path)
+            # Get the cleaned glTF data first; the extracted .bin only touches disk
+            # when an external validator has to read it
+            self._staged_members = {}
+            self._generated_files = set()
+            stage_start = time.perf_counter()
+            # Anything left over from backends tried before this one is not charged to parsing
+            self.memory_profiler.stage('backend selection')
+            gltf_data, changes = self.clean_gltf_json(
+                input_path, output_path, stage_binary=not self._external_validators_available())
+            stage_start = self._record_stage('parse', stage_start)
             
             # Store changes for reporting
             self.last_changes = changes
+            if self.platform_manager:
+                self.platform_manager.set_external_validation(self.optimization_settings.get('external_validation', False))
             
             # Apply platform-specific material optimizations
             material_changes = self.map_materials(gltf_data, platform)
@@ -1299,38 +1437,35 @@ class VoxBridgeConverter:
             if self.optimization_settings.get('mesh_optimization', False):
                 for mesh in gltf_data.get('meshes', []):
                     mesh = self.optimize_mesh(mesh, self.optimization_settings.get('polygon_reduction', 0.3))
+            stage_start = self._record_stage('mesh', stage_start)
+            
+            # Move textures into the batch-wide shared atlas when one was prepared
+            if self.shared_atlas and TEXTURE_OPTIMIZATION_AVAILABLE:
+                self.last_changes.extend(self._apply_shared_atlas(gltf_data, input_path, output_path))
             
-            # Apply platform-specific texture optimizations
-            texture_changes = self.optimize_textures_for_platform(gltf_data, platform, input_path.parent)
+            # Apply platform-specific texture optimizations to copies, never to the input's textures
+            texture_dir = self._stage_input_textures(gltf_data, input_path.parent, output_path.parent)
+            texture_changes = self.optimize_textures_for_platform(gltf_data, platform, texture_dir)
             self.last_changes.extend(texture_changes)
             
-            # Validate and fix accessor counts before writing the file
+            # Merge duplicate textures before atlasing and packaging
+            if TEXTURE_OPTIMIZATION_AVAILABLE and self.optimization_settings.get('texture_dedup', False):
+                with self.profiler.span('deduplicate_textures'):
+                    dropped = deduplicate_textures(gltf_data, texture_dir)
+                for uri in dropped:
+                    self.last_changes.append(f"Removed duplicate texture: {uri}")
+            stage_start = self._record_stage('texture', stage_start)
+            
+            # Check accessors against the buffer data before writing the file:
+            # counts, offsets and strides (Sketchfab errors 13/23) and POSITION bounds
+            with self.profiler.span('repair_accessors'):
+                buffers = self._load_output_buffers(gltf_data, [output_path.parent, input_path.parent])
+                accessor_changes = repair_accessors(gltf_data, buffers)
+            self.last_changes.extend(accessor_changes)
             if self.debug:
-                print("Final accessor validation before writing GLTF...")
-                print(f"gltf_data keys: {list(gltf_data.keys())}")
-                if 'accessors' in gltf_data:
-                    print(f"Number of accessors: {len(gltf_data['accessors'])}")
-                    for i, accessor in enumerate(gltf_data['accessors'][:3]):  # Show first 3 accessors
-                        print(f"Accessor {i}: {accessor}")
-            if 'accessors' in gltf_data:
-                for i, accessor in enumerate(gltf_data['accessors']):
-                    if 'bufferView' in accessor and 'count' in accessor:
-                        buffer_view_idx = accessor['bufferView']
-                        if buffer_view_idx < len(gltf_data['bufferViews']):
-                            buffer_view = gltf_data['bufferViews'][buffer_view_idx]
-                            if 'byteLength' in buffer_view:
-                                # Calculate correct count based on component type and size
-                                component_type_size = self._get_component_type_size(accessor.get('componentType', 5126))
-                                type_num_components = self._get_type_num_components(accessor.get('type', 'FLOAT'))
-                                
-                                if component_type_size > 0 and type_num_components > 0:
-                                    max_count = buffer_view['byteLength'] // (component_type_size * type_num_components)
-                                    if accessor['count'] > max_count:
-                                        if self.debug:
-                                            print(f"Final fix: accessor {i}: count {accessor['count']} -> {max_count}")
-                                        accessor['count'] = max_count
-                                        if self.debug:
-                                            print(f"Updated accessor {i} count to {accessor['count']}")
+                for change in accessor_changes:
+                    print(f"  {change}")
+            stage_start = self._record_stage('mesh', stage_start)
             
             # Apply platform-specific optimizations if available
             if self.platform_manager:
@@ -1338,12 +1473,16 @@ class VoxBridgeConverter:
                     print(f"Applying {platform} platform profile...")
                 
                 # Apply platform profile optimizations
-                gltf_data = self.platform_manager.apply_profile(gltf_data, output_path, platform)
+                with self.profiler.span('apply_profile'):
+                    gltf_data = self.platform_manager.apply_profile(gltf_data, output_path, platform)
                 
                 # Create platform-specific output files
-                platform_outputs = self.platform_manager.create_platform_specific_outputs(
-                    gltf_data, output_path, platform
-                )
+                with self.profiler.span('create_platform_specific_outputs'):
+                    platform_outputs = self.platform_manager.create_platform_specific_outputs(
+                        gltf_data, output_path, platform,
+                        sort_keys=self.optimization_settings.get('deterministic', False),
+                        validate=False
+                    )
                 
                 if self.debug:
                     print(f"Created {len(platform_outputs)} platform-specific outputs")
@@ -1357,10 +1496,11 @@ class VoxBridgeConverter:
                 # Fallback to basic GLTF output
                 gltf_output = output_path.with_suffix('.gltf')
                 with open(gltf_output, 'w', encoding='utf-8') as f:
-                    json.dump(gltf_data, f, indent=2)
+                    json.dump(gltf_data, f, indent=2, sort_keys=self.optimization_settings.get('deterministic', False))
             
             if self.debug:
                 print(f"Saved as GLTF: {gltf_output}")
+            stage_start = self._record_stage('write', stage_start)
 
             # Generate texture atlas if optimization is enabled and textures exist
             if TEXTURE_OPTIMIZATION_AVAILABLE and self._should_generate_atlas(gltf_data):
@@ -1371,68 +1511,39 @@ class VoxBridgeConverter:
             # Apply comprehensive texture optimizations
             if TEXTURE_OPTIMIZATION_AVAILABLE:
                 self.apply_texture_optimizations(gltf_output, platform)
+                self._optimize_png_files(gltf_output)
+            stage_start = self._record_stage('texture', stage_start)
 
-            # Run platform-specific validation
-            if self.platform_manager:
-                is_valid, validation_messages = self.platform_manager.validate_output(gltf_output, platform)
-                if self.debug:
-                    if is_valid:
-                        print(f"{platform.capitalize()} validation passed")
-                    else:
-                        print(f"{platform.capitalize()} validation issues:")
-                        for msg in validation_messages:
-                            print(f"  - {msg}")
-            
-            # Run automatic validation
-            self._run_validation(gltf_output)
+            # Run automatic validation (structure and platform rules in one pass)
+            self._run_validation(gltf_output, input_path, platform)
+            stage_start = self._record_stage('validate', stage_start)
             
             # Capture conversion statistics for summary
             if gltf_output.exists():
-                try:
-                    # Read the final GLTF file to get accurate statistics
-                    with open(gltf_output, 'r', encoding='utf-8') as f:
-                        final_gltf_data = json.load(f)
-                    
-                    # Store statistics for summary display
-                    self._last_conversion_stats = {
-                        'meshes': len(final_gltf_data.get('meshes', [])),
-                        'materials': len(final_gltf_data.get('materials', [])),
-                        'textures': len(final_gltf_data.get('textures', [])),
-                        'nodes': len(final_gltf_data.get('nodes', [])),
-                        'file_size': gltf_output.stat().st_size
-                    }
-                    
-                    if self.debug:
-                        print(f"Captured conversion stats: {self._last_conversion_stats}")
-                        
-                except Exception as e:
-                    if self.debug:
-                        print(f"Warning: Could not capture conversion stats: {e}")
-                    # Fallback to basic stats
-                    self._last_conversion_stats = {
-                        'meshes': len(gltf_data.get('meshes', [])),
-                        'materials': len(gltf_data.get('materials', [])),
-                        'textures': len(gltf_data.get('textures', [])),
-                        'nodes': len(gltf_data.get('nodes', [])),
-                        'file_size': 0
-                    }
+                self._capture_conversion_stats(gltf_output, input_path, gltf_data)
+            stage_start = self._record_stage('stats', stage_start)
             
             # Package output files into ZIP
             if gltf_output.exists():
-                zip_path = self._package_output_files(output_path, gltf_output)
+                self._generated_files.add(gltf_output)
+                zip_path = self._package_output_files(output_path, gltf_output, input_path)
+                stage_start = self._record_stage('package', stage_start)
                 if zip_path.suffix == '.zip':
                     print(f"Conversion complete. Your files are packaged into {zip_path.name}")
                 else:
                     print(f"Conversion complete. Output saved as {gltf_output.name}")
                 
                 # Track benchmark metrics if available
-                if self.benchmark and BENCHMARK_AVAILABLE:
+                if self.benchmark and BENCHMARK_AVAILABLE and self.detailed_stats:
                     try:
                         # Measure original input stats
                         original_stats = self.benchmark.measure_model_stats(input_path)
                         
-                        # Measure optimized output stats
-                        optimized_stats = self.benchmark.measure_model_stats(gltf_output)
+                        # Optimized output stats were captured before packaging removed the file
+                        if 'triangles' in self._last_conversion_stats:
+                            optimized_stats = self.benchmark.summarize_stats(self._last_conversion_stats)
+                        else:
+                            optimized_stats = self.benchmark.measure_model_stats(gltf_output)
                         
                         # Store benchmark data
                         asset_name = input_path.stem
@@ -1449,6 +1560,7 @@ class VoxBridgeConverter:
                     except Exception as e:
                         if self.debug:
                             print(f"Warning: Benchmark tracking failed: {e}")
+                    self.memory_profiler.stage('benchmark')
             
             return True
                 
@@ -1459,88 +1571,7 @@ class VoxBridgeConverter:
                 traceback.print_exc()
             return False
 
-    def optimize_meshes_for_platform(self, gltf_data: Dict, platform: str) -> List[str]:
-        """Apply platform-specific mesh optimizations"""
-        changes = []
-        
-        if 'meshes' not in gltf_data:
-            return changes
-            
-        for i, mesh in enumerate(gltf_data['meshes']):
-            if 'primitives' in mesh:
-                for j, primitive in enumerate(mesh['primitives']):
-                    # Ensure proper attributes for platform
-                    if 'attributes' in primitive:
-                        attributes = primitive['attributes']
-                        
-                        # Unity: Ensure TANGENT attribute for normal mapping
-                        if platform == "unity":
-                            if 'TANGENT' not in attributes and 'NORMAL' in attributes:
-                                # Add tangent attribute if missing
-                                changes.append(f"Added TANGENT attribute for Unity compatibility: Mesh {i}, Primitive {j}")
-                        
-                        # Roblox: Ensure proper UV coordinates
-                        if platform == "roblox":
-                            if 'TEXCOORD_0' not in attributes:
-                                changes.append(f"Warning: Missing UV coordinates for Roblox: Mesh {i}, Primitive {j}")
-                        
-                        # Both platforms: Ensure proper vertex count limits
-                        if 'POSITION' in attributes:
-                            pos_accessor_idx = attributes['POSITION']
-                            if pos_accessor_idx < len(gltf_data.get('accessors', [])):
-                                accessor = gltf_data['accessors'][pos_accessor_idx]
-                                if 'count' in accessor:
-                                    vertex_count = accessor['count']
-                                    if platform == "roblox" and vertex_count > 10000:
-                                        changes.append(f"Warning: High vertex count ({vertex_count}) for Roblox: Mesh {i}")
-                                    elif platform == "unity" and vertex_count > 50000:
-                                        changes.append(f"Warning: High vertex count ({vertex_count}) for Unity: Mesh {i}")
-        
-        return changes
-    
-    def optimize_textures_for_platform(self, gltf_data: Dict, platform: str, base_path: Path) -> List[str]:
-        """Apply platform-specific texture optimizations"""
-        changes = []
-        
-        if 'images' not in gltf_data:
-            return changes
-            
-        for i, image in enumerate(gltf_data['images']):
-            if 'uri' in image and image['uri']:
-                image_path = base_path / image['uri']
-                if image_path.exists():
-                    # Roblox: Limit texture resolution to 1024x1024
-                    if platform == "roblox":
-                        try:
-                            from PIL import Image
-                            with Image.open(image_path) as img:
-                                if max(img.size) > 1024:
-                                    # Resize texture for Roblox
-                                    img.thumbnail((1024, 1024), Image.Resampling.LANCZOS)
-                                    img.save(image_path)
-                                    changes.append(f"Resized texture for Roblox: {image['uri']} -> 1024x1024")
-                        except ImportError:
-                            changes.append(f"PIL not available for texture optimization: {image['uri']}")
-                        except Exception as e:
-                            changes.append(f"Texture optimization failed: {image['uri']}: {e}")
-                    
-                    # Unity: Ensure proper texture format
-                    elif platform == "unity":
-                        try:
-                            from PIL import Image
-                            with Image.open(image_path) as img:
-                                # Convert to RGBA if needed for Unity
-                                if img.mode != 'RGBA':
-                                    img = img.convert('RGBA')
-                                    img.save(image_path)
-                                    changes.append(f"Converted texture to RGBA for Unity: {image['uri']}")
-                        except ImportError:
-                            pass  # PIL not available, skip optimization
-                        except Exception as e:
-                            changes.append(f"Texture optimization failed: {image['uri']}: {e}")
-        
-        return changes
-
+    @traced()
     def map_materials(self, gltf_data: Dict, platform: str = "unity") -> List[str]:
         """
         Enhanced material mapping for Unity/Roblox compatibility.
@@ -1651,62 +1682,37 @@ class VoxBridgeConverter:
     def create_platform_package(self, gltf_path: Path, platform: str) -> bool:
         """Create a platform-specific ZIP package with all necessary files"""
         try:
-            import zipfile
-            
             # Create ZIP with platform-specific naming
             zip_path = gltf_path.parent / f"{gltf_path.stem}_{platform}_package.zip"
             
-            # Find all associated files to include in the ZIP
-            files_to_zip = []
-            
-            # Add GLTF file
-            files_to_zip.append((gltf_path, gltf_path.name))
-            
-            # Look for .bin files and include them
-            for bin_file in gltf_path.parent.glob("*.bin"):
-                # Only include the specific binary file for this conversion
-                if bin_file.name == f"{gltf_path.stem}.bin":
-                    files_to_zip.append((bin_file, bin_file.name))
-            
-            # Look for texture files and include them
-            texture_exts = ['.png', '.jpg', '.jpeg', '.tga', '.bmp']
-            for texture_file in gltf_path.parent.glob("*"):
-                if texture_file.suffix.lower() in texture_exts:
-                    files_to_zip.append((texture_file, texture_file.name))
-            
-            # Create a license.txt file
-            license_path = gltf_path.parent / "license.txt"
-            with open(license_path, 'w') as f:
-                f.write("Creative Commons Attribution 4.0 International License\n")
-                f.write("https://creativecommons.org/licenses/by/4.0/\n")
-                f.write("\nModel created with VoxBridge converter.")
-            
-            files_to_zip.append((license_path, "license.txt"))
+            # Include the GLTF and exactly the files it references
+            with open(gltf_path, 'r', encoding='utf-8') as f:
+                gltf_data = json.load(f)
+            referenced, missing = collect_package_files(gltf_data, [gltf_path.parent])
+            if missing and self.debug:
+                print(f"Warning: Referenced files not found for packaging: {missing}")
+            files_to_zip = [(gltf_path, gltf_path.name)] + referenced
             
-            # Create metadata file
+            # Create metadata (license and metadata are written straight into the ZIP)
             metadata = {
                 "original_source_format": "GLB",
                 "target_platform": platform,
-                "export_date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "export_date": self._export_timestamp(),
                 "tool_version": "1.0.7",
                 "platform_specific_notes": self._get_platform_notes(platform),
-                "files_included": [name for _, name in files_to_zip]
+                "files_included": [name for _, name in files_to_zip] + ["license.txt", "metadata.json"]
             }
             
-            metadata_path = gltf_path.parent / "metadata.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            
-            files_to_zip.append((metadata_path, "metadata.json"))
-            
             # Create ZIP package
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            with PackageWriter(zip_path, **self._package_options()) as package:
                 for file_path, zip_name in files_to_zip:
-                    zipf.write(file_path, zip_name)
+                    package.write_file(file_path, zip_name)
+                package.write_bytes("license.txt", PACKAGE_LICENSE_TEXT.encode('utf-8'))
+                package.write_json("metadata.json", metadata)
             
             if self.debug:
                 print(f"Created {platform} package: {zip_path}")
-                print(f"Files included: {[name for _, name in files_to_zip]}")
+                print(f"Files included: {package.members}")
                 print(f"This package is ready for {platform}")
             
             return True
@@ -1725,6 +1731,7 @@ class VoxBridgeConverter:
         else:
             return "Generic optimization applied"
     
+    @traced()
     def optimize_meshes_for_platform(self, gltf_data: Dict, platform: str) -> List[str]:
         """Apply platform-specific mesh optimizations"""
         changes = []
@@ -1764,6 +1771,7 @@ class VoxBridgeConverter:
         
         return changes
     
+    @traced()
     def optimize_textures_for_platform(self, gltf_data: Dict, platform: str, base_path: Path) -> List[str]:
         """Apply platform-specific texture optimizations"""
         changes = []
@@ -1775,8 +1783,9 @@ class VoxBridgeConverter:
             if 'uri' in image and image['uri']:
                 image_path = base_path / image['uri']
                 if image_path.exists():
-                    # Roblox: Limit texture resolution to 1024x1024
-                    if platform == "roblox":
+                    # Roblox: Limit texture resolution to 1024x1024 (header probe skips textures already in range)
+                    info = probe_image(image_path) if platform == "roblox" else None
+                    if platform == "roblox" and (info is None or max(info.width, info.height) > 1024):
                         try:
                             from PIL import Image
                             with Image.open(image_path) as img:
@@ -1790,13 +1799,24 @@ class VoxBridgeConverter:
                         except Exception as e:
                             changes.append(f"Texture optimization failed: {image['uri']}: {e}")
                     
-                    # Unity: Ensure proper texture format
-                    elif platform == "unity":
+                    # Both platforms: Store low-color textures as indexed PNG (lossless)
+                    quantized = False
+                    if TEXTURE_OPTIMIZATION_AVAILABLE and self.optimization_settings.get('palette_quantization', False):
+                        try:
+                            quantized = quantize_to_palette(str(image_path))
+                            if quantized:
+                                changes.append(f"Converted texture to indexed PNG: {image['uri']}")
+                        except Exception as e:
+                            changes.append(f"Palette quantization failed: {image['uri']}: {e}")
+                    
+                    # Unity: Ensure proper texture format (indexed PNGs import as RGBA)
+                    if platform == "unity" and not quantized:
                         try:
                             from PIL import Image
                             with Image.open(image_path) as img:
                                 # Convert to RGBA if needed for Unity
-                                if img.mode != 'RGBA':
+                                keep_indexed = img.mode == 'P' and self.optimization_settings.get('palette_quantization', False)
+                                if img.mode != 'RGBA' and not keep_indexed:
                                     img = img.convert('RGBA')
                                     img.save(image_path)
                                     changes.append(f"Converted texture to RGBA for Unity: {image['uri']}")
@@ -1827,7 +1847,7 @@ class VoxBridgeConverter:
                 f.write(f"Input file: {input_path.name}\n")
                 f.write(f"Output file: {output_path.name}\n")
                 f.write(f"Target platform: {platform}\n")
-                f.write(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                f.write(f"Generated: {self._export_timestamp()}\n\n")
                 f.write("Files included:\n")
                 f.write(f"- {output_path.name} (main model file)\n")
                 
@@ -1939,7 +1959,7 @@ class VoxBridgeConverter:
                 
                 # Write the clean glTF file
                 with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(gltf_data, f, indent=2)
+                    json.dump(gltf_data, f, indent=2, sort_keys=self.optimization_settings.get('deterministic', False))
             
             if self.debug:
                 print(f"Created Sketchfab-optimized GLTF: {output_path}")
@@ -1947,7 +1967,7 @@ class VoxBridgeConverter:
                 print(f"This file is optimized for Sketchfab and other web platforms")
             
             # Create ZIP package for Sketchfab (like the working example)
-            self._create_sketchfab_package(output_path)
+            self._create_sketchfab_package(output_path, input_path)
             
             return True
             
@@ -1956,49 +1976,30 @@ class VoxBridgeConverter:
                 print(f"Failed to create Sketchfab GLTF: {e}")
             return False
     
-    def _create_sketchfab_package(self, gltf_path: Path) -> bool:
+    def _create_sketchfab_package(self, gltf_path: Path, input_path: Optional[Path] = None) -> bool:
         """Create a ZIP package for Sketchfab with GLTF and binary files (using actual filenames)"""
         try:
-            import zipfile
-            
             # Create ZIP with the actual output filename
             zip_path = gltf_path.parent / f"{gltf_path.stem}.zip"
             
-            # Find all associated files to include in the ZIP
-            files_to_zip = []
-            
-            # Add GLTF file (keep original name in ZIP)
-            files_to_zip.append((gltf_path, gltf_path.name))
-            
-            # Look for .bin files and include them with their original names
-            for bin_file in gltf_path.parent.glob("*.bin"):
-                # Include any .bin file that might be referenced by the GLTF
-                files_to_zip.append((bin_file, bin_file.name))
-            
-            # Look for texture files and include them
-            texture_exts = ['.png', '.jpg', '.jpeg', '.tga', '.bmp']
-            for texture_file in gltf_path.parent.glob("*"):
-                if texture_file.suffix.lower() in texture_exts:
-                    # Only include textures that are actually referenced in the GLTF
-                    files_to_zip.append((texture_file, texture_file.name))
-            
-            # Create a license.txt file
-            license_path = gltf_path.parent / "license.txt"
-            with open(license_path, 'w') as f:
-                f.write("Creative Commons Attribution 4.0 International License\n")
-                f.write("https://creativecommons.org/licenses/by/4.0/\n")
-                f.write("\nModel created with VoxBridge converter.")
-            
-            files_to_zip.append((license_path, "license.txt"))
-            
-            # Create ZIP package with proper file names
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # Include the GLTF (original name) and exactly the files it references
+            with open(gltf_path, 'r', encoding='utf-8') as f:
+                gltf_data = json.load(f)
+            search_dirs = [gltf_path.parent] + ([input_path.parent] if input_path else [])
+            referenced, missing = collect_package_files(gltf_data, search_dirs)
+            if missing and self.debug:
+                print(f"Warning: Referenced files not found for packaging: {missing}")
+            files_to_zip = [(gltf_path, gltf_path.name)] + referenced
+            
+            # Create ZIP package with proper file names (license is written straight into the ZIP)
+            with PackageWriter(zip_path, **self._package_options()) as package:
                 for file_path, zip_name in files_to_zip:
-                    zipf.write(file_path, zip_name)
+                    package.write_file(file_path, zip_name)
+                package.write_bytes("license.txt", PACKAGE_LICENSE_TEXT.encode('utf-8'))
             
             if self.debug:
                 print(f"Created Sketchfab package: {zip_path}")
-                print(f"Files included: {[name for _, name in files_to_zip]}")
+                print(f"Files included: {package.members}")
                 print(f"Upload this ZIP file to Sketchfab")
             
             return True
@@ -2022,31 +2023,6 @@ class VoxBridgeConverter:
         
         return image_paths
 
-    def _get_component_type_size(self, component_type: int) -> int:
-        """Get the size in bytes for a given component type"""
-        component_sizes = {
-            5120: 1,   # BYTE
-            5121: 1,   # UNSIGNED_BYTE
-            5122: 2,   # SHORT
-            5123: 2,   # UNSIGNED_SHORT
-            5125: 4,   # UNSIGNED_INT
-            5126: 4,   # FLOAT
-        }
-        return component_sizes.get(component_type, 4)
-    
-    def _get_type_num_components(self, type_name: str) -> int:
-        """Get the number of components for a given type"""
-        type_components = {
-            'SCALAR': 1,
-            'VEC2': 2,
-            'VEC3': 3,
-            'VEC4': 4,
-            'MAT2': 4,
-            'MAT3': 9,
-            'MAT4': 16,
-        }
-        return type_components.get(type_name, 1)
-    
     def _extract_binary_data(self, gltf, gltf_data: Dict) -> Dict[str, bytes]:
         """Extract binary buffer data from GLTF2 object"""
         binary_data = {}
@@ -2174,6 +2150,14 @@ class VoxBridgeConverter:
         Returns:
             Dictionary containing the performance report
         """
+        input_stats = {}
+        try:
+            if input_path.suffix.lower() in ('.gltf', '.glb') and input_path.exists():
+                input_stats = compute_file_stats(input_path)
+        except Exception as e:
+            if self.debug:
+                print(f"Warning: Could not measure input stats: {e}")
+        
         report = {
             "input_file": str(input_path),
             "output_file": str(output_path),
@@ -2182,15 +2166,21 @@ class VoxBridgeConverter:
             "file_size_before": input_path.stat().st_size if input_path.exists() else 0,
             "file_size_after": stats.get('file_size', 0),
             "size_reduction_percent": 0,
-            "triangles_before": None,  # Will be estimated or set by user
-            "triangles_after": None,   # Will be estimated or set by user
+            "triangles_before": input_stats.get('triangles'),
+            "triangles_after": stats.get('triangles'),
+            "vertices": stats.get('vertices'),
+            "unique_vertices": stats.get('unique_vertices'),
+            "draw_calls": stats.get('draw_calls'),
+            "texture_memory": stats.get('texture_memory'),
+            "buffer_bytes": stats.get('buffer_bytes', {}),
             "textures": stats.get('textures', 0),
-            "texture_resolution": "Unknown",
+            "texture_resolution": self._describe_texture_resolution(output_path),
             "meshes": stats.get('meshes', 0),
             "materials": stats.get('materials', 0),
             "nodes": stats.get('nodes', 0),
             "platform": "unity",  # Default, will be set by CLI
             "optimizations_applied": [],
+            "validation": self.last_validation.to_dict() if self.last_validation else None,
             "warnings": [],
             "notes": []
         }
@@ -2205,6 +2195,10 @@ class VoxBridgeConverter:
         if changes:
             report["optimizations_applied"] = changes
         
+        # Per-stage tracemalloc results of the last conversion (--memprofile)
+        if self.memory_profiler.enabled:
+            report["memory_profile"] = self.memory_profiler.report()
+        
         # Add warnings based on stats
         if stats.get('file_size', 0) > 50 * 1024 * 1024:  # 50MB
             report["warnings"].append("Large file size (>50MB) - consider further optimization")
@@ -2224,17 +2218,55 @@ class VoxBridgeConverter:
         
         return report
     
-    def save_performance_report(self, report: Dict, output_dir: Path) -> Path:
+    def _describe_texture_resolution(self, output_path: Path) -> str:
+        """Largest texture size referenced by a .gltf output (or the .gltf inside a ZIP package)"""
+        try:
+            infos = []
+            if output_path.suffix.lower() == '.zip' and output_path.exists():
+                with zipfile.ZipFile(output_path) as zipf:
+                    members = set(zipf.namelist())
+                    gltf_name = next((n for n in sorted(members) if n.endswith('.gltf')), None)
+                    if gltf_name is None:
+                        return "Unknown"
+                    gltf_data = json.loads(zipf.read(gltf_name))
+                    for image in gltf_data.get('images', []):
+                        if image.get('uri') in members:
+                            with zipf.open(image['uri']) as member:
+                                infos.append(probe_stream(member))
+            elif output_path.suffix.lower() == '.gltf' and output_path.exists():
+                with open(output_path, 'r', encoding='utf-8') as f:
+                    gltf_data = json.load(f)
+                for image in gltf_data.get('images', []):
+                    if image.get('uri') and not image['uri'].startswith(('http://', 'https://', 'data:')):
+                        infos.append(probe_image(output_path.parent / image['uri']))
+            
+            infos = [info for info in infos if info is not None]
+            if not infos:
+                return "Unknown"
+            largest = max(infos, key=lambda info: info.width * info.height)
+            return f"{largest.width}x{largest.height}"
+        except Exception as e:
+            if self.debug:
+                print(f"Warning: Could not probe texture resolution: {e}")
+            return "Unknown"
+    
+    def save_performance_report(self, report: Dict, output_dir: Path,
+                                filename: str = "performance_report.json") -> Path:
         """
         Save the performance report to a JSON file.
         Args:
             report: Performance report dictionary
             output_dir: Directory to save the report
+            filename: Report file name (batch runs use one per asset)
         Returns:
             Path to the saved report file
         """
         output_dir.mkdir(parents=True, exist_ok=True)
-        report_path = output_dir / "performance_report.json"
+        report_path = output_dir / filename
+        
+        if self.debug:
+            for error in check_report_schema(report):
+                print(f"Warning: performance report does not match its schema: {error}")
         
         with open(report_path, 'w', encoding='utf-8') as f:
             json.dump(report, f, indent=2)
@@ -2253,7 +2285,7 @@ class VoxBridgeConverter:
             # This prevents unnecessary .glb files and ensures clean output
             gltf_output = output_path.with_suffix('.gltf')
             with open(gltf_output, 'w', encoding='utf-8') as f:
-                json.dump(gltf_data, f, indent=2)
+                json.dump(gltf_data, f, indent=2, sort_keys=self.optimization_settings.get('deterministic', False))
             
             if self.debug:
                 print(f"Saved as GLTF: {gltf_output}")
@@ -2319,38 +2351,165 @@ class VoxBridgeConverter:
                         if self.debug:
                             print(f"Warning: Accessor references invalid buffer view index: {buffer_view_index}")
 
-    def _cleanup_old_outputs(self, output_path: Path):
-        """Clean up old output files to prevent duplicates and accumulation"""
-        try:
-            output_dir = output_path.parent
-            output_stem = output_path.stem
-            
-            # Remove old files with the same base name (but not the target file)
-            for old_file in output_dir.glob(f"{output_stem}*"):
-                if old_file != output_path:  # Don't delete the target file
+    @traced()
+    def _publish_staged_outputs(self, staging_dir: Path, output_dir: Path) -> List[Path]:
+        """Atomically move the finished artifacts of a conversion from its staging directory into place"""
+        files = sorted(path for path in staging_dir.rglob('*') if path.is_file())
+        if any(path.suffix.lower() == '.zip' and path.parent == staging_dir for path in files):
+            # Packaged: leftover intermediates (texture copies, dropped duplicates) stay behind
+            files = [path for path in files if path not in self._generated_files]
+        
+        published = []
+        for path in files:
+            target = output_dir / path.relative_to(staging_dir)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, target)
+            published.append(target)
+            if self.debug:
+                print(f"Published: {target}")
+        return published
+
+    @traced()
+    def _cleanup_old_outputs(self, output_path: Path, published: List[Path], input_path: Optional[Path] = None):
+        """
+        Remove this job's artifacts from a previous run that the new output
+        did not replace (e.g. loose .gltf/.bin files from a run that could not
+        be packaged). Only names this conversion itself produces are touched.
+        """
+        stem = output_path.stem
+        candidates = [f"{stem}.gltf", f"{stem}.bin", f"{stem}.zip", f"{stem}_atlas.png"]
+        candidates += [f"{stem}_{platform}.gltf" for platform in ('unity', 'roblox')]
+        keep = {path.resolve() for path in published}
+        if input_path is not None:
+            keep.add(Path(input_path).resolve())
+        
+        for name in candidates:
+            old_file = output_path.parent / name
+            try:
+                if old_file.is_file() and old_file.resolve() not in keep:
                     old_file.unlink()
                     if self.debug:
                         print(f"Cleaned up old file: {old_file.name}")
-            
-            # Remove any .glb files since we no longer generate them
-            for old_glb in output_dir.glob("*.glb"):
-                old_glb.unlink()
+            except OSError as e:
                 if self.debug:
-                    print(f"Cleaned up old GLB file: {old_glb.name}")
-                    
+                    print(f"Warning: Could not clean up {old_file.name}: {e}")
+
+    @traced()
+    def _run_validation(self, gltf_path: Path, input_path: Optional[Path] = None,
+                        platform: Optional[str] = None) -> bool:
+        """
+        Validate the generated GLTF once, in-process: structure, references,
+        accessor/bufferView ranges and URIs, then the platform profile rules
+        on the same parsed document. Buffers still held in memory are
+        validated from memory. The Node.js validator only runs as an extra
+        cross-check when 'external_validation' is enabled. The combined
+        report, with per-stage timings, is kept in self.last_validation.
+        """
+        try:
+            with open(gltf_path, 'r', encoding='utf-8') as f:
+                gltf_data = json.load(f)
+            search_dirs = self._resource_search_dirs(gltf_path, input_path)
+            
+            start = time.perf_counter()
+            buffers = self._load_output_buffers(gltf_data, search_dirs)
+            report = validate_document(gltf_data, buffers, search_dirs)
+            report.timings['structure'] = time.perf_counter() - start
+            
+            if platform and self.platform_manager:
+                start = time.perf_counter()
+                errors, warnings = self.platform_manager.check_gltf(gltf_data, platform)
+                report.extend(ERROR, 'PLATFORM_RULE', errors)
+                report.extend(WARNING, 'PLATFORM_RULE', warnings)
+                report.timings['platform'] = time.perf_counter() - start
+            
+            if self.optimization_settings.get('external_validation', False):
+                start = time.perf_counter()
+                if not self._run_node_validation(gltf_path):
+                    report.extend(ERROR, 'EXTERNAL_VALIDATOR', ["glTF validator reported errors"])
+                report.timings['external'] = time.perf_counter() - start
+            
+            self.last_validation = report
+            if self.debug:
+                print(f"Validation: {len(report.errors)} error(s), {len(report.warnings)} warning(s) "
+                      f"in {sum(report.timings.values()):.3f}s")
+                for message in report.messages():
+                    print(f"  - {message}")
+            return report.is_valid
+            
         except Exception as e:
             if self.debug:
-                print(f"Warning: Could not clean up old files: {e}")
-
-    def _run_validation(self, gltf_path: Path) -> bool:
-        """Run Node.js validation on the generated GLTF file"""
+                print(f"Validation failed with error: {e}")
+            return True  # Don't fail conversion due to validation issues
+    
+    def _resource_search_dirs(self, gltf_path: Path, input_path: Optional[Path] = None) -> List[Path]:
+        """
+        Where an output's URIs resolve: next to the output (the staging
+        directory during a conversion), then the shared atlas's directory,
+        which is the final output directory, then next to the input
+        """
+        search_dirs = [gltf_path.parent]
+        if self.shared_atlas:
+            search_dirs.append(Path(self.shared_atlas['path']).parent)
+        if input_path is not None:
+            search_dirs.append(Path(input_path).parent)
+        return search_dirs
+    
+    def _load_output_buffers(self, gltf_data: Dict, search_dirs: List[Path]) -> List[Optional[bytes]]:
+        """Load a document's buffers from disk, falling back to members still held in memory"""
+        buffers = load_buffers(gltf_data, search_dirs)
+        for index, buffer in enumerate(gltf_data.get('buffers', [])):
+            if buffers[index] is None and buffer.get('uri') in self._staged_members:
+                buffers[index] = self._staged_members[buffer['uri']]
+        return buffers
+    
+    @traced()
+    def _capture_conversion_stats(self, gltf_path: Path, input_path: Path,
+                                  fallback_data: Optional[Dict] = None):
+        """Record statistics of the final output for the summary and performance report"""
+        try:
+            with open(gltf_path, 'r', encoding='utf-8') as f:
+                final_gltf_data = json.load(f)
+            search_dirs = self._resource_search_dirs(gltf_path, input_path)
+            buffers = self._load_output_buffers(final_gltf_data, search_dirs) if self.detailed_stats else None
+            self._last_conversion_stats = compute_stats(final_gltf_data, buffers, search_dirs,
+                                                        detailed=self.detailed_stats)
+            # The .gltf with its buffers and textures; replaced by the ZIP size once packaged
+            self._last_conversion_stats['file_size'] = self._output_payload_size(gltf_path, final_gltf_data, search_dirs)
+            
+            if self.debug:
+                print(f"Captured conversion stats: {self._last_conversion_stats}")
+                
+        except Exception as e:
+            if self.debug:
+                print(f"Warning: Could not capture conversion stats: {e}")
+            # Fallback to basic stats
+            fallback_data = fallback_data or {}
+            self._last_conversion_stats = {
+                'meshes': len(fallback_data.get('meshes', [])),
+                'materials': len(fallback_data.get('materials', [])),
+                'textures': len(fallback_data.get('textures', [])),
+                'nodes': len(fallback_data.get('nodes', [])),
+                'file_size': 0
+            }
+    
+    def _output_payload_size(self, gltf_path: Path, gltf_data: Dict, search_dirs: List[Path]) -> int:
+        """Bytes of the .gltf plus every package member it references (staged or on disk)"""
+        exclude = set(self._staged_members)
+        if self.shared_atlas:
+            exclude.add(self.shared_atlas['uri'])
+        files, _ = collect_package_files(gltf_data, search_dirs, exclude)
+        return (gltf_path.stat().st_size + sum(len(data) for data in self._staged_members.values())
+                + sum(path.stat().st_size for path, _ in files))
+    
+    @traced()
+    def _run_node_validation(self, gltf_path: Path) -> bool:
+        """Cross-check the generated GLTF with the Node.js validation script"""
         try:
             import subprocess
-            import sys
             
             # Check if Node.js is available
             try:
-                result = subprocess.run(['node', 'version'], capture_output=True, text=True, timeout=10)
+                result = subprocess.run(['node', '--version'], capture_output=True, text=True, timeout=10)
                 if result.returncode != 0:
                     if self.debug:
                         print("Node.js not available, skipping validation")
@@ -2422,6 +2581,7 @@ class VoxBridgeConverter:
         # Generate atlas if there are 2 or more textures
         return len(textures) >= 2 and len(images) >= 2
     
+    @traced()
     def _generate_texture_atlas_for_gltf(self, gltf_path: Path, platform: str) -> bool:
         """Generate texture atlas for the given GLTF file"""
         try:
@@ -2463,6 +2623,7 @@ class VoxBridgeConverter:
             # Save atlas
             atlas_path = gltf_path.parent / f"{gltf_path.stem}_atlas.png"
             atlas.save(atlas_path)
+            self._generated_files.add(atlas_path)
             
             if self.debug:
                 print(f"Generated texture atlas: {atlas_path}")
@@ -2514,6 +2675,7 @@ class VoxBridgeConverter:
                 print(f"Warning: Mesh optimization failed: {e}")
             return mesh_data
     
+    @traced()
     def apply_texture_optimizations(self, gltf_path: Path, platform: str) -> bool:
         """Apply comprehensive texture optimizations"""
         try:
@@ -2553,49 +2715,244 @@ class VoxBridgeConverter:
                 print(f"Warning: Texture optimization failed: {e}")
             return False
     
-    def _package_output_files(self, output_path: Path, gltf_path: Path) -> Path:
-        """Package output files into ZIP archive"""
+    def prepare_shared_atlas(self, input_paths: List[Path], output_dir: Path,
+                             platform: str = "unity") -> Optional[Dict]:
+        """Pack the textures of every input into one atlas shared by the whole batch"""
+        if not TEXTURE_OPTIMIZATION_AVAILABLE:
+            return None
+        
+        images = []
+        for input_path in input_paths:
+            input_path = Path(input_path)
+            try:
+                gltf_data, buffers = read_gltf_document(input_path)
+                images.extend(load_gltf_images(gltf_data, buffers, [input_path.parent]).values())
+            except Exception as e:
+                if self.debug:
+                    print(f"Warning: Could not read textures from {input_path}: {e}")
+        if not images:
+            return None
+        
+        # Stay within the size apply_texture_optimizations enforces per platform
+        max_size = self.optimization_settings.get('texture_max_size', 1024) if platform.lower() == 'roblox' else 2048
+        try:
+            atlas, rects = build_shared_atlas(images, max_size)
+        except ValueError as e:
+            if self.debug:
+                print(f"Warning: Shared atlas not created: {e}")
+            return None
+        
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        atlas_path = output_dir / SHARED_ATLAS_FILENAME
+        atlas.save(atlas_path)
+        if self.optimization_settings.get('palette_quantization', False):
+            quantize_to_palette(str(atlas_path))
+        effort = self.optimization_settings.get('texture_effort', 0)
+        if effort > 0:
+            optimize_png(str(atlas_path), effort)
+        
+        if self.debug:
+            print(f"Shared atlas {atlas.size[0]}x{atlas.size[1]} with {len(rects)} textures: {atlas_path}")
+        
+        self.shared_atlas = {'uri': SHARED_ATLAS_FILENAME, 'path': atlas_path, 'rects': rects}
+        return self.shared_atlas
+    
+    @traced()
+    def _apply_shared_atlas(self, gltf_data: Dict, input_path: Path, output_path: Path) -> List[str]:
+        """Repoint images at the shared atlas and remap the UVs that sample them"""
+        changes = []
+        search_dirs = [output_path.parent, input_path.parent]
+        try:
+            buffers = load_buffers(gltf_data, search_dirs)
+            for index, buffer in enumerate(gltf_data.get('buffers', [])):
+                if buffers[index] is None and buffer.get('uri') in self._staged_members:
+                    buffers[index] = bytearray(self._staged_members[buffer['uri']])
+            image_rects = {}
+            for index, img in load_gltf_images(gltf_data, buffers, search_dirs).items():
+                rect = self.shared_atlas['rects'].get(pixel_hash(img))
+                if rect is not None:
+                    image_rects[index] = rect
+            
+            remapped, touched_buffers = remap_gltf_to_atlas(
+                gltf_data, buffers, image_rects, self.shared_atlas['uri'])
+            
+            # Write remapped UVs to the output directory, never over the input's buffers
+            for index in sorted(touched_buffers):
+                buffer = gltf_data['buffers'][index]
+                uri = buffer.get('uri', '')
+                if uri in self._staged_members:
+                    self._staged_members[uri] = bytes(buffers[index])
+                    continue
+                if input_path.suffix.lower() == '.glb' and uri == f"{output_path.stem}.bin":
+                    target_name = uri
+                else:
+                    target_name = f"{output_path.stem}_{index}.bin"
+                with open(output_path.parent / target_name, 'wb') as f:
+                    f.write(buffers[index])
+                self._generated_files.add(output_path.parent / target_name)
+                buffer['uri'] = target_name
+            
+            if remapped:
+                changes.append(f"Moved {len(remapped)} texture(s) into shared atlas {self.shared_atlas['uri']}")
+            if self.debug:
+                skipped = len(image_rects) - len(remapped)
+                print(f"Shared atlas: remapped {len(remapped)} image(s), kept {skipped} standalone")
+        except Exception as e:
+            if self.debug:
+                print(f"Warning: Could not apply shared atlas: {e}")
+        return changes
+    
+    @traced()
+    def _optimize_png_files(self, gltf_path: Path) -> int:
+        """Losslessly re-encode the PNG textures referenced by a GLTF file"""
+        effort = self.optimization_settings.get('texture_effort', 0)
+        if not TEXTURE_OPTIMIZATION_AVAILABLE or effort <= 0:
+            return 0
+        
+        try:
+            with open(gltf_path, 'r', encoding='utf-8') as f:
+                gltf_data = json.load(f)
+        except Exception as e:
+            if self.debug:
+                print(f"Warning: Could not read {gltf_path} for PNG optimization: {e}")
+            return 0
+        
+        total_saved = 0
+        image_uris = {image['uri'] for image in gltf_data.get('images', []) if image.get('uri')}
+        for uri in sorted(image_uris):
+            if uri.startswith(('http://', 'https://', 'data:')):
+                continue
+            # The shared atlas is re-encoded once when the batch prepares it
+            if self.shared_atlas and uri == self.shared_atlas['uri']:
+                continue
+            # Percent-encoded names (my%20tex.png) are decoded as the packager does
+            img_path = resolve_uri(uri, [gltf_path.parent]) or resolve_uri(unquote(uri), [gltf_path.parent])
+            if img_path is None:
+                continue
+            try:
+                saved = optimize_png(str(img_path), effort)
+                total_saved += saved
+                if saved:
+                    self.last_changes.append(f"Re-encoded PNG texture: {uri} (-{saved:,} bytes)")
+                    if self.debug:
+                        print(f"Optimized PNG {uri}: saved {saved:,} bytes")
+            except Exception as e:
+                if self.debug:
+                    print(f"Warning: PNG optimization failed for {uri}: {e}")
+        
+        return total_saved
+    
+    @traced()
+    def _stage_input_textures(self, gltf_data: Dict, input_dir: Path, output_dir: Path) -> Path:
+        """
+        Copy the external textures of the input next to the output so that
+        resizing and re-encoding work on copies. Returns the directory the
+        texture optimizations should read from.
+        """
+        if input_dir.resolve() == output_dir.resolve():
+            return input_dir
+        for name in package_manifest({'images': gltf_data.get('images', [])}):
+            source = input_dir / name
+            target = output_dir / name
+            if source.is_file() and not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, target)
+                self._generated_files.add(target)
+        return output_dir
+    
+    def _external_validators_available(self) -> bool:
+        """Whether an enabled external validator (gltf-validator, Node.js) will read the output from disk"""
+        if not self.optimization_settings.get('external_validation', False):
+            return False
+        if self.platform_manager and self.capabilities.available('gltf-validator'):
+            return True
+        return self.capabilities.available('node') and (Path(__file__).parent / 'validate_gltf.js').exists()
+    
+    def _write_staged_members(self, directory: Path):
+        """Spill in-memory package members to disk (used when packaging is not possible)"""
+        for name, data in self._staged_members.items():
+            with open(directory / name, 'wb') as f:
+                f.write(data)
+        self._staged_members = {}
+    
+    def _package_options(self) -> Dict[str, Any]:
+        """PackageWriter arguments from the ZIP optimization settings"""
+        return {
+            'compression': self.optimization_settings.get('zip_compression', 'deflate'),
+            'level': self.optimization_settings.get('zip_level'),
+            'deterministic': self.optimization_settings.get('deterministic', False),
+        }
+
+    def _export_timestamp(self) -> str:
+        """Timestamp written into packaged metadata; fixed (SOURCE_DATE_EPOCH) in deterministic mode"""
+        if self.optimization_settings.get('deterministic', False):
+            return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(reproducible_timestamp()))
+        return time.strftime("%Y-%m-%d %H:%M:%S")
+
+    @traced()
+    def _package_output_files(self, output_path: Path, gltf_path: Path,
+                              input_path: Optional[Path] = None) -> Path:
+        """
+        Package a GLTF output and exactly the files it references into a ZIP.
+        Referenced files are looked up next to the GLTF first, then next to
+        the input. Packaged files are removed afterwards only if they live in
+        the output directory and were produced by this conversion (or the
+        output directory is separate from the input's).
+        """
         try:
-            import zipfile
-            
             # Create ZIP with the output filename
             zip_path = output_path.parent / f"{output_path.stem}.zip"
+            output_dir = gltf_path.parent
+            input_dir = input_path.parent if input_path else None
             
-            # Find all associated files to include in the ZIP
-            files_to_zip = []
-            
-            # Add GLTF file
-            files_to_zip.append((gltf_path, gltf_path.name))
-            
-            # Look for .bin files and include them
-            for bin_file in gltf_path.parent.glob("*.bin"):
-                files_to_zip.append((bin_file, bin_file.name))
-            
-            # Look for texture files and include them
-            texture_exts = ['.png', '.jpg', '.jpeg', '.tga', '.bmp']
-            for texture_file in gltf_path.parent.glob("*"):
-                if texture_file.suffix.lower() in texture_exts:
-                    files_to_zip.append((texture_file, texture_file.name))
+            with open(gltf_path, 'r', encoding='utf-8') as f:
+                gltf_data = json.load(f)
             
-            # Create ZIP package
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # The shared atlas stays next to the packages for every asset to reference
+            exclude = set(self._staged_members)
+            if self.shared_atlas:
+                exclude.add(self.shared_atlas['uri'])
+            search_dirs = [output_dir] + ([input_dir] if input_dir and input_dir != output_dir else [])
+            files_to_zip, missing = collect_package_files(gltf_data, search_dirs, exclude)
+            if missing and self.debug:
+                print(f"Warning: Referenced files not found for packaging: {missing}")
+            
+            # Stream everything into a temporary archive that is renamed into place at the end
+            with PackageWriter(zip_path, **self._package_options()) as package:
+                package.write_file(gltf_path, gltf_path.name)
+                for name, data in self._staged_members.items():
+                    package.write_bytes(name, data)
                 for file_path, zip_name in files_to_zip:
-                    zipf.write(file_path, zip_name)
+                    package.write_file(file_path, zip_name)
+            
+            # Clean up scattered files (keep only ZIP), never touching the input's own files
+            def is_under(path: Path, directory: Path) -> bool:
+                try:
+                    path.resolve().relative_to(directory.resolve())
+                    return True
+                except ValueError:
+                    return False
             
-            # Clean up scattered files (keep only ZIP)
-            for file_path, _ in files_to_zip:
-                if file_path != zip_path:
+            for file_path in [gltf_path] + [path for path, _ in files_to_zip]:
+                owned_by_input = input_dir is not None and is_under(file_path, input_dir)
+                if file_path in self._generated_files or (is_under(file_path, output_dir) and not owned_by_input):
                     file_path.unlink()
             
             if self.debug:
                 print(f"Created ZIP package: {zip_path}")
-                print(f"Files included: {[name for _, name in files_to_zip]}")
+                print(f"Files included: {package.members}")
             
+            self._staged_members = {}
+            if self._last_conversion_stats:
+                self._last_conversion_stats['file_size'] = zip_path.stat().st_size
             return zip_path
             
         except Exception as e:
             if self.debug:
                 print(f"Warning: Could not create ZIP package: {e}")
+            # Leave a complete unpackaged output behind
+            self._write_staged_members(gltf_path.parent)
             return gltf_path  # Return original file if ZIP creation fails
 
 
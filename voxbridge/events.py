@@ -0,0 +1,169 @@
+"""
+VoxBridge Event Log
+Structured JSONL events for conversion jobs (job start/end, backend attempts, stage timings, warnings)
+and a summary of a log into throughput, latency percentiles and failure causes
+"""
+
+import json
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+EVENT_VERSION = 1
+
+# Percentiles reported for job and stage latencies
+PERCENTILES = (50, 90, 95, 99)
+
+Sink = Union[None, str, Path, Callable[[Dict], None]]
+
+
+class EventLog:
+    """
+    Emits one JSON object per event to its sinks: file paths (appended to,
+    one line per event), "-" or "stderr" for standard error, or callables
+    receiving each event dict. Without a sink every call is a no-op.
+    """
+
+    def __init__(self, sink: Sink = None):
+        self.job: Optional[str] = None
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[Dict], None]] = []
+        self._streams: List[tuple] = []  # (stream, opened by this log)
+        if sink is not None:
+            self.add_sink(sink)
+
+    def add_sink(self, sink: Sink):
+        """Send events to another destination as well"""
+        if callable(sink):
+            self._callbacks.append(sink)
+        elif sink in ('-', 'stderr'):
+            self._streams.append((sys.stderr, False))
+        elif sink is not None:
+            path = Path(sink)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._streams.append((open(path, 'a', encoding='utf-8'), True))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._callbacks or self._streams)
+
+    def begin_job(self) -> Optional[str]:
+        """Start a new job id that is attached to every following event"""
+        if not self.enabled:
+            return None
+        self.job = uuid.uuid4().hex[:12]
+        return self.job
+
+    def emit(self, event: str, **fields) -> Optional[Dict]:
+        """Write one event; fields must be JSON serializable (paths are written as strings)"""
+        if not self.enabled:
+            return None
+        record = {'v': EVENT_VERSION, 'ts': round(time.time(), 6), 'event': event}
+        if self.job is not None:
+            record['job'] = self.job
+        record.update(fields)
+        with self._lock:
+            if self._streams:
+                line = json.dumps(record, default=str) + '\n'
+                for stream, _ in self._streams:
+                    stream.write(line)
+                    stream.flush()
+            for callback in self._callbacks:
+                callback(record)
+        return record
+
+    def close(self):
+        """Close the file sinks opened by this log and stop emitting"""
+        for stream, owned in self._streams:
+            if owned:
+                stream.close()
+        self._streams = []
+        self._callbacks = []
+
+
+def read_events(path: Path) -> Iterator[Dict]:
+    """Events of a JSONL log; blank, malformed and non-object lines are skipped"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and 'event' in record:
+                yield record
+
+
+def latency_summary(values: Iterable[float]) -> Dict:
+    """Count, mean, max and the PERCENTILES of latencies in seconds (None without values)"""
+    # Imported here so the CLI can load this module without NumPy's startup cost
+    import numpy as np
+    values = np.asarray([value for value in values if value is not None], dtype=np.float64)
+    if values.size == 0:
+        return {'count': 0, 'mean': None, 'max': None, **{f"p{q}": None for q in PERCENTILES}}
+    summary = {'count': int(values.size), 'mean': round(float(values.mean()), 6), 'max': round(float(values.max()), 6)}
+    for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f"p{q}"] = round(float(value), 6)
+    return summary
+
+
+def summarize_events(events: Iterable[Dict]) -> Dict:
+    """
+    Aggregate a log: job counts and failure causes, throughput over the
+    logged wall-clock span, job and per-stage latency percentiles,
+    backend outcomes, and the most frequent warnings.
+    """
+    jobs: Dict[str, Dict] = {}
+    stage_seconds: Dict[str, Dict[str, float]] = {}
+    backends: Dict[str, Counter] = {}
+    warnings = Counter()
+    first_ts = last_ts = None
+
+    for record in events:
+        ts = record.get('ts')
+        if ts is not None:
+            first_ts = ts if first_ts is None else min(first_ts, ts)
+            last_ts = ts if last_ts is None else max(last_ts, ts)
+        event = record['event']
+        job = record.get('job')
+        if event == 'job_end' and job is not None:
+            jobs[job] = record
+        elif event == 'stage':
+            # Stages can run more than once per job; a job's time in a stage is their sum
+            per_job = stage_seconds.setdefault(record.get('stage', '?'), {})
+            per_job[job] = per_job.get(job, 0.0) + record.get('seconds', 0.0)
+        elif event == 'backend':
+            backends.setdefault(record.get('backend', '?'), Counter())[record.get('outcome', '?')] += 1
+        elif event == 'warning':
+            warnings[record.get('code') or record.get('message', '?')] += 1
+
+    ended = list(jobs.values())
+    failed = [record for record in ended if not record.get('success')]
+    failures = Counter(record.get('error') or 'conversion failed' for record in failed)
+    bytes_in = sum(record.get('bytes_in') or 0 for record in ended)
+    bytes_out = sum(record.get('bytes_out') or 0 for record in ended)
+    span = (last_ts - first_ts) if first_ts is not None else 0.0
+
+    return {
+        'jobs': len(ended),
+        'succeeded': len(ended) - len(failed),
+        'failed': len(failed),
+        'failure_causes': dict(failures.most_common()),
+        'wall_seconds': round(span, 6),
+        'throughput': {
+            'jobs_per_second': round(len(ended) / span, 6) if span > 0 else None,
+            'bytes_in_per_second': round(bytes_in / span, 3) if span > 0 else None,
+            'bytes_in': bytes_in,
+            'bytes_out': bytes_out,
+        },
+        'latency': latency_summary(record.get('seconds') for record in ended),
+        'stages': {stage: latency_summary(per_job.values()) for stage, per_job in sorted(stage_seconds.items())},
+        'backends': {backend: dict(outcomes) for backend, outcomes in sorted(backends.items())},
+        'warnings': dict(warnings.most_common(10)),
+    }
@@ -0,0 +1,172 @@
+"""
+VoxBridge glTF I/O Module
+Lightweight, dependency-free readers for glTF/GLB documents and their buffers
+"""
+
+import base64
+import json
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+GLB_MAGIC = b'glTF'
+GLB_CHUNK_JSON = 0x4E4F534A
+GLB_CHUNK_BIN = 0x004E4942
+
+
+def parse_glb(data: bytes) -> Tuple[Dict, Optional[bytes]]:
+    """Split a GLB container into its JSON document and optional BIN chunk"""
+    if len(data) < 20 or data[:4] != GLB_MAGIC:
+        raise ValueError("Not a GLB file (bad magic)")
+
+    version, total_length = struct.unpack_from('<II', data, 4)
+    if version != 2:
+        raise ValueError(f"Unsupported GLB version: {version}")
+
+    gltf_data = None
+    binary_chunk = None
+    offset = 12
+    end = min(total_length, len(data))
+    while offset + 8 <= end:
+        chunk_length, chunk_type = struct.unpack_from('<II', data, offset)
+        chunk = data[offset + 8:offset + 8 + chunk_length]
+        if chunk_type == GLB_CHUNK_JSON and gltf_data is None:
+            gltf_data = json.loads(chunk.decode('utf-8'))
+        elif chunk_type == GLB_CHUNK_BIN and binary_chunk is None:
+            binary_chunk = chunk
+        offset += 8 + chunk_length
+
+    if gltf_data is None:
+        raise ValueError("GLB file has no JSON chunk")
+    return gltf_data, binary_chunk
+
+
+def build_glb(gltf_data: Dict, binary: Optional[bytes] = None) -> bytes:
+    """Pack a glTF document and an optional BIN chunk into a GLB container"""
+    json_chunk = json.dumps(gltf_data, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    chunks = struct.pack('<II', len(json_chunk), GLB_CHUNK_JSON) + json_chunk
+    if binary:
+        binary = bytes(binary) + b'\x00' * (-len(binary) % 4)
+        chunks += struct.pack('<II', len(binary), GLB_CHUNK_BIN) + binary
+    return struct.pack('<4sII', GLB_MAGIC, 2, 12 + len(chunks)) + chunks
+
+
+def read_gltf_json(path: Path) -> Dict:
+    """
+    Read only the JSON document of a .gltf or .glb file. For GLB the
+    binary chunk is never read, so large assets can be checked cheaply.
+    """
+    path = Path(path)
+    if path.suffix.lower() != '.glb':
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    with open(path, 'rb') as f:
+        header = f.read(20)
+        if len(header) < 20 or header[:4] != GLB_MAGIC:
+            raise ValueError("Not a GLB file (bad magic)")
+        version, _, chunk_length, chunk_type = struct.unpack_from('<IIII', header, 4)
+        if version != 2:
+            raise ValueError(f"Unsupported GLB version: {version}")
+        if chunk_type != GLB_CHUNK_JSON:
+            raise ValueError("GLB file does not start with a JSON chunk")
+        chunk = f.read(chunk_length)
+    if len(chunk) != chunk_length:
+        raise ValueError("GLB JSON chunk is truncated")
+    return json.loads(chunk.decode('utf-8'))
+
+
+def decode_data_uri(uri: str) -> bytes:
+    """Decode a base64 data: URI"""
+    header, _, payload = uri.partition(',')
+    if not header.endswith(';base64'):
+        raise ValueError("Only base64 data URIs are supported")
+    return base64.b64decode(payload)
+
+
+def resolve_uri(uri: str, search_dirs: Sequence[Path]) -> Optional[Path]:
+    """Find the file a relative URI points to, trying each directory in order"""
+    if not uri or uri.startswith(('http://', 'https://', 'data:')):
+        return None
+    for directory in search_dirs:
+        candidate = Path(directory) / uri
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def load_buffers(gltf_data: Dict, search_dirs: Sequence[Path],
+                 glb_binary: Optional[bytes] = None) -> List[Optional[bytearray]]:
+    """
+    Load every buffer of a glTF document as a mutable bytearray.
+    Buffers that cannot be resolved are returned as None.
+    """
+    buffers = []
+    for i, buffer in enumerate(gltf_data.get('buffers', [])):
+        uri = buffer.get('uri')
+        data = None
+        try:
+            if uri is None:
+                # GLB-stored buffer: only the first buffer may omit its uri
+                if i == 0 and glb_binary is not None:
+                    data = bytearray(glb_binary)
+            elif uri.startswith('data:'):
+                data = bytearray(decode_data_uri(uri))
+            else:
+                path = resolve_uri(uri, search_dirs)
+                if path is not None:
+                    data = bytearray(path.read_bytes())
+        except (OSError, ValueError):
+            data = None
+        buffers.append(data)
+    return buffers
+
+
+def read_gltf_document(path: Path) -> Tuple[Dict, List[Optional[bytearray]]]:
+    """Read a .gltf or .glb file and all of its resolvable buffers"""
+    path = Path(path)
+    if path.suffix.lower() == '.glb':
+        gltf_data, glb_binary = parse_glb(path.read_bytes())
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            gltf_data = json.load(f)
+        glb_binary = None
+    return gltf_data, load_buffers(gltf_data, [path.parent], glb_binary)
+
+
+def buffer_view_bytes(gltf_data: Dict, view_index: int,
+                      buffers: List[Optional[bytearray]]) -> Optional[bytes]:
+    """Return the bytes covered by a bufferView, or None if unavailable"""
+    views = gltf_data.get('bufferViews', [])
+    if not isinstance(view_index, int) or not 0 <= view_index < len(views):
+        return None
+    view = views[view_index]
+    buffer_index = view.get('buffer')
+    if not isinstance(buffer_index, int) or not 0 <= buffer_index < len(buffers):
+        return None
+    data = buffers[buffer_index]
+    if data is None:
+        return None
+    start = view.get('byteOffset', 0)
+    end = start + view.get('byteLength', 0)
+    if end > len(data):
+        return None
+    return bytes(data[start:end])
+
+
+def image_bytes(gltf_data: Dict, image: Dict, buffers: List[Optional[bytearray]],
+                search_dirs: Sequence[Path]) -> Optional[bytes]:
+    """Return the encoded bytes of a glTF image from a file, data URI or bufferView"""
+    try:
+        if 'bufferView' in image:
+            return buffer_view_bytes(gltf_data, image['bufferView'], buffers)
+        uri = image.get('uri')
+        if not uri:
+            return None
+        if uri.startswith('data:'):
+            return decode_data_uri(uri)
+        path = resolve_uri(uri, search_dirs)
+        return path.read_bytes() if path is not None else None
+    except (OSError, ValueError):
+        return None
@@ -361,6 +361,16 @@ class VoxBridgeGUI:
                                 self.log_message(f"  → Packaged into {zip_path.name}", "info")
                             else:
                                 self.log_message(f"  → Output saved as {output_file.with_suffix('.gltf').name}", "info")
+
+                            # Validation already ran once during the conversion
+                            result = self.converter.last_result
+                            report = result.validation if result else None
+                            if report is not None:
+                                level = "warning" if report.errors else "info"
+                                self.log_message(f"  → Validation: {len(report.errors)} errors, "
+                                                 f"{len(report.warnings)} warnings", level)
+                                for issue in report.errors[:3]:
+                                    self.log_message(f"    - {issue}", "warning")
                         else:
                             self.log_message(f"✗ {input_file.name} conversion failed!", "error")
                             
@@ -407,9 +417,9 @@ class VoxBridgeGUI:
         else:
             self.log_message("VoxBridge converter: Not available", "error")
         
-        # Check Blender
+        # Check Blender (the user asked for a check, so probe again rather than trust the cache)
         if self.converter:
-            blender_path = self.converter.find_blender()
+            blender_path = self.converter.capabilities.refresh(['blender'])['blender']['path']
             if blender_path:
                 self.log_message(f"Blender: Found at {blender_path}", "success")
             else:
@@ -0,0 +1,156 @@
+"""
+VoxBridge Image Probe Module
+Reads texture dimensions from file headers without decoding pixel data
+"""
+
+import io
+import os
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional, Union
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+KTX2_IDENTIFIER = b'\xabKTX 20\xbb\r\n\x1a\n'
+
+# Most formats keep their dimensions in the first few dozen bytes
+HEADER_BYTES = 64
+
+# JPEG start-of-frame markers (excluding DHT 0xC4, JPG 0xC8 and DAC 0xCC)
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+class ImageInfo(NamedTuple):
+    """Header-level description of an image file"""
+    format: str
+    width: int
+    height: int
+    levels: int = 1  # Mip levels stored in the file (KTX2 only)
+
+
+def _probe_png(header: bytes) -> Optional[ImageInfo]:
+    if len(header) < 24 or header[12:16] != b'IHDR':
+        return None
+    width, height = struct.unpack_from('>II', header, 16)
+    return ImageInfo('PNG', width, height)
+
+
+def _probe_webp(header: bytes) -> Optional[ImageInfo]:
+    chunk = header[12:16]
+    if chunk == b'VP8 ' and len(header) >= 30 and header[23:26] == b'\x9d\x01\x2a':
+        width, height = struct.unpack_from('<HH', header, 26)
+        return ImageInfo('WEBP', width & 0x3FFF, height & 0x3FFF)
+    if chunk == b'VP8L' and len(header) >= 25 and header[20] == 0x2F:
+        bits = struct.unpack_from('<I', header, 21)[0]
+        return ImageInfo('WEBP', (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if chunk == b'VP8X' and len(header) >= 30:
+        width = int.from_bytes(header[24:27], 'little') + 1
+        height = int.from_bytes(header[27:30], 'little') + 1
+        return ImageInfo('WEBP', width, height)
+    return None
+
+
+def _probe_ktx2(header: bytes) -> Optional[ImageInfo]:
+    if len(header) < 44:
+        return None
+    width, height = struct.unpack_from('<II', header, 20)
+    levels = struct.unpack_from('<I', header, 40)[0]
+    return ImageInfo('KTX2', width, max(height, 1), max(levels, 1))
+
+
+def _probe_bmp(header: bytes) -> Optional[ImageInfo]:
+    if len(header) < 26:
+        return None
+    width, height = struct.unpack_from('<ii', header, 18)
+    return ImageInfo('BMP', abs(width), abs(height))
+
+
+def _probe_jpeg(stream: BinaryIO) -> Optional[ImageInfo]:
+    """Walk JPEG marker segments until a start-of-frame header is found"""
+    stream.seek(2)
+    while True:
+        marker = stream.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        # Fill bytes and standalone markers carry no length field
+        while code == 0xFF:
+            fill = stream.read(1)
+            if not fill:
+                return None
+            code = fill[0]
+        if code == 0x01 or 0xD0 <= code <= 0xD7:
+            continue
+        if code in (0xD9, 0xDA):
+            return None
+        length_bytes = stream.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+        if code in JPEG_SOF_MARKERS:
+            frame = stream.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack_from('>HH', frame, 1)
+            return ImageInfo('JPEG', width, height)
+        stream.seek(length - 2, io.SEEK_CUR)
+
+
+def probe_stream(stream: BinaryIO) -> Optional[ImageInfo]:
+    """
+    Identify an image and its dimensions from a seekable binary stream.
+    Only the header (and, for JPEG, the marker segments before the frame
+    header) is read. Returns None for unrecognised or truncated data.
+    """
+    header = stream.read(HEADER_BYTES)
+    try:
+        if header.startswith(PNG_SIGNATURE):
+            return _probe_png(header)
+        if header[:3] == b'\xff\xd8\xff':
+            return _probe_jpeg(stream)
+        if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+            return _probe_webp(header)
+        if header.startswith(KTX2_IDENTIFIER):
+            return _probe_ktx2(header)
+        if header[:2] == b'BM':
+            return _probe_bmp(header)
+    except (struct.error, OSError, IndexError):
+        return None
+    return None
+
+
+def probe_image_bytes(data: bytes) -> Optional[ImageInfo]:
+    """Identify an in-memory image (e.g. a GLB bufferView or ZIP member)"""
+    return probe_stream(io.BytesIO(data))
+
+
+@lru_cache(maxsize=4096)
+def _probe_file(path: str, mtime_ns: int, size: int) -> Optional[ImageInfo]:
+    # mtime_ns and size are part of the cache key so rewritten files are re-probed
+    try:
+        with open(path, 'rb') as f:
+            info = probe_stream(f)
+    except OSError:
+        return None
+    if info is not None:
+        return info
+
+    # Formats without a magic number (e.g. TGA): Pillow only parses the header on open
+    try:
+        from PIL import Image
+        with Image.open(path) as img:
+            return ImageInfo(img.format or 'UNKNOWN', img.width, img.height)
+    except Exception:
+        return None
+
+
+def probe_image(path: Union[str, Path]) -> Optional[ImageInfo]:
+    """
+    Return the format and dimensions of an image file, or None if it is
+    missing or unreadable. Results are memoized per (path, mtime, size).
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return _probe_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,303 @@
+"""
+VoxBridge Metrics Module
+Counters, gauges and histograms in Prometheus text format, served over HTTP or written
+for the node_exporter textfile collector, and the standard conversion metrics fed from job events
+"""
+
+import math
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; spans a sub-millisecond stage up to a multi-minute Blender run
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if math.isnan(value):
+        return 'NaN'
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str, quote: bool = True) -> str:
+    value = value.replace('\\', '\\\\').replace('\n', '\\n')
+    return value.replace('"', '\\"') if quote else value
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + '}'
+
+
+class _Metric:
+    """A named metric family; one value (or histogram state) per label combination"""
+    type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict) -> Tuple[str, ...]:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} takes labels {list(self.labels)}, got {sorted(labels)}")
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        """(sample name, label names, label values, value) for every series"""
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, self.labels, key, value
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels):
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters only go up (got {amount})")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels):
+        """Mirror a total counted elsewhere (e.g. functools.lru_cache statistics)"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    type = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        if 'le' in labels:
+            raise ValueError("'le' is reserved for histogram buckets")
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state['buckets'][i] += 1
+                    break
+            state['sum'] += value
+            state['count'] += 1
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state['count'] if state else 0
+
+    def samples(self):
+        label_names = self.labels + ('le',)
+        with self._lock:
+            items = sorted(((key, dict(state, buckets=list(state['buckets']))) for key, state in self._values.items()),
+                           key=lambda item: item[0])
+        for key, state in items:
+            cumulative = 0
+            for bound, hits in zip(self.buckets, state['buckets']):
+                cumulative += hits
+                yield f"{self.name}_bucket", label_names, key + (_format_value(bound),), cumulative
+            yield f"{self.name}_bucket", label_names, key + ('+Inf',), state['count']
+            yield f"{self.name}_sum", self.labels, key, state['sum']
+            yield f"{self.name}_count", self.labels, key, state['count']
+
+
+class MetricsRegistry:
+    """
+    Metric families by name. Collectors registered with add_collector run
+    right before each render, for values that are read rather than pushed.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric_class, name: str, documentation: str, labels: Sequence[str], **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not metric_class or existing.labels != tuple(labels):
+                    raise ValueError(f"Metric {name} is already registered as a different {existing.type}")
+                return existing
+            metric = self._metrics[name] = metric_class(name, documentation, labels, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labels)
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labels)
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labels, buckets=buckets)
+
+    def add_collector(self, collector: Callable[[], None]):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)"""
+        for collector in self._collectors:
+            collector()
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation, quote=False)}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, label_names, label_values, value in metric.samples():
+                lines.append(f"{name}{_format_labels(label_names, label_values)} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path: Path) -> Path:
+        """
+        Write the metrics for the node_exporter textfile collector. The file
+        is replaced atomically so the collector never reads a partial file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+    def serve(self, port: int, host: str = '') -> 'ThreadingHTTPServer':
+        """
+        Serve GET /metrics from a daemon thread. Returns the server; call
+        shutdown() and server_close() to stop it. Port 0 picks a free port
+        (see server.server_address).
+        """
+        # http.server costs more to import than the rest of the CLI's own modules together
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='voxbridge-metrics', daemon=True).start()
+        return server
+
+
+def _cache_functions() -> Dict[str, Callable]:
+    """The process-wide lru_caches the conversion pipeline relies on"""
+    from .image_probe import _probe_file
+    from .packaging import _crc32_zeros_operator
+    from .schemas import get_validator
+    return {'image_probe': _probe_file, 'schema_validator': get_validator, 'crc32_zeros': _crc32_zeros_operator}
+
+
+class ConversionMetrics:
+    """
+    The standard VoxBridge metrics. record_event is an EventLog sink, so
+    attaching it to a converter's event log keeps them up to date from
+    convert_file; batch schedulers set queue_depth themselves.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        self.conversions = r.counter('voxbridge_conversions_total', 'Finished conversions by the backend that produced the output and outcome', ('backend', 'outcome'))
+        self.backend_attempts = r.counter('voxbridge_backend_attempts_total', 'Backend attempts by backend and outcome', ('backend', 'outcome'))
+        self.duration = r.histogram('voxbridge_conversion_duration_seconds', 'Wall time of each conversion')
+        self.stage_duration = r.histogram('voxbridge_stage_duration_seconds', 'Time spent in each pipeline stage', ('stage',))
+        self.bytes = r.counter('voxbridge_bytes_total', 'Bytes read from inputs and written as outputs', ('direction',))
+        self.validation_warnings = r.counter('voxbridge_validation_warnings_total', 'Validation warnings on converted outputs')
+        self.in_progress = r.gauge('voxbridge_conversions_in_progress', 'Conversions currently running')
+        self.queue_depth = r.gauge('voxbridge_queue_depth', 'Assets waiting to be converted')
+        self.cache_requests = r.counter('voxbridge_cache_requests_total', 'Lookups in process-wide caches by result', ('cache', 'result'))
+        self.cache_hit_ratio = r.gauge('voxbridge_cache_hit_ratio', 'Hits over lookups for each process-wide cache', ('cache',))
+        r.add_collector(self._collect_caches)
+
+    def attach(self, events):
+        """Update these metrics from every event of an EventLog"""
+        events.add_sink(self.record_event)
+
+    def record_event(self, event: Dict):
+        name = event.get('event')
+        if name == 'job_start':
+            self.in_progress.inc()
+        elif name == 'backend':
+            self.backend_attempts.inc(backend=event.get('backend'), outcome=event.get('outcome'))
+        elif name == 'stage' and event.get('seconds') is not None:
+            self.stage_duration.observe(event['seconds'], stage=event.get('stage'))
+        elif name == 'job_end':
+            self.in_progress.dec()
+            self.conversions.inc(backend=event.get('backend') or 'none',
+                                 outcome='success' if event.get('success') else 'failure')
+            if event.get('seconds') is not None:
+                self.duration.observe(event['seconds'])
+            self.bytes.inc(event.get('bytes_in') or 0, direction='in')
+            self.bytes.inc(event.get('bytes_out') or 0, direction='out')
+            self.validation_warnings.inc(event.get('validation_warnings') or 0)
+
+    def _collect_caches(self):
+        for cache, function in _cache_functions().items():
+            info = function.cache_info()
+            self.cache_requests.set_total(info.hits, cache=cache, result='hit')
+            self.cache_requests.set_total(info.misses, cache=cache, result='miss')
+            lookups = info.hits + info.misses
+            self.cache_hit_ratio.set(info.hits / lookups if lookups else 0.0, cache=cache)
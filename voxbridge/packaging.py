@@ -0,0 +1,417 @@
+"""
+VoxBridge Packaging Module
+Streams conversion outputs into ZIP packages and publishes them atomically
+"""
+
+import io
+import json
+import os
+import struct
+import time
+import uuid
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import unquote
+
+from .gltf_io import resolve_uri
+
+# Optional zstd support (ZIP method 93)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Already entropy-coded formats: deflating them costs CPU and saves nothing
+STORED_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.ktx2', '.webp'}
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# --zip-compression modes and their default levels
+COMPRESSION_MODES = ('deflate', 'zstd', 'store')
+DEFAULT_LEVELS = {'deflate': 6, 'zstd': 3}
+LEVEL_RANGES = {'deflate': (0, 9), 'zstd': (1, 22)}
+
+ZIP_ZSTANDARD = 93
+
+# Members are deflated in independent chunks so a single large buffer still uses every core
+COMPRESS_CHUNK_SIZE = 1024 * 1024
+
+# 1980-01-01 00:00:00 UTC, the earliest timestamp a ZIP entry can hold
+ZIP_EPOCH = 315532800
+
+# Classic ZIP limits; anything bigger is written through zipfile with zip64 records
+ZIP32_LIMIT = 0xFFFFFFFF
+ZIP32_MAX_MEMBERS = 0xFFFF
+
+
+def package_manifest(gltf_data: Dict) -> List[str]:
+    """
+    List the relative files a glTF document needs next to it: every
+    buffers[].uri followed by every images[].uri, percent-decoded and
+    de-duplicated. Embedded (data:) and remote URIs are not files and are
+    left out, as are absolute paths and paths escaping the package root.
+    """
+    names = []
+    for key in ('buffers', 'images'):
+        for entry in gltf_data.get(key, []):
+            uri = entry.get('uri') if isinstance(entry, dict) else None
+            if not uri or uri.startswith('data:') or '://' in uri:
+                continue
+            name = unquote(uri)
+            path = PurePosixPath(name.replace('\\', '/'))
+            # '.' and './' name the package root itself, which has no parts
+            if not path.parts or path.is_absolute() or '..' in path.parts or ':' in path.parts[0]:
+                continue
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def collect_package_files(gltf_data: Dict, search_dirs: Sequence[Path],
+                          exclude: Iterable[str] = ()) -> Tuple[List[Tuple[Path, str]], List[str]]:
+    """
+    Resolve the package manifest of a glTF document against search_dirs
+    (first match wins). Returns (path, member name) pairs for the files
+    found and the manifest entries that could not be found.
+    """
+    exclude = set(exclude)
+    files = []
+    missing = []
+    for name in package_manifest(gltf_data):
+        if name in exclude:
+            continue
+        path = resolve_uri(name, search_dirs)
+        if path is None:
+            missing.append(name)
+        else:
+            files.append((path, name))
+    return files, missing
+
+
+def reproducible_timestamp() -> int:
+    """
+    Timestamp for deterministic output: SOURCE_DATE_EPOCH when set (see
+    reproducible-builds.org), otherwise the ZIP epoch. Never earlier than 1980.
+    """
+    try:
+        epoch = int(os.environ.get('SOURCE_DATE_EPOCH', ZIP_EPOCH))
+    except ValueError:
+        epoch = ZIP_EPOCH
+    return max(epoch, ZIP_EPOCH)
+
+
+def _gf2_matrix_times(matrix: List[int], vector: int) -> int:
+    result = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return result
+
+
+def _gf2_matrix_compose(a: List[int], b: List[int]) -> List[int]:
+    return [_gf2_matrix_times(a, column) for column in b]
+
+
+@lru_cache(maxsize=16)
+def _crc32_zeros_operator(length: int) -> Tuple[int, ...]:
+    """GF(2) operator that advances a CRC-32 over `length` zero bytes"""
+    # One zero bit, squared three times -> one zero byte
+    operator = [0xEDB88320] + [1 << n for n in range(31)]
+    for _ in range(3):
+        operator = _gf2_matrix_compose(operator, operator)
+    result = [1 << n for n in range(32)]
+    while length:
+        if length & 1:
+            result = _gf2_matrix_compose(operator, result)
+        length >>= 1
+        if length:
+            operator = _gf2_matrix_compose(operator, operator)
+    return tuple(result)
+
+
+def crc32_combine(crc1: int, crc2: int, length2: int) -> int:
+    """CRC-32 of A+B from crc32(A), crc32(B) and len(B), like zlib's crc32_combine"""
+    return _gf2_matrix_times(_crc32_zeros_operator(length2), crc1) ^ crc2
+
+
+class _Entry:
+    """A queued package member: file on disk or in-memory bytes"""
+
+    __slots__ = ('name', 'path', 'data', 'size', 'date_time')
+
+    def __init__(self, name: str, path: Optional[Path] = None, data: Optional[bytes] = None,
+                 mtime: Optional[float] = None):
+        self.name = name
+        self.path = path
+        self.data = data
+        self.size = path.stat().st_size if path is not None else len(data)
+        date_time = time.localtime(time.time() if mtime is None else mtime)[:6]
+        self.date_time = max(date_time, (1980, 1, 1, 0, 0, 0))
+
+    def read(self, start: int, length: int) -> bytes:
+        if self.data is not None:
+            return memoryview(self.data)[start:start + length]
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            raw = f.read(length)
+        if len(raw) != length:
+            raise OSError(f"{self.path} changed while it was being packaged")
+        return raw
+
+
+class _MemberStream(io.BytesIO):
+    """Writable member handed out by PackageWriter.open(); queued when closed"""
+
+    def __init__(self, writer: 'PackageWriter', name: str):
+        super().__init__()
+        self._writer = writer
+        self._name = name
+
+    def close(self):
+        if not self.closed:
+            self._writer._entries.append(_Entry(self._name, data=self.getvalue()))
+        super().close()
+
+
+class PackageWriter:
+    """
+    Build a ZIP package from queued members and publish it atomically.
+
+    Members are compressed concurrently on a thread pool (zlib and zstd
+    release the GIL); large members are split into independently flushed
+    DEFLATE chunks so they parallelise too. The archive (local headers,
+    central directory) is assembled in order into a temporary file in the
+    target directory and renamed over the target on commit(). abort(), or
+    leaving a ``with`` block with an exception, discards everything and
+    leaves any previous package untouched.
+
+    compression is 'deflate' (default), 'zstd' (needs the zstandard
+    package) or 'store'. PNG/JPEG/KTX2/WebP members are always stored.
+    With deterministic=True members are sorted by name, every entry gets
+    the reproducible_timestamp() and JSON members are written with sorted
+    keys, so identical inputs produce byte-identical packages.
+    """
+
+    def __init__(self, zip_path: Path, compression: str = 'deflate', level: Optional[int] = None,
+                 max_workers: Optional[int] = None, deterministic: bool = False):
+        if compression not in COMPRESSION_MODES:
+            raise ValueError(f"Unknown ZIP compression '{compression}' (expected one of {', '.join(COMPRESSION_MODES)})")
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            raise ValueError("zstd ZIP compression requires the 'zstandard' package")
+        if level is None:
+            level = DEFAULT_LEVELS.get(compression)
+        elif compression in LEVEL_RANGES:
+            low, high = LEVEL_RANGES[compression]
+            if not low <= level <= high:
+                raise ValueError(f"{compression} level must be between {low} and {high}")
+
+        self.zip_path = Path(zip_path)
+        self.compression = compression
+        self.level = level
+        self.max_workers = max_workers or min(32, os.cpu_count() or 1)
+        self.deterministic = deterministic
+        self.members: List[str] = []
+        self._entries: List[_Entry] = []
+        self._finished = False
+
+    def __enter__(self) -> 'PackageWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+    def method_for(self, name: str) -> int:
+        """ZIP compression method for a member: already-compressed formats are stored"""
+        if self.compression == 'store' or Path(name).suffix.lower() in STORED_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        if self.compression == 'zstd':
+            return ZIP_ZSTANDARD
+        return zipfile.ZIP_DEFLATED
+
+    def _reserve(self, name: str):
+        if self._finished:
+            raise RuntimeError("Package has already been written")
+        if name in self.members:
+            raise ValueError(f"Duplicate package member: {name}")
+        self.members.append(name)
+
+    def open(self, name: str) -> IO[bytes]:
+        """Return a writable stream that a pipeline stage can write a member into"""
+        self._reserve(name)
+        return _MemberStream(self, name)
+
+    def write_bytes(self, name: str, data: bytes):
+        """Add an in-memory member"""
+        self._reserve(name)
+        self._entries.append(_Entry(name, data=bytes(data)))
+
+    def write_json(self, name: str, obj: Any, indent: Optional[int] = 2):
+        """Add a JSON document as a member"""
+        self.write_bytes(name, json.dumps(obj, indent=indent, sort_keys=self.deterministic).encode('utf-8'))
+
+    def write_file(self, path: Path, name: Optional[str] = None):
+        """Add a file from disk; it is read (in chunks) when the package is written"""
+        path = Path(path)
+        name = name or path.name
+        self._reserve(name)
+        self._entries.append(_Entry(name, path=path, mtime=path.stat().st_mtime))
+
+    def commit(self) -> Path:
+        """Compress and write every member, then atomically move the archive into place"""
+        self._reserve_commit()
+        if self.deterministic:
+            date_time = time.gmtime(reproducible_timestamp())[:6]
+            for entry in self._entries:
+                entry.date_time = date_time
+            self._entries.sort(key=lambda entry: entry.name)
+        temp_path = self.zip_path.parent / f".{self.zip_path.name}.{uuid.uuid4().hex[:12]}.tmp"
+        self.zip_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # 'x' rather than mkstemp so the package gets the usual umask permissions
+            with open(temp_path, 'xb') as f:
+                if self._needs_zip64():
+                    self._write_with_zipfile(f)
+                else:
+                    self._write_archive(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.zip_path)
+        except BaseException:
+            try:
+                temp_path.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+        finally:
+            self._entries = []
+        return self.zip_path
+
+    def abort(self):
+        """Discard the queued members without writing anything"""
+        self._finished = True
+        self._entries = []
+
+    def _reserve_commit(self):
+        if self._finished:
+            raise RuntimeError("Package has already been written")
+        self._finished = True
+
+    def _needs_zip64(self) -> bool:
+        total = sum(entry.size for entry in self._entries)
+        # Leave headroom for headers and incompressible data growing slightly
+        return len(self._entries) >= ZIP32_MAX_MEMBERS or total >= ZIP32_LIMIT * 0.95
+
+    def _compress(self, entry: _Entry, method: int, start: int, length: int, last: bool):
+        raw = entry.read(start, length)
+        crc = zlib.crc32(raw)
+        if method == ZIP_ZSTANDARD:
+            compressed = zstandard.ZstdCompressor(level=self.level).compress(bytes(raw))
+        else:
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, -15)
+            # Sync-flushed chunks end byte-aligned, so they concatenate into one raw DEFLATE stream
+            compressed = compressor.compress(raw) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+        return crc, length, compressed, last
+
+    def _plan(self):
+        """Compression work items in archive order"""
+        for entry in self._entries:
+            method = self.method_for(entry.name)
+            if method == zipfile.ZIP_DEFLATED:
+                chunks = max(1, -(-entry.size // COMPRESS_CHUNK_SIZE))
+                for i in range(chunks):
+                    start = i * COMPRESS_CHUNK_SIZE
+                    yield entry, method, start, min(COMPRESS_CHUNK_SIZE, entry.size - start), i == chunks - 1
+            elif method == ZIP_ZSTANDARD:
+                yield entry, method, 0, entry.size, True
+
+    def _write_archive(self, f):
+        central = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            plan = self._plan()
+            pending = deque()
+            window = self.max_workers * 2
+
+            def next_result():
+                # Keep a bounded number of chunks in flight ahead of the writer
+                while len(pending) < window:
+                    item = next(plan, None)
+                    if item is None:
+                        break
+                    pending.append(pool.submit(self._compress, *item))
+                return pending.popleft().result()
+
+            for entry in self._entries:
+                method = self.method_for(entry.name)
+                name = entry.name.encode('utf-8')
+                flags = 0 if entry.name.isascii() else 0x800
+                version = 63 if method == ZIP_ZSTANDARD else 20
+                dos_time, dos_date = self._dos_date_time(entry.date_time)
+                offset = f.tell()
+                f.write(struct.pack('<IHHHHHIIIHH', 0x04034B50, version, flags, method, dos_time, dos_date,
+                                    0, 0, 0, len(name), 0) + name)
+
+                crc = 0
+                compressed_size = 0
+                if method == zipfile.ZIP_STORED:
+                    for start in range(0, entry.size, COPY_CHUNK_SIZE):
+                        raw = entry.read(start, min(COPY_CHUNK_SIZE, entry.size - start))
+                        crc = zlib.crc32(raw, crc)
+                        f.write(raw)
+                    compressed_size = entry.size
+                else:
+                    while True:
+                        part_crc, part_length, compressed, last = next_result()
+                        crc = crc32_combine(crc, part_crc, part_length)
+                        compressed_size += len(compressed)
+                        f.write(compressed)
+                        if last:
+                            break
+
+                # Patch CRC and sizes into the local header now that they are known
+                end = f.tell()
+                f.seek(offset + 14)
+                f.write(struct.pack('<III', crc, compressed_size, entry.size))
+                f.seek(end)
+                central.append(struct.pack('<IHHHHHHIIIHHHHHII', 0x02014B50, (3 << 8) | version, version, flags,
+                                           method, dos_time, dos_date, crc, compressed_size, entry.size,
+                                           len(name), 0, 0, 0, 0, 0o644 << 16, offset) + name)
+
+        directory_offset = f.tell()
+        for record in central:
+            f.write(record)
+        directory_size = f.tell() - directory_offset
+        f.write(struct.pack('<IHHHHIIH', 0x06054B50, 0, 0, len(central), len(central),
+                            directory_size, directory_offset, 0))
+
+    def _write_with_zipfile(self, f):
+        """Single-threaded zip64 path for packages beyond the classic 4 GiB / 65535 member limits"""
+        if self.compression == 'zstd':
+            raise ValueError("zstd ZIP compression is not supported for packages larger than 4 GiB")
+        with zipfile.ZipFile(f, 'w', allowZip64=True) as zipf:
+            for entry in self._entries:
+                info = zipfile.ZipInfo(entry.name, date_time=entry.date_time)
+                info.compress_type = self.method_for(entry.name)
+                info._compresslevel = self.level  # ZipInfo has no public level setter before 3.13
+                info.external_attr = 0o644 << 16
+                info.file_size = entry.size
+                with zipf.open(info, 'w', force_zip64=True) as dst:
+                    for start in range(0, entry.size, COPY_CHUNK_SIZE):
+                        dst.write(entry.read(start, min(COPY_CHUNK_SIZE, entry.size - start)))
+
+    @staticmethod
+    def _dos_date_time(date_time: Tuple[int, ...]) -> Tuple[int, int]:
+        year, month, day, hour, minute, second = date_time
+        return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
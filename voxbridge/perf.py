@@ -0,0 +1,402 @@
+"""
+VoxBridge Performance Harness
+Repeated, timed conversions with warmup, wall-time percentiles, peak memory and per-stage timings
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Process high-water mark (not available on Windows)
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+# Mann-Whitney U from SciPy when installed; an exact/normal fallback otherwise
+try:
+    from scipy.stats import mannwhitneyu
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+REPORT_VERSION = 1
+
+# Regression gate defaults
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_ALPHA = 0.05
+MIN_TIMING_DELTA = 0.001  # seconds; smaller changes are timer noise
+EXACT_TEST_LIMIT = 50
+
+
+def summarize(samples: Sequence[float]) -> Dict:
+    """Median, p95 (linear interpolation), min, max and mean of timing samples in seconds"""
+    if not samples:
+        return {'samples': [], 'median': None, 'p95': None, 'min': None, 'max': None, 'mean': None}
+    values = np.asarray(samples, dtype=np.float64)
+    return {
+        'samples': [round(float(value), 6) for value in values],
+        'median': round(float(np.median(values)), 6),
+        'p95': round(float(np.percentile(values, 95)), 6),
+        'min': round(float(values.min()), 6),
+        'max': round(float(values.max()), 6),
+        'mean': round(float(values.mean()), 6),
+    }
+
+
+def complexity_label(exponent: float) -> str:
+    """Nearest familiar growth class for a fitted log-log slope"""
+    if exponent < 0.25:
+        return 'O(1)'
+    if exponent < 0.75:
+        return 'O(sqrt n)'
+    if exponent < 1.35:
+        return 'O(n)'
+    if exponent < 1.75:
+        return 'O(n^1.5)'
+    if exponent < 2.5:
+        return 'O(n^2)'
+    return 'O(n^3)'
+
+
+def fit_complexity(sizes: Sequence[float], seconds: Sequence[Optional[float]]) -> Optional[Dict]:
+    """
+    Least-squares fit of log(time) against log(size). The slope is the
+    empirical exponent k in time ~ size^k. Returns None with fewer than two
+    usable points.
+    """
+    points = [(size, value) for size, value in zip(sizes, seconds)
+              if size and size > 0 and value is not None and value > 0]
+    if len(points) < 2 or len({size for size, _ in points}) < 2:
+        return None
+    x = np.log([size for size, _ in points])
+    y = np.log([value for _, value in points])
+    slope, intercept = np.polyfit(x, y, 1)
+    residual = y - (slope * x + intercept)
+    spread = ((y - y.mean()) ** 2).sum()
+    r2 = 1.0 - (residual ** 2).sum() / spread if spread > 0 else 1.0
+    return {
+        'exponent': round(float(slope), 3),
+        'r2': round(float(r2), 3),
+        'complexity': complexity_label(slope),
+        'superlinear': bool(slope >= 1.35),
+    }
+
+
+def sweep_report(sizes: Sequence[int], records: Sequence[Dict]) -> Dict:
+    """Fitted complexity of the wall time and of each stage across a size sweep"""
+    stages = sorted({stage for record in records for stage in record['stages']})
+    return {
+        'sizes': list(sizes),
+        'wall_time': fit_complexity(sizes, [record['wall_time']['median'] for record in records]),
+        'stages': {
+            stage: fit_complexity(sizes, [record['stages'].get(stage, {}).get('median') for record in records])
+            for stage in stages
+        },
+    }
+
+
+def _exact_u_distribution(n1: int, n2: int) -> np.ndarray:
+    """Number of orderings giving each U in 0..n1*n2 for untied samples of sizes n1 and n2"""
+    table = [[None] * (n2 + 1) for _ in range(n1 + 1)]
+    for i in range(n1 + 1):
+        for j in range(n2 + 1):
+            if i == 0 or j == 0:
+                table[i][j] = np.ones(1, dtype=np.float64)
+                continue
+            # The largest value belongs to the first sample (beating all j) or to the second
+            counts = np.zeros(i * j + 1, dtype=np.float64)
+            counts[j:j + len(table[i - 1][j])] += table[i - 1][j]
+            counts[:len(table[i][j - 1])] += table[i][j - 1]
+            table[i][j] = counts
+    return table[n1][n2]
+
+
+def mann_whitney_greater(current: Sequence[float], baseline: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U p-value for "current tends to be larger than
+    baseline". Uses SciPy when available; otherwise the exact distribution
+    for small untied samples and the tie-corrected normal approximation.
+    """
+    x = np.asarray(current, dtype=np.float64)
+    y = np.asarray(baseline, dtype=np.float64)
+    if SCIPY_AVAILABLE:
+        return float(mannwhitneyu(x, y, alternative='greater').pvalue)
+
+    n1, n2 = len(x), len(y)
+    u = float((x[:, None] > y[None, :]).sum() + 0.5 * (x[:, None] == y[None, :]).sum())
+    values = np.concatenate([x, y])
+    if len(np.unique(values)) == len(values) and max(n1, n2) <= EXACT_TEST_LIMIT:
+        counts = _exact_u_distribution(n1, n2)
+        return float(counts[int(math.ceil(u)):].sum() / counts.sum())
+
+    n = n1 + n2
+    _, ties = np.unique(values, return_counts=True)
+    variance = n1 * n2 / 12.0 * ((n + 1) - (ties ** 3 - ties).sum() / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2.0 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def smallest_p_value(n1: int, n2: int) -> float:
+    """
+    Smallest one-sided Mann-Whitney p-value samples of sizes n1 and n2 can
+    reach (complete separation, 1 / C(n1 + n2, n1)); three repetitions a
+    side cannot get below 0.05
+    """
+    return 1.0 / math.comb(n1 + n2, n1)
+
+
+def _compare_timing(asset: str, metric: str, baseline: Optional[Dict], current: Optional[Dict],
+                    threshold: float, alpha: float) -> Optional[Dict]:
+    if not baseline or not current or not baseline.get('median') or current.get('median') is None:
+        return None
+    base, now = baseline['median'], current['median']
+    change = (now - base) / base
+    old_samples, new_samples = baseline.get('samples') or [], current.get('samples') or []
+    p_slower = p_faster = None
+    # With too few repetitions for the test to ever reject at alpha, the threshold decides alone
+    if old_samples and new_samples and smallest_p_value(len(old_samples), len(new_samples)) < alpha:
+        p_slower = mann_whitney_greater(new_samples, old_samples)
+        p_faster = mann_whitney_greater(old_samples, new_samples)
+
+    status = 'unchanged'
+    if abs(now - base) >= MIN_TIMING_DELTA:
+        if change > threshold and (p_slower is None or p_slower < alpha):
+            status = 'regression'
+        elif change < -threshold and (p_faster is None or p_faster < alpha):
+            status = 'improvement'
+    return {
+        'asset': asset, 'metric': metric, 'baseline': base, 'current': now,
+        'change': round(change, 4), 'p_value': None if p_slower is None else round(
+            p_slower if change >= 0 else p_faster, 4),
+        'status': status,
+    }
+
+
+def _compare_value(asset: str, metric: str, base, now, threshold: float) -> Optional[Dict]:
+    if base is None or now is None:
+        return None
+    if base == 0:
+        change = 0.0 if now == 0 else float('inf')
+    else:
+        change = (now - base) / base
+    status = 'unchanged'
+    if change > threshold:
+        status = 'regression'
+    elif change < -threshold:
+        status = 'improvement'
+    return {
+        'asset': asset, 'metric': metric, 'baseline': base, 'current': now,
+        'change': round(change, 4) if math.isfinite(change) else None, 'p_value': None, 'status': status,
+    }
+
+
+# Deterministic per-asset metrics compared without a noise test (lower is better)
+OUTPUT_METRICS = ('file_size', 'texture_memory', 'triangles', 'draw_calls')
+
+
+def compare_reports(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD,
+                    alpha: float = DEFAULT_ALPHA) -> Dict:
+    """
+    Diff two harness reports asset by asset. Timings (total and per stage)
+    count as regressions only when the median slows by more than threshold
+    and a one-sided Mann-Whitney test on the repetitions rejects "no
+    change" at alpha. Output sizes and peak heap are deterministic and use
+    the threshold alone.
+    """
+    baseline_assets = {record['asset']: record for record in baseline.get('assets', [])}
+    current_assets = {record['asset']: record for record in current.get('assets', [])}
+    rows = []
+    for asset in sorted(current_assets):
+        if asset not in baseline_assets:
+            continue
+        old, new = baseline_assets[asset], current_assets[asset]
+        rows.append(_compare_timing(asset, 'wall_time', old.get('wall_time'), new.get('wall_time'),
+                                    threshold, alpha))
+        for stage in sorted(set(old.get('stages', {})) & set(new.get('stages', {}))):
+            rows.append(_compare_timing(asset, f'stage:{stage}', old['stages'][stage], new['stages'][stage],
+                                        threshold, alpha))
+        for metric in OUTPUT_METRICS:
+            rows.append(_compare_value(asset, f'output:{metric}', old.get('output', {}).get(metric),
+                                       new.get('output', {}).get(metric), threshold))
+        rows.append(_compare_value(asset, 'memory:peak_traced_bytes',
+                                   old.get('memory', {}).get('peak_traced_bytes'),
+                                   new.get('memory', {}).get('peak_traced_bytes'), threshold))
+    rows = [row for row in rows if row is not None]
+    return {
+        'threshold': threshold,
+        'alpha': alpha,
+        'test': 'mann-whitney-u' + ('' if SCIPY_AVAILABLE else ' (builtin)'),
+        'same_machine': baseline.get('machine') == current.get('machine'),
+        'missing_assets': sorted(set(baseline_assets) - set(current_assets)),
+        'new_assets': sorted(set(current_assets) - set(baseline_assets)),
+        'regressions': sum(row['status'] == 'regression' for row in rows),
+        'improvements': sum(row['status'] == 'improvement' for row in rows),
+        'rows': rows,
+    }
+
+
+def parse_threshold(value: str) -> float:
+    """Parse a regression threshold such as '10%' or '10' (percent) into a fraction"""
+    number = float(value.strip().rstrip('%'))
+    if number < 0:
+        raise ValueError("threshold cannot be negative")
+    return number / 100.0
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process so far (monotonic), or None if unavailable"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return int(peak) if sys.platform == 'darwin' else int(peak) * 1024
+
+
+def machine_info() -> Dict:
+    """Host description stored with every report so runs can be compared fairly"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+class ConversionBenchmark:
+    """
+    Runs convert_file repeatedly on one converter: warmup runs are discarded,
+    timed runs give wall-time and per-stage percentiles, and one extra run
+    under tracemalloc gives the peak Python heap (kept separate so tracing
+    overhead never skews the timings).
+    """
+
+    def __init__(self, converter, repetitions: int = 5, warmup: int = 1, trace_memory: bool = True):
+        if repetitions < 1:
+            raise ValueError("repetitions must be at least 1")
+        if warmup < 0:
+            raise ValueError("warmup cannot be negative")
+        self.converter = converter
+        # Output texture memory is one of the compared metrics
+        self.converter.detailed_stats = True
+        self.repetitions = repetitions
+        self.warmup = warmup
+        self.trace_memory = trace_memory
+        self.results: List[Dict] = []
+
+    def _convert(self, input_path: Path, output_path: Path, convert_kwargs: Dict) -> bool:
+        # Converter progress messages would repeat once per run; only debug mode keeps them
+        if self.converter.debug:
+            return self.converter.convert_file(input_path, output_path, **convert_kwargs)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.converter.convert_file(input_path, output_path, **convert_kwargs)
+
+    def run_asset(self, input_path: Path, output_path: Path, **convert_kwargs) -> Dict:
+        """Benchmark one input file; convert_kwargs are passed to convert_file"""
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+        errors = []
+
+        def run() -> bool:
+            try:
+                success = self._convert(input_path, output_path, convert_kwargs)
+            except Exception as e:
+                errors.append(str(e))
+                return False
+            # Rejected inputs fail without raising; the result says why
+            result = self.converter.last_result
+            if not success and result is not None and result.error:
+                errors.append(result.error)
+            return success
+
+        for _ in range(self.warmup):
+            run()
+
+        wall_times = []
+        stage_samples: Dict[str, List[float]] = {}
+        successes = 0
+        for _ in range(self.repetitions):
+            start = time.perf_counter()
+            success = run()
+            wall_times.append(time.perf_counter() - start)
+            successes += bool(success)
+            for stage, seconds in self.converter.stage_timings.items():
+                stage_samples.setdefault(stage, []).append(seconds)
+
+        result = self.converter.last_result
+        stats = dict(result.stats) if result is not None else {}
+
+        traced_peak = None
+        if self.trace_memory:
+            already_tracing = tracemalloc.is_tracing()
+            if not already_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            run()
+            traced_peak = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+            if not already_tracing:
+                tracemalloc.stop()
+
+        record = {
+            'asset': input_path.stem,
+            'input_file': str(input_path),
+            'input_size': input_path.stat().st_size if input_path.exists() else 0,
+            'success': successes == self.repetitions,
+            'successful_runs': successes,
+            'errors': sorted(set(errors)),
+            'wall_time': summarize(wall_times),
+            'stages': {stage: summarize(samples) for stage, samples in sorted(stage_samples.items())},
+            'memory': {
+                'peak_traced_bytes': traced_peak,
+            },
+            'output': {
+                'file_size': stats.get('file_size', 0),
+                'triangles': stats.get('triangles'),
+                'vertices': stats.get('vertices'),
+                'draw_calls': stats.get('draw_calls'),
+                'texture_memory': stats.get('texture_memory'),
+                'buffer_bytes': stats.get('buffer_bytes', {}),
+            },
+        }
+        self.results.append(record)
+        return record
+
+    def report(self, settings: Optional[Dict] = None, **sections) -> Dict:
+        """Machine-readable report of every asset benchmarked so far, plus optional sections (sweep, comparison)"""
+        report = {
+            'version': REPORT_VERSION,
+            'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'machine': machine_info(),
+            # Process-wide high-water mark across every asset, so not attributable to one of them
+            'peak_rss_bytes': peak_rss_bytes(),
+            'settings': dict(settings or {}, repetitions=self.repetitions, warmup=self.warmup,
+                             trace_memory=self.trace_memory),
+            'assets': self.results,
+        }
+        report.update((name, section) for name, section in sections.items() if section is not None)
+        return report
+
+    def save_report(self, report_path: Path, settings: Optional[Dict] = None, **sections) -> Dict:
+        """Write the report as JSON and return it"""
+        report = self.report(settings, **sections)
+        report_path = Path(report_path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        return report
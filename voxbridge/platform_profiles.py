@@ -17,14 +17,43 @@ class PlatformProfile:
     def __init__(self, debug: bool = False):
         self.debug = debug
         self.profile_name = "base"
+        # Run gltf-validator as an extra cross-check (the converter validates in-process)
+        self.external_validation = False
     
     def optimize_gltf(self, gltf_data: Dict, output_path: Path) -> Dict:
         """Apply platform-specific optimizations to glTF data"""
         raise NotImplementedError("Subclasses must implement optimize_gltf")
     
+    def check_gltf(self, gltf_data: Dict) -> Tuple[List[str], List[str]]:
+        """Check platform rules on an in-memory glTF document; returns (errors, warnings)"""
+        raise NotImplementedError("Subclasses must implement check_gltf")
+    
     def validate_output(self, gltf_path: Path) -> Tuple[bool, List[str]]:
         """Validate the output glTF file for platform compatibility"""
-        raise NotImplementedError("Subclasses must implement validate_output")
+        errors = []
+        warnings = []
+        
+        try:
+            with open(gltf_path, 'r', encoding='utf-8') as f:
+                gltf_data = json.load(f)
+            
+            errors, warnings = self.check_gltf(gltf_data)
+            
+            # Cross-check with glTF validator if enabled and available
+            validation_result = self._run_gltf_validator(gltf_path) if self.external_validation else None
+            if validation_result:
+                is_valid, validator_errors = validation_result
+                if not is_valid:
+                    errors.extend(validator_errors)
+            
+        except Exception as e:
+            errors.append(f"Validation failed: {e}")
+        
+        return len(errors) == 0, errors + warnings
+    
+    def _run_gltf_validator(self, gltf_path: Path) -> Optional[Tuple[bool, List[str]]]:
+        """Run glTF-Validator if available (implemented by the profiles)"""
+        return None
 
 
 class UnityProfile(PlatformProfile):
@@ -87,55 +116,41 @@ class UnityProfile(PlatformProfile):
         
         # Ensure proper node hierarchy for Unity
         if 'nodes' in gltf_data:
-            for node in gltf_data['nodes']:
-                # Ensure nodes have proper names for Unity
+            for index, node in enumerate(gltf_data['nodes']):
+                # Ensure nodes have proper names for Unity (index-based so they are stable across runs)
                 if 'name' not in node:
-                    node['name'] = f"Node_{id(node)}"
+                    node['name'] = f"Node_{index}"
         
         if self.debug:
             print("Unity optimization complete")
         
         return gltf_data
     
-    def validate_output(self, gltf_path: Path) -> Tuple[bool, List[str]]:
-        """Validate glTF for Unity compatibility"""
+    def check_gltf(self, gltf_data: Dict) -> Tuple[List[str], List[str]]:
+        """Check Unity compatibility rules on an in-memory document"""
         errors = []
         warnings = []
         
-        try:
-            with open(gltf_path, 'r', encoding='utf-8') as f:
-                gltf_data = json.load(f)
-            
-            # Check for required components
-            if 'asset' not in gltf_data:
-                errors.append("Missing asset information")
-            
-            if 'scene' not in gltf_data:
-                errors.append("Missing scene definition")
-            
-            # Check materials
-            if 'materials' in gltf_data:
-                for i, material in enumerate(gltf_data['materials']):
-                    if 'pbrMetallicRoughness' not in material:
-                        warnings.append(f"Material {i} missing PBR definition")
-            
-            # Check for embedded textures (should be external for Unity)
-            if 'images' in gltf_data:
-                for i, image in enumerate(gltf_data['images']):
-                    if 'uri' in image and image['uri'].startswith('data:'):
-                        warnings.append(f"Image {i} is embedded (should be external for Unity)")
-            
-            # Run glTF validator if available
-            validation_result = self._run_gltf_validator(gltf_path)
-            if validation_result:
-                is_valid, validator_errors = validation_result
-                if not is_valid:
-                    errors.extend(validator_errors)
-            
-        except Exception as e:
-            errors.append(f"Validation failed: {e}")
+        # Check for required components
+        if 'asset' not in gltf_data:
+            errors.append("Missing asset information")
         
-        return len(errors) == 0, errors + warnings
+        if 'scene' not in gltf_data:
+            errors.append("Missing scene definition")
+        
+        # Check materials
+        if 'materials' in gltf_data:
+            for i, material in enumerate(gltf_data['materials']):
+                if 'pbrMetallicRoughness' not in material:
+                    warnings.append(f"Material {i} missing PBR definition")
+        
+        # Check for embedded textures (should be external for Unity)
+        if 'images' in gltf_data:
+            for i, image in enumerate(gltf_data['images']):
+                if 'uri' in image and image['uri'].startswith('data:'):
+                    warnings.append(f"Image {i} is embedded (should be external for Unity)")
+        
+        return errors, warnings
     
     def _run_gltf_validator(self, gltf_path: Path) -> Optional[Tuple[bool, List[str]]]:
         """Run glTF-Validator if available"""
@@ -253,56 +268,42 @@ class RobloxProfile(PlatformProfile):
         
         return gltf_data
     
-    def validate_output(self, gltf_path: Path) -> Tuple[bool, List[str]]:
-        """Validate glTF for Roblox compatibility"""
+    def check_gltf(self, gltf_data: Dict) -> Tuple[List[str], List[str]]:
+        """Check Roblox compatibility rules on an in-memory document"""
         errors = []
         warnings = []
         
-        try:
-            with open(gltf_path, 'r', encoding='utf-8') as f:
-                gltf_data = json.load(f)
-            
-            # Check for required components
-            if 'asset' not in gltf_data:
-                errors.append("Missing asset information")
-            
-            if 'scene' not in gltf_data:
-                errors.append("Missing scene definition")
-            
-            # Check materials (should be simplified)
-            if 'materials' in gltf_data:
-                for i, material in enumerate(gltf_data['materials']):
-                    if 'pbrMetallicRoughness' not in material:
-                        errors.append(f"Material {i} missing PBR definition")
-                    
-                    # Check for unsupported material properties
-                    pbr = material.get('pbrMetallicRoughness', {})
-                    if 'metallicFactor' in pbr or 'roughnessFactor' in pbr:
-                        warnings.append(f"Material {i} has metallic/roughness (may not work in Roblox)")
-            
-            # Check for embedded textures (should be external for Roblox)
-            if 'images' in gltf_data:
-                for i, image in enumerate(gltf_data['images']):
-                    if 'uri' in image and image['uri'].startswith('data:'):
-                        errors.append(f"Image {i} is embedded (Roblox requires external textures)")
-            
-            # Check node names (Roblox has length limits)
-            if 'nodes' in gltf_data:
-                for i, node in enumerate(gltf_data['nodes']):
-                    if 'name' in node and len(node['name']) > 32:
-                        warnings.append(f"Node {i} name too long for Roblox: {node['name']}")
-            
-            # Run glTF validator if available
-            validation_result = self._run_gltf_validator(gltf_path)
-            if validation_result:
-                is_valid, validator_errors = validation_result
-                if not is_valid:
-                    errors.extend(validator_errors)
-            
-        except Exception as e:
-            errors.append(f"Validation failed: {e}")
+        # Check for required components
+        if 'asset' not in gltf_data:
+            errors.append("Missing asset information")
         
-        return len(errors) == 0, errors + warnings
+        if 'scene' not in gltf_data:
+            errors.append("Missing scene definition")
+        
+        # Check materials (should be simplified)
+        if 'materials' in gltf_data:
+            for i, material in enumerate(gltf_data['materials']):
+                if 'pbrMetallicRoughness' not in material:
+                    errors.append(f"Material {i} missing PBR definition")
+                
+                # Check for unsupported material properties
+                pbr = material.get('pbrMetallicRoughness', {})
+                if 'metallicFactor' in pbr or 'roughnessFactor' in pbr:
+                    warnings.append(f"Material {i} has metallic/roughness (may not work in Roblox)")
+        
+        # Check for embedded textures (should be external for Roblox)
+        if 'images' in gltf_data:
+            for i, image in enumerate(gltf_data['images']):
+                if 'uri' in image and image['uri'].startswith('data:'):
+                    errors.append(f"Image {i} is embedded (Roblox requires external textures)")
+        
+        # Check node names (Roblox has length limits)
+        if 'nodes' in gltf_data:
+            for i, node in enumerate(gltf_data['nodes']):
+                if 'name' in node and len(node['name']) > 32:
+                    warnings.append(f"Node {i} name too long for Roblox: {node['name']}")
+        
+        return errors, warnings
     
     def _run_gltf_validator(self, gltf_path: Path) -> Optional[Tuple[bool, List[str]]]:
         """Run glTF-Validator if available"""
@@ -343,6 +344,11 @@ class PlatformProfileManager:
             'roblox': RobloxProfile(debug)
         }
     
+    def set_external_validation(self, enabled: bool):
+        """Enable or disable the gltf-validator cross-check for every profile"""
+        for profile in self.profiles.values():
+            profile.external_validation = enabled
+    
     def get_profile(self, platform: str) -> PlatformProfile:
         """Get the appropriate profile for the platform"""
         platform_lower = platform.lower()
@@ -363,8 +369,16 @@ class PlatformProfileManager:
         profile = self.get_profile(platform)
         return profile.validate_output(gltf_path)
     
-    def create_platform_specific_outputs(self, gltf_data: Dict, base_output_path: Path, platform: str) -> List[Path]:
-        """Create platform-specific output files"""
+    def check_gltf(self, gltf_data: Dict, platform: str) -> Tuple[List[str], List[str]]:
+        """Check platform rules on an in-memory document; returns (errors, warnings)"""
+        return self.get_profile(platform).check_gltf(gltf_data)
+    
+    def create_platform_specific_outputs(self, gltf_data: Dict, base_output_path: Path, platform: str,
+                                         sort_keys: bool = False, validate: bool = True) -> List[Path]:
+        """
+        Create platform-specific output files (sort_keys gives a stable JSON
+        key order). validate=False leaves validation to the caller.
+        """
         outputs = []
         
         # Create platform-specific filename
@@ -375,10 +389,13 @@ class PlatformProfileManager:
         
         # Write optimized glTF
         with open(platform_output, 'w', encoding='utf-8') as f:
-            json.dump(optimized_data, f, indent=2)
+            json.dump(optimized_data, f, indent=2, sort_keys=sort_keys)
         
         outputs.append(platform_output)
         
+        if not validate:
+            return outputs
+        
         # Validate the output
         is_valid, validation_messages = self.validate_output(platform_output, platform)
         
@@ -0,0 +1,292 @@
+"""
+VoxBridge Profiling Module
+Named spans around conversion stages, with optional cProfile and flamegraph (collapsed stack) export,
+and tracemalloc snapshots at stage boundaries
+"""
+
+import cProfile
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+
+class Span(NamedTuple):
+    """One finished span; nesting is recovered from time containment per thread"""
+    name: str
+    start: float
+    end: float
+    thread: int
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class _SpanContext:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: 'Profiler', name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.start, time.perf_counter())
+        return False
+
+
+class _NullSpan:
+    """Shared do-nothing context returned while profiling is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """
+    Collects named spans for one or more conversions. Disabled profilers
+    hand out a shared no-op context and record nothing, so instrumented
+    code costs a method call and a flag check per span.
+    """
+
+    def __init__(self, enabled: bool = False, cprofile: bool = False):
+        self.enabled = enabled
+        self.spans: List[Span] = []
+        self._cprofile = cProfile.Profile() if enabled and cprofile else None
+        self._lock = threading.Lock()
+
+    def span(self, name: str):
+        """Context manager timing the enclosed block as a span called name"""
+        if not self.enabled:
+            return NULL_SPAN
+        return _SpanContext(self, name)
+
+    def record(self, name: str, start: float, end: float):
+        """Record an already measured interval (perf_counter seconds) as a span"""
+        if self.enabled:
+            with self._lock:
+                self.spans.append(Span(name, start, end, threading.get_ident()))
+
+    def start(self):
+        """Start the optional cProfile session"""
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def stop(self):
+        """Stop the optional cProfile session"""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+    def _stacks(self) -> List[tuple]:
+        """(stack path, span) for every span, parents found by time containment"""
+        stacks = []
+        by_thread: Dict[int, List[Span]] = {}
+        for span in self.spans:
+            by_thread.setdefault(span.thread, []).append(span)
+        for spans in by_thread.values():
+            # Outer spans first: earlier start, then longer duration
+            open_spans: List[tuple] = []
+            for span in sorted(spans, key=lambda s: (s.start, -s.end)):
+                while open_spans and not (span.start >= open_spans[-1][1].start and span.end <= open_spans[-1][1].end):
+                    open_spans.pop()
+                path = (open_spans[-1][0] if open_spans else ()) + (span.name,)
+                stacks.append((path, span))
+                open_spans.append((path, span))
+        return stacks
+
+    def summary(self) -> List[Dict]:
+        """Total and self time per stack path, in tree order with the slowest siblings first"""
+        stacks = self._stacks()
+        totals: Dict[tuple, Dict] = {}
+        for path, span in stacks:
+            entry = totals.setdefault(path, {'path': list(path), 'calls': 0, 'total': 0.0, 'self': 0.0})
+            entry['calls'] += 1
+            entry['total'] += span.duration
+            entry['self'] += span.duration
+        for path, span in stacks:
+            if len(path) > 1:
+                totals[path[:-1]]['self'] -= span.duration
+        children: Dict[tuple, List[tuple]] = {}
+        for path in totals:
+            children.setdefault(path[:-1], []).append(path)
+        entries = []
+        pending = sorted(children.get((), []), key=lambda path: totals[path]['total'])
+        while pending:
+            path = pending.pop()
+            entries.append(totals[path])
+            pending.extend(sorted(children.get(path, []), key=lambda child: totals[child]['total']))
+        for entry in entries:
+            entry['total'] = round(entry['total'], 6)
+            entry['self'] = round(max(entry['self'], 0.0), 6)
+        return entries
+
+    def collapsed_stacks(self) -> List[str]:
+        """Brendan Gregg collapsed-stack lines ("a;b;c <self microseconds>") for flamegraph tools"""
+        lines = []
+        for entry in sorted(self.summary(), key=lambda entry: entry['path']):
+            micros = int(round(entry['self'] * 1e6))
+            if micros > 0:
+                lines.append(f"{';'.join(entry['path'])} {micros}")
+        return lines
+
+    def write(self, output_dir: Path, name: str) -> List[Path]:
+        """
+        Write <name>.profile.json (span summary), <name>.folded (collapsed
+        stacks) and, when cProfile was enabled, <name>.pstats. Returns the
+        written paths.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+
+        summary_path = output_dir / f"{name}.profile.json"
+        origin = min((span.start for span in self.spans), default=0.0)
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'summary': self.summary(),
+                'spans': [{'name': span.name, 'start': round(span.start - origin, 6),
+                           'duration': round(span.duration, 6), 'thread': span.thread}
+                          for span in sorted(self.spans, key=lambda s: s.start)],
+            }, f, indent=2)
+        written.append(summary_path)
+
+        folded_path = output_dir / f"{name}.folded"
+        folded_path.write_text('\n'.join(self.collapsed_stacks()) + '\n', encoding='utf-8')
+        written.append(folded_path)
+
+        if self._cprofile is not None:
+            pstats_path = output_dir / f"{name}.pstats"
+            self._cprofile.dump_stats(str(pstats_path))
+            written.append(pstats_path)
+        return written
+
+
+class MemoryProfiler:
+    """
+    Takes a tracemalloc snapshot at every stage boundary of a conversion.
+    Each stage reports the traced memory when it started, its peak, what
+    it retained when it finished, and the source lines that allocated the
+    retained memory. Disabled profilers ignore every call.
+    """
+
+    # Allocations made by the profilers, tracemalloc or the import system are not the pipeline's
+    IGNORED = (__file__, tracemalloc.__file__, '<frozen importlib._bootstrap>', '<frozen importlib._bootstrap_external>', '<unknown>')
+
+    def __init__(self, enabled: bool = False, top: int = 5, frames: int = 1):
+        self.enabled = enabled
+        self.top = top
+        self.frames = frames
+        self.stages: List[Dict] = []
+        self._owns_tracing = False
+        self._first = None
+        self._snapshot = None
+        self._current = 0
+
+    def begin(self):
+        """Start tracing (unless already tracing) and reset the stage list"""
+        if not self.enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._owns_tracing = True
+        self.stages = []
+        self._first = self._snapshot = self._take_snapshot()
+        self._current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def stage(self, name: str):
+        """Close the stage running since the previous boundary and label it name"""
+        if not self.enabled or self._snapshot is None:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = self._take_snapshot()
+        self.stages.append({
+            'stage': name,
+            'start_bytes': self._current,
+            'peak_bytes': peak,
+            'retained_bytes': current - self._current,
+            'top_allocations': self._top_sites(snapshot, self._snapshot),
+        })
+        self._snapshot = snapshot
+        self._current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def end(self):
+        """Stop tracing if begin started it; the collected stages are kept"""
+        if not self.enabled:
+            return
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        self._snapshot = None
+
+    def report(self) -> Optional[Dict]:
+        """Per-boundary stages, per-stage totals and the conversion's overall peak, or None before any stage"""
+        if not self.stages:
+            return None
+        by_stage: Dict[str, Dict] = {}
+        for entry in self.stages:
+            totals = by_stage.setdefault(entry['stage'], {'peak_bytes': 0, 'retained_bytes': 0})
+            totals['peak_bytes'] = max(totals['peak_bytes'], entry['peak_bytes'])
+            totals['retained_bytes'] += entry['retained_bytes']
+        peak_entry = max(self.stages, key=lambda entry: entry['peak_bytes'])
+        return {
+            'peak_bytes': peak_entry['peak_bytes'],
+            'peak_stage': peak_entry['stage'],
+            'retained_bytes': sum(entry['retained_bytes'] for entry in self.stages),
+            'by_stage': by_stage,
+            'stages': self.stages,
+        }
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, pattern) for pattern in self.IGNORED])
+
+    def _top_sites(self, snapshot, previous) -> List[Dict]:
+        """Source lines with the largest growth between two snapshots"""
+        grown = [stat for stat in snapshot.compare_to(previous, 'lineno') if stat.size_diff > 0]
+        sites = []
+        for stat in sorted(grown, key=lambda stat: stat.size_diff, reverse=True)[:self.top]:
+            frame = stat.traceback[0]
+            # Last two path parts keep the package visible (voxbridge/converter.py, PIL/Image.py)
+            filename = '/'.join(Path(frame.filename).parts[-2:])
+            sites.append({'site': f"{filename}:{frame.lineno}", 'size_bytes': stat.size_diff,
+                          'count': stat.count_diff})
+        return sites
+
+
+def traced(name: Optional[str] = None):
+    """
+    Method decorator recording a span on self.profiler. The span name
+    defaults to the method name without leading underscores. When profiling
+    is off the method is called directly.
+    """
+    def decorator(method):
+        span_name = name or method.__name__.lstrip('_')
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.profiler
+            if not profiler.enabled:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                profiler.record(span_name, start, time.perf_counter())
+        return wrapper
+    return decorator
@@ -0,0 +1,54 @@
+"""
+VoxBridge Schemas
+JSON-Schema checks against the bundled glTF 2.0 and performance report schemas
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from jsonschema.validators import validator_for
+
+SCHEMA_DIR = Path(__file__).parent / 'reporting' / 'schema'
+GLTF_SCHEMA = 'gltf.schema.json'
+REPORT_SCHEMA = 'report.schema.json'
+
+# Longest single message kept; jsonschema echoes whole offending objects
+MAX_MESSAGE_LENGTH = 200
+
+
+@lru_cache(maxsize=None)
+def get_validator(name: str):
+    """
+    Load a bundled schema and compile its validator. Cached for the life of
+    the process, so a batch run checks every file with the same validator.
+    """
+    with open(SCHEMA_DIR / name, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def schema_errors(instance, name: str, limit: Optional[int] = None) -> List[str]:
+    """Check instance against a bundled schema; returns "pointer: message" strings"""
+    errors = sorted(get_validator(name).iter_errors(instance), key=lambda error: list(map(str, error.absolute_path)))
+    messages = []
+    for error in errors[:limit]:
+        pointer = ''.join(f"/{part}" for part in error.absolute_path) or '/'
+        message = error.message
+        if len(message) > MAX_MESSAGE_LENGTH:
+            message = message[:MAX_MESSAGE_LENGTH - 3] + '...'
+        messages.append(f"{pointer}: {message}")
+    return messages
+
+
+def check_gltf_schema(gltf_data: Dict, limit: Optional[int] = None) -> List[str]:
+    """Schema errors of a glTF 2.0 JSON document"""
+    return schema_errors(gltf_data, GLTF_SCHEMA, limit)
+
+
+def check_report_schema(report: Dict, limit: Optional[int] = None) -> List[str]:
+    """Schema errors of a performance report"""
+    return schema_errors(report, REPORT_SCHEMA, limit)
@@ -0,0 +1,227 @@
+"""
+VoxBridge Statistics Module
+Geometry, draw call and GPU memory statistics computed on in-memory glTF documents
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .accessors import COMPONENT_DTYPES, accessor_array, element_size, is_decodable
+from .gltf_io import image_bytes, read_gltf_document, resolve_uri
+from .image_probe import probe_image, probe_image_bytes
+
+# Primitive modes (glTF 2.0 mesh.primitive.mode)
+MODE_POINTS, MODE_LINES, MODE_LINE_LOOP, MODE_LINE_STRIP = 0, 1, 2, 3
+MODE_TRIANGLES, MODE_TRIANGLE_STRIP, MODE_TRIANGLE_FAN = 4, 5, 6
+
+# Block-compressed KTX2 payloads (BCn/ASTC 4x4/ETC2) average one byte per texel
+KTX2_BYTES_PER_PIXEL = 1
+# Everything else is decoded to RGBA8 on upload
+RGBA_BYTES_PER_PIXEL = 4
+
+
+def primitive_triangles(mode: int, element_count: int) -> int:
+    """Triangles drawn by one primitive with element_count indices (or vertices)"""
+    if mode == MODE_TRIANGLES:
+        return element_count // 3
+    if mode in (MODE_TRIANGLE_STRIP, MODE_TRIANGLE_FAN):
+        return max(element_count - 2, 0)
+    return 0
+
+
+def mip_chain_pixels(width: int, height: int, levels: Optional[int] = None) -> int:
+    """Texels in a mip chain (the full chain down to 1x1 unless levels is given)"""
+    total = 0
+    level = 0
+    while True:
+        total += max(width >> level, 1) * max(height >> level, 1)
+        level += 1
+        if levels is not None and level >= levels:
+            break
+        if levels is None and (width >> level) == 0 and (height >> level) == 0:
+            break
+    return total
+
+
+def texture_gpu_bytes(image_format: str, width: int, height: int, levels: int = 1) -> int:
+    """
+    Estimated GPU memory of one texture. KTX2 files carry their own mip
+    levels; other formats get a full chain generated at import time.
+    """
+    if image_format == 'KTX2':
+        return mip_chain_pixels(width, height, levels) * KTX2_BYTES_PER_PIXEL
+    return mip_chain_pixels(width, height) * RGBA_BYTES_PER_PIXEL
+
+
+def _accessor_bytes(accessor: Dict) -> int:
+    if not is_decodable(accessor):
+        return 0
+    size = element_size(COMPONENT_DTYPES[accessor['componentType']].itemsize, accessor['type'])
+    return size * accessor['count']
+
+
+def _scene_mesh_instances(gltf_data: Dict) -> List[int]:
+    """Mesh index of every node instance reachable from the default scene"""
+    nodes = gltf_data.get('nodes', []) or []
+    scenes = gltf_data.get('scenes', []) or []
+    scene_index = gltf_data.get('scene', 0)
+    if isinstance(scene_index, int) and 0 <= scene_index < len(scenes):
+        pending = list(scenes[scene_index].get('nodes', []) or [])
+    else:
+        pending = list(range(len(nodes)))
+
+    meshes = []
+    visited = set()
+    while pending:
+        index = pending.pop()
+        if not isinstance(index, int) or not 0 <= index < len(nodes) or index in visited:
+            continue
+        visited.add(index)
+        node = nodes[index]
+        if isinstance(node.get('mesh'), int):
+            meshes.append(node['mesh'])
+        pending.extend(node.get('children', []) or [])
+    return meshes
+
+
+def compute_stats(gltf_data: Dict, buffers: Optional[Sequence[Optional[bytes]]] = None,
+                  search_dirs: Sequence[Path] = (), detailed: bool = True) -> Dict:
+    """
+    Statistics of an in-memory glTF document:
+    triangles (per primitive mode), vertices, unique vertex positions (when
+    buffers are loaded), draw calls for the default scene, per-texture GPU
+    memory including mips, and accessor bytes by attribute semantic.
+    detailed=False skips the two that read data (unique vertices decode
+    every POSITION accessor, texture memory probes every image) and leaves
+    them None; the counts come from the JSON alone.
+    """
+    accessors = gltf_data.get('accessors', []) or []
+    meshes = gltf_data.get('meshes', []) or []
+    buffers = list(buffers) if buffers is not None else []
+
+    def accessor(index) -> Optional[Dict]:
+        if isinstance(index, int) and 0 <= index < len(accessors):
+            return accessors[index]
+        return None
+
+    triangles_by_mode: Dict[str, int] = {}
+    mesh_triangles = []
+    mesh_primitives = []
+    vertices = 0
+    position_accessors = set()
+    semantic_accessors: Dict[str, set] = {}
+    for mesh in meshes:
+        triangles = 0
+        primitives = mesh.get('primitives', []) or []
+        for primitive in primitives:
+            attributes = primitive.get('attributes') or {}
+            position = accessor(attributes.get('POSITION'))
+            vertex_count = position.get('count', 0) if position else 0
+            vertices += vertex_count
+            if position:
+                position_accessors.add(attributes['POSITION'])
+
+            indices = accessor(primitive.get('indices'))
+            element_count = indices.get('count', 0) if indices else vertex_count
+            mode = primitive.get('mode', MODE_TRIANGLES)
+            count = primitive_triangles(mode, element_count)
+            triangles += count
+            triangles_by_mode[str(mode)] = triangles_by_mode.get(str(mode), 0) + count
+
+            for semantic, index in attributes.items():
+                semantic_accessors.setdefault(semantic, set()).add(index)
+            for target in primitive.get('targets', []) or []:
+                for index in target.values():
+                    semantic_accessors.setdefault('morph_targets', set()).add(index)
+            if indices:
+                semantic_accessors.setdefault('indices', set()).add(primitive['indices'])
+        mesh_triangles.append(triangles)
+        mesh_primitives.append(len(primitives))
+
+    for skin in gltf_data.get('skins', []) or []:
+        if 'inverseBindMatrices' in skin:
+            semantic_accessors.setdefault('skin', set()).add(skin['inverseBindMatrices'])
+    for animation in gltf_data.get('animations', []) or []:
+        for sampler in animation.get('samplers', []) or []:
+            semantic_accessors.setdefault('animation', set()).update(
+                index for index in (sampler.get('input'), sampler.get('output')) if index is not None)
+
+    # Each accessor counts once, under the first semantic that uses it
+    buffer_bytes: Dict[str, int] = {}
+    counted = set()
+    for semantic in sorted(semantic_accessors):
+        for index in sorted(i for i in semantic_accessors[semantic] if isinstance(i, int)):
+            if index in counted or accessor(index) is None:
+                continue
+            counted.add(index)
+            buffer_bytes[semantic] = buffer_bytes.get(semantic, 0) + _accessor_bytes(accessors[index])
+
+    unique_vertices = None
+    if buffers and detailed:
+        unique_vertices = 0
+        for index in position_accessors:
+            if not is_decodable(accessors[index]):
+                continue
+            array = accessor_array(gltf_data, index, buffers)
+            if array is None:
+                unique_vertices = None
+                break
+            unique_vertices += len(np.unique(array, axis=0))
+
+    instances = _scene_mesh_instances(gltf_data)
+    draw_calls = sum(mesh_primitives[m] for m in instances if 0 <= m < len(meshes))
+    scene_triangles = sum(mesh_triangles[m] for m in instances if 0 <= m < len(meshes))
+
+    textures = []
+    for i, image in enumerate((gltf_data.get('images', []) or []) if detailed else []):
+        # Files go through the cached header probe; embedded images are probed in memory
+        path = resolve_uri(image.get('uri'), search_dirs) if 'bufferView' not in image else None
+        if path is not None:
+            info = probe_image(path)
+        else:
+            data = image_bytes(gltf_data, image, buffers, search_dirs)
+            info = probe_image_bytes(data) if data else None
+        if info is None:
+            continue
+        textures.append({
+            'image': i,
+            'uri': image.get('uri'),
+            'format': info.format,
+            'width': info.width,
+            'height': info.height,
+            'gpu_bytes': texture_gpu_bytes(info.format, info.width, info.height, info.levels),
+        })
+
+    image_views = {image['bufferView'] for image in gltf_data.get('images', []) or [] if 'bufferView' in image}
+    views = gltf_data.get('bufferViews', []) or []
+    embedded_bytes = sum(views[v].get('byteLength', 0) for v in image_views if isinstance(v, int) and 0 <= v < len(views))
+    if embedded_bytes:
+        buffer_bytes['images'] = embedded_bytes
+
+    return {
+        'meshes': len(meshes),
+        'materials': len(gltf_data.get('materials', []) or []),
+        'textures': len(gltf_data.get('textures', []) or []),
+        'nodes': len(gltf_data.get('nodes', []) or []),
+        'primitives': sum(mesh_primitives),
+        'triangles': sum(mesh_triangles),
+        'triangles_by_mode': triangles_by_mode,
+        'scene_triangles': scene_triangles,
+        'vertices': vertices,
+        'unique_vertices': unique_vertices,
+        'draw_calls': draw_calls,
+        'texture_memory': sum(texture['gpu_bytes'] for texture in textures) if detailed else None,
+        'texture_details': textures,
+        'buffer_bytes': buffer_bytes,
+    }
+
+
+def compute_file_stats(path: Path) -> Dict:
+    """compute_stats for a .gltf or .glb file, plus its size on disk"""
+    path = Path(path)
+    gltf_data, buffers = read_gltf_document(path)
+    stats = compute_stats(gltf_data, buffers, [path.parent])
+    stats['file_size'] = path.stat().st_size
+    return stats
@@ -0,0 +1,226 @@
+"""
+VoxBridge Synthetic Assets
+Deterministic VoxEdit-style GLB generator for scaling benchmarks
+"""
+
+import math
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .gltf_io import build_glb
+
+VOXEL_SIZE = 0.1
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+NEAREST = 9728
+
+
+def _face_quads() -> List[Tuple[np.ndarray, np.ndarray]]:
+    """(neighbour offset, 4 counter-clockwise corners) for the six faces of a unit cube"""
+    faces = []
+    for axis in range(3):
+        u, v = (axis + 1) % 3, (axis + 2) % 3
+        for sign in (1, -1):
+            corners = np.zeros((4, 3), dtype=np.float32)
+            corners[:, axis] = 1 if sign > 0 else 0
+            corners[:, u] = [0, 1, 1, 0]
+            corners[:, v] = [0, 0, 1, 1]
+            if sign < 0:
+                corners = corners[::-1].copy()
+            offset = np.zeros(3, dtype=np.int64)
+            offset[axis] = sign
+            faces.append((offset, corners))
+    return faces
+
+
+FACES = _face_quads()
+
+
+def encode_png(pixels: np.ndarray) -> bytes:
+    """Encode an (h, w, 3) uint8 array as an RGB PNG without any imaging library"""
+    height, width, _ = pixels.shape
+    raw = b''.join(b'\x00' + pixels[row].tobytes() for row in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(raw, 6)) + chunk(b'IEND', b'')
+
+
+def _palette_texture(colors: np.ndarray, texture_size: int) -> np.ndarray:
+    """Square texture with the palette laid out as a grid of flat colour cells"""
+    columns = math.ceil(math.sqrt(len(colors)))
+    cell = np.arange(texture_size) * columns // texture_size
+    index = cell[:, None] * columns + cell[None, :]
+    pixels = np.zeros((texture_size, texture_size, 3), dtype=np.uint8)
+    valid = index < len(colors)
+    pixels[valid] = colors[index[valid]]
+    return pixels
+
+
+def _voxel_part(rng: np.random.Generator, voxels: int, palette_size: int) -> Tuple[np.ndarray, ...]:
+    """Exposed-face mesh (positions, normals, uvs, indices) of a random voxel blob"""
+    side = max(1, math.ceil((voxels * 1.5) ** (1 / 3)))
+    cells = np.sort(rng.choice(side ** 3, size=voxels, replace=False))
+    coords = np.stack(np.unravel_index(cells, (side,) * 3), axis=1).astype(np.int64)
+    colors = rng.integers(0, palette_size, size=voxels)
+
+    occupied = np.zeros((side + 2,) * 3, dtype=bool)
+    padded = coords + 1
+    occupied[tuple(padded.T)] = True
+
+    columns = math.ceil(math.sqrt(palette_size))
+    uv_cells = np.stack([colors % columns, colors // columns], axis=1)
+    voxel_uvs = ((uv_cells + 0.5) / columns).astype(np.float32)
+
+    positions, normals, uvs = [], [], []
+    for offset, corners in FACES:
+        exposed = ~occupied[tuple((padded + offset).T)]
+        origin = coords[exposed].astype(np.float32)
+        if not len(origin):
+            continue
+        positions.append(((origin[:, None, :] + corners[None]) * VOXEL_SIZE).reshape(-1, 3))
+        normals.append(np.broadcast_to(offset.astype(np.float32), (len(origin) * 4, 3)))
+        uvs.append(np.repeat(voxel_uvs[exposed], 4, axis=0))
+
+    positions = np.concatenate(positions).astype(np.float32)
+    normals = np.ascontiguousarray(np.concatenate(normals), dtype=np.float32)
+    uvs = np.concatenate(uvs).astype(np.float32)
+    quads = np.arange(len(positions) // 4, dtype=np.uint32)[:, None] * 4
+    indices = (quads + np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)).reshape(-1)
+    return positions, normals, uvs, indices
+
+
+class _BufferBuilder:
+    """Accumulates 4-byte aligned bufferViews and accessors in one binary buffer"""
+
+    def __init__(self, gltf_data: Dict):
+        self.gltf = gltf_data
+        self.data = bytearray()
+
+    def add(self, array: np.ndarray, component_type: int, type_name: str, target: int = None,
+            bounds: bool = False) -> int:
+        self.data += b'\x00' * (-len(self.data) % 4)
+        view = {'buffer': 0, 'byteOffset': len(self.data), 'byteLength': array.nbytes}
+        if target is not None:
+            view['target'] = target
+        self.data += array.tobytes()
+        self.gltf['bufferViews'].append(view)
+        accessor = {'bufferView': len(self.gltf['bufferViews']) - 1, 'componentType': component_type,
+                    'count': len(array), 'type': type_name}
+        if bounds:
+            flat = array.reshape(len(array), -1)
+            accessor['min'] = flat.min(axis=0).astype(np.float64).tolist()
+            accessor['max'] = flat.max(axis=0).astype(np.float64).tolist()
+        self.gltf['accessors'].append(accessor)
+        return len(self.gltf['accessors']) - 1
+
+    def add_image(self, data: bytes) -> int:
+        self.data += b'\x00' * (-len(self.data) % 4)
+        self.gltf['bufferViews'].append({'buffer': 0, 'byteOffset': len(self.data), 'byteLength': len(data)})
+        self.data += data
+        return len(self.gltf['bufferViews']) - 1
+
+
+def generate_voxel_glb(output_path: Path, voxels: int = 1000, parts: int = 4, palette_size: int = 16,
+                       textures: int = 1, texture_size: int = 64, animations: int = 0, seed: int = 0) -> Dict:
+    """
+    Write a GLB shaped like a VoxEdit export: a root node with one node and
+    mesh per part (bone), exposed-face voxel geometry with palette UVs,
+    nearest-filtered palette textures embedded in the BIN chunk, and
+    optional translation animations per part. The same arguments always
+    produce the same bytes. Returns the generated counts.
+    """
+    if voxels < parts or parts < 1:
+        raise ValueError("need at least one voxel per part")
+    if palette_size < 1 or textures < 1 or texture_size < 1 or animations < 0:
+        raise ValueError("palette size, texture count and texture size must be positive")
+
+    rng = np.random.default_rng(seed)
+    gltf_data = {
+        'asset': {'version': '2.0', 'generator': 'VoxBridge synthetic VoxEdit asset'},
+        'scene': 0,
+        'scenes': [{'name': 'Scene', 'nodes': [0]}],
+        'nodes': [{'name': 'Root', 'children': list(range(1, parts + 1))}],
+        'meshes': [], 'materials': [], 'textures': [], 'images': [],
+        'samplers': [{'magFilter': NEAREST, 'minFilter': NEAREST}],
+        'accessors': [], 'bufferViews': [], 'buffers': [],
+    }
+    builder = _BufferBuilder(gltf_data)
+
+    for t in range(textures):
+        colors = rng.integers(0, 256, size=(palette_size, 3), dtype=np.uint8)
+        view = builder.add_image(encode_png(_palette_texture(colors, texture_size)))
+        gltf_data['images'].append({'name': f'Palette_{t}', 'bufferView': view, 'mimeType': 'image/png'})
+        gltf_data['textures'].append({'sampler': 0, 'source': t})
+        gltf_data['materials'].append({
+            'name': f'Palette_{t}',
+            'pbrMetallicRoughness': {'baseColorTexture': {'index': t}, 'metallicFactor': 0.0, 'roughnessFactor': 1.0},
+        })
+
+    counts = [voxels // parts + (1 if i < voxels % parts else 0) for i in range(parts)]
+    offsets = []
+    vertex_total = 0
+    triangle_total = 0
+    for i, count in enumerate(counts):
+        positions, normals, uvs, indices = _voxel_part(rng, count, palette_size)
+        if len(positions) <= 0xFFFF:
+            index_array, index_type = indices.astype(np.uint16), 5123
+        else:
+            index_array, index_type = indices, 5125
+        primitive = {
+            'attributes': {
+                'POSITION': builder.add(positions, 5126, 'VEC3', ARRAY_BUFFER, bounds=True),
+                'NORMAL': builder.add(normals, 5126, 'VEC3', ARRAY_BUFFER),
+                'TEXCOORD_0': builder.add(uvs, 5126, 'VEC2', ARRAY_BUFFER),
+            },
+            'indices': builder.add(index_array, index_type, 'SCALAR', ELEMENT_ARRAY_BUFFER),
+            'material': i % textures,
+            'mode': 4,
+        }
+        gltf_data['meshes'].append({'name': f'Part_{i}', 'primitives': [primitive]})
+        offset = [float(i * 2.0), 0.0, 0.0]
+        offsets.append(offset)
+        gltf_data['nodes'].append({'name': f'Part_{i}', 'mesh': i, 'translation': offset})
+        vertex_total += len(positions)
+        triangle_total += len(indices) // 3
+
+    if animations:
+        gltf_data['animations'] = []
+        times = np.array([0.0, 0.5, 1.0], dtype=np.float32)
+    for a in range(animations):
+        time_accessor = builder.add(times, 5126, 'SCALAR', bounds=True)
+        samplers, channels = [], []
+        for i, offset in enumerate(offsets):
+            lift = float(rng.uniform(0.05, 0.5))
+            keys = np.array([offset, [offset[0], offset[1] + lift, offset[2]], offset], dtype=np.float32)
+            samplers.append({'input': time_accessor, 'output': builder.add(keys, 5126, 'VEC3'),
+                             'interpolation': 'LINEAR'})
+            channels.append({'sampler': i, 'target': {'node': i + 1, 'path': 'translation'}})
+        gltf_data['animations'].append({'name': f'Animation_{a}', 'samplers': samplers, 'channels': channels})
+
+    for key in ('meshes', 'materials', 'textures', 'images'):
+        if not gltf_data[key]:
+            del gltf_data[key]
+    gltf_data['buffers'].append({'byteLength': len(builder.data)})
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(build_glb(gltf_data, builder.data))
+    return {
+        'path': str(output_path),
+        'voxels': voxels,
+        'parts': parts,
+        'palette_size': palette_size,
+        'textures': textures,
+        'texture_size': texture_size,
+        'animations': animations,
+        'seed': seed,
+        'vertices': vertex_total,
+        'triangles': triangle_total,
+    }
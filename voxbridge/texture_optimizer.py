@@ -1,4 +1,9 @@
+import hashlib
+import io
 import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 import numpy as np
@@ -6,6 +11,8 @@ import numpy as np
 # For glTF parsing and updating
 import pygltflib
 
+from .gltf_io import image_bytes
+
 def resize_texture(image_path, max_size=1024):
     """
     Resize a texture to a maximum size (preserving aspect ratio).
@@ -17,6 +24,305 @@ def resize_texture(image_path, max_size=1024):
         img.save(image_path)
     return image_path
 
+def quantize_to_palette(image_path, max_colors=256):
+    """
+    Losslessly convert a low-color PNG texture to an 8-bit palette PNG.
+    Images with more than max_colors distinct colors are left untouched.
+    Fully opaque images drop their alpha channel; otherwise per-entry alpha
+    is written as a tRNS chunk. The file is only rewritten if it gets smaller.
+    Returns True if the image was rewritten.
+    """
+    if Path(image_path).suffix.lower() != '.png':
+        return False
+    # Pillow decodes 16-bit PNGs to 8-bit modes, so only 8-bit sources convert losslessly
+    if _png_bit_depth(image_path) != 8:
+        return False
+
+    with Image.open(image_path) as img:
+        if img.mode not in ('RGB', 'RGBA', 'LA'):
+            return False
+        width, height = img.size
+        pixels = np.asarray(img.convert('RGBA'))
+
+    # Pack RGBA into one uint32 per pixel so np.unique works on whole colors
+    packed = np.ascontiguousarray(pixels).view(np.uint32).reshape(-1)
+    colors, indices = np.unique(packed, return_inverse=True)
+    if len(colors) > max_colors:
+        return False
+
+    palette = colors.view(np.uint8).reshape(-1, 4)
+    indexed = Image.frombytes('P', (width, height), indices.astype(np.uint8).tobytes())
+    indexed.putpalette(palette[:, :3].tobytes())
+
+    save_args = {'optimize': True}
+    if not np.all(palette[:, 3] == 255):
+        save_args['transparency'] = palette[:, 3].tobytes()
+
+    buffer = io.BytesIO()
+    indexed.save(buffer, format='PNG', **save_args)
+    if buffer.tell() >= os.path.getsize(image_path):
+        return False
+
+    with open(image_path, 'wb') as f:
+        f.write(buffer.getvalue())
+    return True
+
+def pixel_hash(img):
+    """
+    Hash the decoded pixels of an image (size + RGBA data).
+    Two files that decode to the same picture hash equally regardless of
+    PNG/JPEG encoding, color mode or embedded metadata.
+    """
+    rgba = img.convert('RGBA')
+    digest = hashlib.sha256(struct.pack('>II', *rgba.size))
+    digest.update(rgba.tobytes())
+    return digest.hexdigest()
+
+def deduplicate_textures(gltf_data, base_path):
+    """
+    Collapse glTF images whose decoded pixel data is identical.
+    Every textures[].source (and extension image source) is repointed at
+    the first image with the same content, duplicate image entries are
+    removed and the remaining image indices are compacted. Images embedded
+    via bufferView or data: URIs are kept as-is.
+    Returns the list of image URIs that are no longer referenced.
+    """
+    images = gltf_data.get('images', [])
+    if len(images) < 2:
+        return []
+
+    canonical = {}   # pixel hash -> kept image index (old numbering)
+    remap = {}       # old image index -> old index of the image it duplicates
+    hash_by_uri = {}
+    for i, image in enumerate(images):
+        uri = image.get('uri')
+        if not uri or uri.startswith(('http://', 'https://', 'data:')):
+            continue
+        if uri not in hash_by_uri:
+            image_path = Path(base_path) / uri
+            if not image_path.exists():
+                continue
+            try:
+                with Image.open(image_path) as img:
+                    hash_by_uri[uri] = pixel_hash(img)
+            except Exception:
+                continue
+        key = hash_by_uri[uri]
+        if key in canonical:
+            remap[i] = canonical[key]
+        else:
+            canonical[key] = i
+
+    if not remap:
+        return []
+
+    kept = _merge_images(gltf_data, remap)
+    kept_uris = {image.get('uri') for image in kept}
+    return sorted({images[i]['uri'] for i in remap} - kept_uris)
+
+# Texture extensions that name an image of their own next to (or instead of) textures[].source
+IMAGE_SOURCE_EXTENSIONS = ('KHR_texture_basisu', 'EXT_texture_webp', 'EXT_texture_avif', 'MSFT_texture_dds')
+
+def _merge_images(gltf_data, remap):
+    """
+    Drop the images listed in remap (old index -> old index of the image
+    replacing it), repoint textures[].source and the image sources of
+    IMAGE_SOURCE_EXTENSIONS and compact the image array.
+    Returns the list of kept images.
+    """
+    images = gltf_data.get('images', [])
+    new_index = {}
+    kept = []
+    for i, image in enumerate(images):
+        if i not in remap:
+            new_index[i] = len(kept)
+            kept.append(image)
+    for i, target in remap.items():
+        new_index[i] = new_index[target]
+
+    for texture in gltf_data.get('textures', []):
+        if texture.get('source') in new_index:
+            texture['source'] = new_index[texture['source']]
+        for name, extension in (texture.get('extensions') or {}).items():
+            if name in IMAGE_SOURCE_EXTENSIONS and isinstance(extension, dict) and extension.get('source') in new_index:
+                extension['source'] = new_index[extension['source']]
+
+    gltf_data['images'] = kept
+    return kept
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Pillow mode -> (PNG color type, bytes per pixel) for 8-bit images
+PNG_COLOR_TYPES = {
+    'L': (0, 1),
+    'RGB': (2, 3),
+    'P': (3, 1),
+    'LA': (4, 2),
+    'RGBA': (6, 4),
+}
+
+def _png_bit_depth(image_path):
+    """Bit depth from a PNG's IHDR chunk, or None if the file is not a readable PNG"""
+    try:
+        with open(image_path, 'rb') as f:
+            header = f.read(26)
+    except OSError:
+        return None
+    if len(header) < 26 or not header.startswith(PNG_SIGNATURE) or header[12:16] != b'IHDR':
+        return None
+    return header[24]
+
+# Filter types and (zlib level, strategy) pairs searched per --texture-effort level
+PNG_EFFORT_LEVELS = {
+    1: {
+        'filters': ('adaptive',),
+        'zlib': [(9, zlib.Z_DEFAULT_STRATEGY)],
+    },
+    2: {
+        'filters': (0, 1, 2, 'adaptive'),
+        'zlib': [(9, zlib.Z_DEFAULT_STRATEGY), (9, zlib.Z_FILTERED)],
+    },
+    3: {
+        'filters': (0, 1, 2, 3, 4, 'adaptive'),
+        'zlib': [(9, zlib.Z_DEFAULT_STRATEGY), (9, zlib.Z_FILTERED), (9, zlib.Z_RLE),
+                 (9, zlib.Z_HUFFMAN_ONLY), (6, zlib.Z_DEFAULT_STRATEGY)],
+    },
+}
+
+def _png_filter_scanlines(raw, bpp, filter_type):
+    """
+    Apply one PNG filter type (0-4) to every scanline of raw (rows x stride).
+    Returns the filtered bytes without the leading filter-type byte.
+    """
+    x = raw.astype(np.int16)
+    if filter_type == 0:
+        out = x
+    else:
+        left = np.zeros_like(x)
+        left[:, bpp:] = x[:, :-bpp]
+        up = np.zeros_like(x)
+        up[1:] = x[:-1]
+        if filter_type == 1:
+            out = x - left
+        elif filter_type == 2:
+            out = x - up
+        elif filter_type == 3:
+            out = x - ((left + up) >> 1)
+        else:
+            upper_left = np.zeros_like(x)
+            upper_left[1:, bpp:] = x[:-1, :-bpp]
+            p = left + up - upper_left
+            pa = np.abs(p - left)
+            pb = np.abs(p - up)
+            pc = np.abs(p - upper_left)
+            predictor = np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, up, upper_left))
+            out = x - predictor
+    return (out & 0xFF).astype(np.uint8)
+
+def _png_filtered_stream(raw, bpp, filter_type):
+    """
+    Build the uncompressed IDAT stream for a filter type or 'adaptive'.
+    Adaptive picks, per row, the filter with the smallest sum of absolute
+    signed residuals (the heuristic recommended by the PNG specification).
+    """
+    if filter_type == 'adaptive':
+        candidates = np.stack([_png_filter_scanlines(raw, bpp, f) for f in range(5)])
+        costs = np.abs(candidates.view(np.int8).astype(np.int32)).sum(axis=2)
+        row_filters = costs.argmin(axis=0)
+        filtered = candidates[row_filters, np.arange(raw.shape[0])]
+    else:
+        row_filters = np.full(raw.shape[0], filter_type)
+        filtered = _png_filter_scanlines(raw, bpp, filter_type)
+    return np.hstack([row_filters.astype(np.uint8)[:, None], filtered]).tobytes()
+
+def _png_chunk(tag, data):
+    """Serialize a single PNG chunk"""
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+def _png_ancillary_chunks(img, raw):
+    """Return the PLTE/tRNS/color-management chunks needed to reproduce img"""
+    chunks = []
+    if 'icc_profile' in img.info:
+        chunks.append(_png_chunk(b'iCCP', b'icc\x00\x00' + zlib.compress(img.info['icc_profile'])))
+    elif 'srgb' in img.info:
+        chunks.append(_png_chunk(b'sRGB', bytes([img.info['srgb']])))
+    if 'gamma' in img.info:
+        chunks.append(_png_chunk(b'gAMA', struct.pack('>I', int(round(img.info['gamma'] * 100000)))))
+
+    transparency = img.info.get('transparency')
+    if img.mode == 'P':
+        entries = int(raw.max()) + 1
+        chunks.append(_png_chunk(b'PLTE', bytes(img.getpalette()[:entries * 3])))
+        if isinstance(transparency, bytes):
+            alpha = transparency[:entries].rstrip(b'\xff')
+        elif isinstance(transparency, int) and transparency < entries:
+            alpha = b'\xff' * transparency + b'\x00'
+        else:
+            alpha = b''
+        if alpha:
+            chunks.append(_png_chunk(b'tRNS', alpha))
+    elif img.mode == 'L' and isinstance(transparency, int):
+        chunks.append(_png_chunk(b'tRNS', struct.pack('>H', transparency)))
+    elif img.mode == 'RGB' and isinstance(transparency, tuple):
+        chunks.append(_png_chunk(b'tRNS', struct.pack('>3H', *transparency)))
+    return b''.join(chunks)
+
+def optimize_png(image_path, effort=2, max_workers=None):
+    """
+    Losslessly re-encode a PNG texture, searching filter types and zlib
+    levels/strategies in parallel and keeping the smallest encoding.
+    The winning candidate is decoded and compared against the original
+    pixels before the file is replaced.
+    Returns the number of bytes saved (0 if the file was left untouched).
+    """
+    if effort <= 0 or Path(image_path).suffix.lower() != '.png':
+        return 0
+    # Pillow decodes 16-bit PNGs to 8-bit modes and the candidates are written from
+    # those, so the pixel comparison below could not catch the lost precision
+    bit_depth = _png_bit_depth(image_path)
+    if bit_depth is None or bit_depth > 8:
+        return 0
+    search = PNG_EFFORT_LEVELS[min(effort, max(PNG_EFFORT_LEVELS))]
+
+    with Image.open(image_path) as img:
+        if img.format != 'PNG' or img.mode not in PNG_COLOR_TYPES:
+            return 0
+        img.load()
+        color_type, bpp = PNG_COLOR_TYPES[img.mode]
+        width, height = img.size
+        raw = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(height, width * bpp)
+        reference = np.asarray(img.convert('RGBA'))
+        header = PNG_SIGNATURE + _png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0))
+        header += _png_ancillary_chunks(img, raw)
+
+        pillow_buffer = io.BytesIO()
+        img.save(pillow_buffer, format='PNG', optimize=True)
+
+    streams = [_png_filtered_stream(raw, bpp, f) for f in search['filters']]
+
+    def encode(job):
+        stream, level, strategy = job
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 15, 9, strategy)
+        idat = compressor.compress(stream) + compressor.flush()
+        return header + _png_chunk(b'IDAT', idat) + _png_chunk(b'IEND', b'')
+
+    jobs = [(stream, level, strategy) for stream in streams for level, strategy in search['zlib']]
+    # zlib releases the GIL, so threads compress candidates concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        candidates = list(executor.map(encode, jobs))
+    candidates.append(pillow_buffer.getvalue())
+
+    original_size = os.path.getsize(image_path)
+    for candidate in sorted(candidates, key=len):
+        if len(candidate) >= original_size:
+            break
+        with Image.open(io.BytesIO(candidate)) as decoded:
+            if decoded.size == (width, height) and np.array_equal(np.asarray(decoded.convert('RGBA')), reference):
+                with open(image_path, 'wb') as f:
+                    f.write(candidate)
+                return original_size - len(candidate)
+    return 0
+
 def generate_texture_atlas(image_paths, atlas_size=1024):
     """
     Combine multiple images into a single texture atlas.
@@ -137,4 +443,232 @@ def update_gltf_with_atlas(gltf_path, mapping, atlas_filename):
                                         print(f"Warning: Could not process UVs for primitive: {e}")
                                         continue
     
-    gltf.save(gltf_path) 
\ No newline at end of file
+    gltf.save(gltf_path) 
+
+GL_FLOAT = 5126
+GL_CLAMP_TO_EDGE = 33071
+
+# Material slots that reference a texture through a textureInfo object
+MATERIAL_TEXTURE_SLOTS = ('normalTexture', 'occlusionTexture', 'emissiveTexture')
+PBR_TEXTURE_SLOTS = ('baseColorTexture', 'metallicRoughnessTexture')
+
+def load_gltf_images(gltf_data, buffers, search_dirs):
+    """
+    Decode every image of a glTF document that can be resolved, whether it
+    lives in a file, a data: URI or a bufferView.
+    Returns a dict of image index -> RGBA PIL image.
+    """
+    decoded = {}
+    for i, image in enumerate(gltf_data.get('images', [])):
+        data = image_bytes(gltf_data, image, buffers, search_dirs)
+        if data is None:
+            continue
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                decoded[i] = img.convert('RGBA')
+        except Exception:
+            continue
+    return decoded
+
+def _shelf_pack(cells, size):
+    """Place (key, width, height) cells left-to-right on shelves; None if they overflow"""
+    placement = {}
+    x = y = shelf_height = 0
+    for key, width, height in cells:
+        if x + width > size:
+            y += shelf_height
+            x = shelf_height = 0
+        if width > size or y + height > size:
+            return None
+        placement[key] = (x, y)
+        x += width
+        shelf_height = max(shelf_height, height)
+    return placement
+
+def build_shared_atlas(images, max_size=4096, padding=2):
+    """
+    Pack images into one atlas at their native resolution.
+    Identical images (by pixel_hash) are stored once. Tiles are shelf-packed
+    into the smallest power-of-two square that fits and surrounded by
+    `padding` pixels of edge-extended border so filtering does not bleed
+    between neighbours.
+    Returns the atlas image and a dict of pixel hash -> [u0, v0, u1, v1].
+    Raises ValueError if the images do not fit within max_size.
+    """
+    unique = {}
+    for img in images:
+        unique.setdefault(pixel_hash(img), img.convert('RGBA'))
+    if not unique:
+        raise ValueError("No images to pack into an atlas")
+
+    # Tallest tiles first keeps shelves tight; the hash makes ties deterministic
+    order = sorted(unique, key=lambda k: (-unique[k].height, -unique[k].width, k))
+    cells = [(k, unique[k].width + 2 * padding, unique[k].height + 2 * padding) for k in order]
+    area = sum(width * height for _, width, height in cells)
+    longest = max(max(width, height) for _, width, height in cells)
+
+    size = 1
+    while size * size < area or size < longest:
+        size *= 2
+    while size <= max_size:
+        placement = _shelf_pack(cells, size)
+        if placement is not None:
+            break
+        size *= 2
+    else:
+        raise ValueError(f"Textures do not fit in a {max_size}x{max_size} atlas")
+
+    atlas = np.zeros((size, size, 4), dtype=np.uint8)
+    rects = {}
+    for key, (x, y) in placement.items():
+        pixels = np.asarray(unique[key])
+        height, width = pixels.shape[:2]
+        if padding:
+            pixels = np.pad(pixels, ((padding, padding), (padding, padding), (0, 0)), mode='edge')
+        atlas[y:y + pixels.shape[0], x:x + pixels.shape[1]] = pixels
+        left, top = x + padding, y + padding
+        rects[key] = [left / size, top / size, (left + width) / size, (top + height) / size]
+    return Image.fromarray(atlas, 'RGBA'), rects
+
+def _material_texture_infos(material):
+    """Yield every textureInfo object referenced by a material"""
+    for slot in MATERIAL_TEXTURE_SLOTS:
+        if isinstance(material.get(slot), dict):
+            yield material[slot]
+    pbr = material.get('pbrMetallicRoughness') or {}
+    for slot in PBR_TEXTURE_SLOTS:
+        if isinstance(pbr.get(slot), dict):
+            yield pbr[slot]
+
+def _texcoord_array(gltf_data, accessor_index, buffers):
+    """
+    Return a writable (count, 2) float32 view of a TEXCOORD accessor inside
+    its buffer, plus a key identifying the bytes it covers. Returns
+    (None, None) for anything other than plain, in-bounds float VEC2 data.
+    """
+    accessors = gltf_data.get('accessors', [])
+    views = gltf_data.get('bufferViews', [])
+    if not isinstance(accessor_index, int) or not 0 <= accessor_index < len(accessors):
+        return None, None
+    accessor = accessors[accessor_index]
+    if (accessor.get('componentType') != GL_FLOAT or accessor.get('type') != 'VEC2'
+            or 'sparse' in accessor):
+        return None, None
+    view_index = accessor.get('bufferView')
+    if not isinstance(view_index, int) or not 0 <= view_index < len(views):
+        return None, None
+    view = views[view_index]
+    buffer_index = view.get('buffer')
+    if not isinstance(buffer_index, int) or not 0 <= buffer_index < len(buffers):
+        return None, None
+    data = buffers[buffer_index]
+    count = accessor.get('count', 0)
+    if data is None or count <= 0:
+        return None, None
+
+    stride = view.get('byteStride') or 8
+    offset = view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+    end = offset + stride * (count - 1) + 8
+    if end > view.get('byteOffset', 0) + view.get('byteLength', 0) or end > len(data):
+        return None, None
+    array = np.ndarray((count, 2), dtype='<f4', buffer=data, offset=offset, strides=(stride, 4))
+    return array, (buffer_index, offset, stride, count)
+
+def remap_gltf_to_atlas(gltf_data, buffers, image_rects, atlas_uri):
+    """
+    Point images at a shared atlas and rewrite the UVs that sample them.
+    image_rects maps image index -> [u0, v0, u1, v1] within the atlas. UV
+    accessors are transformed in place inside `buffers`. An image only moves
+    into the atlas when every UV set sampling it can be remapped; accessors
+    shared by different tiles, non-float UVs and coordinates outside [0, 1]
+    (which rely on texture wrapping) keep their images standalone.
+    Returns the sorted list of remapped image indices (old numbering) and
+    the set of buffer indices whose contents changed.
+    """
+    images = gltf_data.get('images', [])
+    textures = gltf_data.get('textures', [])
+    materials = gltf_data.get('materials', [])
+    candidates = {i for i in image_rects if 0 <= i < len(images)}
+    if not candidates:
+        return [], set()
+
+    # Which images each UV accessor is used to sample (None = no TEXCOORD set)
+    usage = {}
+    for mesh in gltf_data.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            material_index = primitive.get('material')
+            if not isinstance(material_index, int) or not 0 <= material_index < len(materials):
+                continue
+            attributes = primitive.get('attributes', {})
+            for texture_info in _material_texture_infos(materials[material_index]):
+                texture_index = texture_info.get('index')
+                if not isinstance(texture_index, int) or not 0 <= texture_index < len(textures):
+                    continue
+                source = textures[texture_index].get('source')
+                if source is None:
+                    continue
+                accessor = attributes.get(f"TEXCOORD_{texture_info.get('texCoord', 0)}")
+                if 'KHR_texture_transform' in texture_info.get('extensions', {}):
+                    accessor = None
+                usage.setdefault(accessor, set()).add(source)
+
+    arrays = {}
+    for accessor in usage:
+        array, key = _texcoord_array(gltf_data, accessor, buffers)
+        if array is not None and np.all((array >= 0.0) & (array <= 1.0)):
+            arrays[accessor] = (array, key)
+
+    # Drop candidates until every accessor touching one can be remapped to a single tile
+    changed = True
+    while changed:
+        changed = False
+        for accessor, sources in usage.items():
+            touched = sources & candidates
+            if not touched:
+                continue
+            rects = {tuple(image_rects[i]) for i in touched}
+            if accessor not in arrays or touched != sources or len(rects) != 1:
+                candidates -= touched
+                changed = True
+    if not candidates:
+        return [], set()
+
+    touched_buffers = set()
+    seen = set()
+    accessors = gltf_data.get('accessors', [])
+    for accessor, sources in usage.items():
+        if not sources or not sources <= candidates:
+            continue
+        array, key = arrays[accessor]
+        if key in seen:
+            continue
+        seen.add(key)
+        u0, v0, u1, v1 = image_rects[next(iter(sources))]
+        array[:, 0] = u0 + array[:, 0] * (u1 - u0)
+        array[:, 1] = v0 + array[:, 1] * (v1 - v0)
+        if 'min' in accessors[accessor] or 'max' in accessors[accessor]:
+            accessors[accessor]['min'] = array.min(axis=0).tolist()
+            accessors[accessor]['max'] = array.max(axis=0).tolist()
+        touched_buffers.add(key[0])
+
+    # Atlas tiles are not meant to wrap into their neighbours
+    samplers = gltf_data.get('samplers', [])
+    clamped = {}
+    for texture in textures:
+        if texture.get('source') not in candidates:
+            continue
+        base = texture.get('sampler')
+        if base not in clamped:
+            sampler = dict(samplers[base]) if isinstance(base, int) and 0 <= base < len(samplers) else {}
+            sampler['wrapS'] = sampler['wrapT'] = GL_CLAMP_TO_EDGE
+            clamped[base] = len(samplers)
+            samplers.append(sampler)
+        texture['sampler'] = clamped[base]
+    if samplers:
+        gltf_data['samplers'] = samplers
+
+    remapped = sorted(candidates)
+    first = remapped[0]
+    images[first] = {'uri': atlas_uri, 'mimeType': 'image/png'}
+    _merge_images(gltf_data, {i: first for i in remapped[1:]})
+    return remapped, touched_buffers
@@ -0,0 +1,424 @@
+"""
+VoxBridge glTF Validator
+In-process structural and buffer validation of glTF 2.0 documents
+"""
+
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence
+from urllib.parse import unquote
+
+import numpy as np
+
+from .accessors import (
+    COMPONENT_DTYPES, INDEX_COMPONENT_TYPES, TYPE_COMPONENTS, accessor_array, accessor_layout
+)
+from .gltf_io import decode_data_uri, read_gltf_document, resolve_uri
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# Properties the glTF 2.0 schema requires on each object
+REQUIRED_PROPERTIES = {
+    'accessors': ('componentType', 'count', 'type'),
+    'animations': ('channels', 'samplers'),
+    'bufferViews': ('buffer', 'byteLength'),
+    'buffers': ('byteLength',),
+    'cameras': ('type',),
+    'meshes': ('primitives',),
+    'skins': ('joints',),
+}
+
+# (collection, property, target collection) for single-index references
+REFERENCES = [
+    ('accessors', 'bufferView', 'bufferViews'),
+    ('bufferViews', 'buffer', 'buffers'),
+    ('images', 'bufferView', 'bufferViews'),
+    ('nodes', 'camera', 'cameras'),
+    ('nodes', 'mesh', 'meshes'),
+    ('nodes', 'skin', 'skins'),
+    ('skins', 'inverseBindMatrices', 'accessors'),
+    ('skins', 'skeleton', 'nodes'),
+    ('textures', 'sampler', 'samplers'),
+    ('textures', 'source', 'images'),
+]
+
+# (collection, property, target collection) for index-list references
+LIST_REFERENCES = [
+    ('nodes', 'children', 'nodes'),
+    ('scenes', 'nodes', 'nodes'),
+    ('skins', 'joints', 'nodes'),
+]
+
+MATERIAL_TEXTURES = [
+    ('normalTexture',), ('occlusionTexture',), ('emissiveTexture',),
+    ('pbrMetallicRoughness', 'baseColorTexture'), ('pbrMetallicRoughness', 'metallicRoughnessTexture'),
+]
+
+
+class ValidationIssue(NamedTuple):
+    """A single validation finding"""
+    severity: str   # ERROR or WARNING
+    code: str       # Stable identifier, e.g. ACCESSOR_TOO_LONG
+    message: str
+    pointer: str    # JSON pointer to the offending property, e.g. /accessors/3/byteOffset
+
+    def __str__(self) -> str:
+        return f"{self.pointer or '/'}: {self.message}"
+
+
+class ValidationReport:
+    """
+    Structured result of validating one glTF document. timings holds the
+    seconds spent in each validation stage (e.g. 'structure', 'platform').
+    """
+
+    def __init__(self, issues: Optional[List[ValidationIssue]] = None, timings: Optional[Dict[str, float]] = None):
+        self.issues = list(issues or [])
+        self.timings = dict(timings or {})
+
+    @property
+    def errors(self) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == ERROR]
+
+    @property
+    def warnings(self) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == WARNING]
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def messages(self) -> List[str]:
+        """Errors first, then warnings, as plain strings"""
+        return [str(issue) for issue in self.errors + self.warnings]
+
+    def extend(self, severity: str, code: str, messages: Sequence[str], pointer: str = ''):
+        """Add plain-text findings from another checker (platform rules, external tools)"""
+        self.issues.extend(ValidationIssue(severity, code, message, pointer) for message in messages)
+
+    def to_dict(self) -> Dict:
+        return {
+            'valid': self.is_valid,
+            'errors': len(self.errors),
+            'warnings': len(self.warnings),
+            'issues': [issue._asdict() for issue in self.issues],
+            'timings': {stage: round(seconds, 6) for stage, seconds in self.timings.items()},
+        }
+
+
+def _is_index(value, length: int) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and 0 <= value < length
+
+
+class _Validator:
+    """Collects issues while walking one document"""
+
+    def __init__(self, gltf_data: Dict, buffers: Sequence[Optional[bytes]], search_dirs: Sequence[Path]):
+        self.gltf = gltf_data
+        self.buffers = list(buffers)
+        self.search_dirs = list(search_dirs)
+        self.issues: List[ValidationIssue] = []
+
+    def add(self, severity: str, code: str, message: str, pointer: str):
+        self.issues.append(ValidationIssue(severity, code, message, pointer))
+
+    def items(self, collection: str) -> List[Dict]:
+        # Malformed collections are reported once by check_structure and skipped everywhere else
+        value = self.gltf.get(collection, [])
+        if not isinstance(value, list) or not all(isinstance(item, dict) for item in value):
+            return []
+        return value
+
+    def run(self) -> ValidationReport:
+        self.check_structure()
+        self.check_references()
+        self.check_uris()
+        self.check_buffer_views()
+        valid_accessors = self.check_accessors()
+        self.check_meshes(valid_accessors)
+        return ValidationReport(self.issues)
+
+    def check_structure(self):
+        asset = self.gltf.get('asset')
+        if not isinstance(asset, dict) or 'version' not in asset:
+            self.add(ERROR, 'ASSET_VERSION_MISSING', "Missing required asset.version", '/asset')
+        elif not str(asset['version']).startswith('2.'):
+            self.add(ERROR, 'UNKNOWN_ASSET_MAJOR_VERSION', f"Unsupported glTF version {asset['version']}", '/asset/version')
+
+        for collection in ('accessors', 'animations', 'bufferViews', 'buffers', 'cameras', 'images', 'materials',
+                           'meshes', 'nodes', 'samplers', 'scenes', 'skins', 'textures'):
+            value = self.gltf.get(collection)
+            if value is None:
+                continue
+            if not isinstance(value, list) or not all(isinstance(item, dict) for item in value):
+                self.add(ERROR, 'TYPE_MISMATCH', f"{collection} must be an array of objects", f'/{collection}')
+                continue
+            for i, item in enumerate(value):
+                for prop in REQUIRED_PROPERTIES.get(collection, ()):
+                    if prop not in item:
+                        self.add(ERROR, 'UNDEFINED_PROPERTY', f"Missing required property '{prop}'", f'/{collection}/{i}')
+
+        if 'scene' in self.gltf and not _is_index(self.gltf['scene'], len(self.items('scenes'))):
+            self.add(ERROR, 'UNRESOLVED_REFERENCE', f"Unresolved reference: {self.gltf['scene']}", '/scene')
+
+    def check_reference(self, value, target: str, pointer: str):
+        if not _is_index(value, len(self.items(target))):
+            self.add(ERROR, 'UNRESOLVED_REFERENCE', f"Unresolved reference to {target}: {value}", pointer)
+
+    def check_references(self):
+        for collection, prop, target in REFERENCES:
+            for i, item in enumerate(self.items(collection)):
+                if isinstance(item, dict) and prop in item:
+                    self.check_reference(item[prop], target, f'/{collection}/{i}/{prop}')
+        for collection, prop, target in LIST_REFERENCES:
+            for i, item in enumerate(self.items(collection)):
+                if isinstance(item, dict):
+                    for j, value in enumerate(item.get(prop, []) or []):
+                        self.check_reference(value, target, f'/{collection}/{i}/{prop}/{j}')
+
+        for i, material in enumerate(self.items('materials')):
+            for slot in MATERIAL_TEXTURES:
+                info = material
+                for key in slot:
+                    info = info.get(key) if isinstance(info, dict) else None
+                if isinstance(info, dict):
+                    self.check_reference(info.get('index'), 'textures', f"/materials/{i}/{'/'.join(slot)}/index")
+
+        for i, animation in enumerate(self.items('animations')):
+            samplers = animation.get('samplers', []) or []
+            for j, channel in enumerate(animation.get('channels', []) or []):
+                if not _is_index(channel.get('sampler'), len(samplers)):
+                    self.add(ERROR, 'UNRESOLVED_REFERENCE', f"Unresolved animation sampler: {channel.get('sampler')}",
+                             f'/animations/{i}/channels/{j}/sampler')
+                node = (channel.get('target') or {}).get('node')
+                if node is not None:
+                    self.check_reference(node, 'nodes', f'/animations/{i}/channels/{j}/target/node')
+            for j, sampler in enumerate(samplers):
+                for prop in ('input', 'output'):
+                    self.check_reference(sampler.get(prop), 'accessors', f'/animations/{i}/samplers/{j}/{prop}')
+
+    def check_uris(self):
+        """Every buffer must be loadable and every external image must resolve"""
+        for i, buffer in enumerate(self.items('buffers')):
+            uri = buffer.get('uri')
+            data = self.buffers[i] if i < len(self.buffers) else None
+            if data is None and uri is not None:
+                self.check_uri(uri, f'/buffers/{i}/uri')
+            elif data is None and i == 0:
+                self.add(ERROR, 'BUFFER_MISSING_GLB_DATA', "Buffer has no uri and no GLB binary chunk", f'/buffers/{i}')
+            byte_length = buffer.get('byteLength')
+            if data is not None and isinstance(byte_length, int) and len(data) < byte_length:
+                self.add(ERROR, 'BUFFER_DATA_TOO_SHORT',
+                         f"Buffer holds {len(data)} bytes but byteLength is {byte_length}", f'/buffers/{i}/byteLength')
+
+        for i, image in enumerate(self.items('images')):
+            if ('uri' in image) == ('bufferView' in image):
+                self.add(ERROR, 'ONE_OF_MISMATCH', "Image must define exactly one of uri or bufferView", f'/images/{i}')
+            elif 'bufferView' in image and 'mimeType' not in image:
+                self.add(ERROR, 'UNSATISFIED_DEPENDENCY', "Image with bufferView requires mimeType", f'/images/{i}')
+            elif 'uri' in image:
+                self.check_uri(image['uri'], f'/images/{i}/uri')
+
+    def check_uri(self, uri, pointer: str):
+        if not isinstance(uri, str) or not uri:
+            self.add(ERROR, 'INVALID_URI', f"Invalid uri: {uri!r}", pointer)
+        elif uri.startswith('data:'):
+            try:
+                decode_data_uri(uri)
+            except ValueError as e:
+                self.add(ERROR, 'INVALID_URI', f"Invalid data URI: {e}", pointer)
+        elif '://' in uri:
+            self.add(WARNING, 'URI_NOT_CHECKED', f"Remote resource not checked: {uri}", pointer)
+        elif resolve_uri(uri, self.search_dirs) is None and resolve_uri(unquote(uri), self.search_dirs) is None:
+            self.add(ERROR, 'IO_ERROR', f"File not found: {uri}", pointer)
+
+    def check_buffer_views(self):
+        views = self.items('bufferViews')
+        buffers = self.items('buffers')
+        valid = [i for i, view in enumerate(views)
+                 if _is_index(view.get('buffer'), len(buffers)) and isinstance(view.get('byteLength'), int)]
+        if not valid:
+            return
+
+        offsets = np.array([views[i].get('byteOffset', 0) for i in valid], dtype=np.int64)
+        lengths = np.array([views[i]['byteLength'] for i in valid], dtype=np.int64)
+        limits = np.array([buffers[views[i]['buffer']].get('byteLength', 0) for i in valid], dtype=np.int64)
+        strides = np.array([views[i].get('byteStride', 4) for i in valid], dtype=np.int64)
+
+        for k in np.flatnonzero(offsets + lengths > limits):
+            i = valid[k]
+            self.add(ERROR, 'BUFFER_VIEW_TOO_LONG',
+                     f"BufferView ends at byte {offsets[k] + lengths[k]} of a {limits[k]}-byte buffer",
+                     f'/bufferViews/{i}')
+        for k in np.flatnonzero((strides < 4) | (strides > 252) | (strides % 4 != 0)):
+            self.add(ERROR, 'BUFFER_VIEW_INVALID_BYTE_STRIDE',
+                     f"byteStride {strides[k]} must be a multiple of 4 between 4 and 252",
+                     f'/bufferViews/{valid[k]}/byteStride')
+
+    def check_accessors(self) -> Dict[int, np.ndarray]:
+        """
+        Range and alignment checks for all accessors at once, then data
+        checks (non-finite floats) on the ones that fit their bufferView.
+        Returns the decoded arrays of valid accessors, keyed by index.
+        """
+        accessors = self.items('accessors')
+        views = self.items('bufferViews')
+        candidates = []
+        for i, accessor in enumerate(accessors):
+            pointer = f'/accessors/{i}'
+            component_type = accessor.get('componentType')
+            type_name = accessor.get('type')
+            if component_type not in COMPONENT_DTYPES:
+                if 'componentType' in accessor:
+                    self.add(ERROR, 'VALUE_NOT_IN_LIST', f"Invalid componentType {component_type}", pointer + '/componentType')
+                continue
+            if type_name not in TYPE_COMPONENTS:
+                if 'type' in accessor:
+                    self.add(ERROR, 'VALUE_NOT_IN_LIST', f"Invalid type {type_name!r}", pointer + '/type')
+                continue
+            count = accessor.get('count')
+            if not isinstance(count, int) or count < 1:
+                self.add(ERROR, 'VALUE_NOT_IN_RANGE', f"count must be at least 1, found {count}", pointer + '/count')
+                continue
+            if _is_index(accessor.get('bufferView'), len(views)):
+                candidates.append(i)
+
+        decoded = {}
+        if not candidates:
+            return decoded
+
+        layout = accessor_layout(self.gltf, candidates)
+        offsets, view_offsets = layout.offsets, layout.view_offsets
+        component_sizes, element_sizes = layout.component_sizes, layout.element_sizes
+        strides, declared_strides = layout.strides, layout.declared_strides
+        misaligned = layout.misaligned
+        total_misaligned = layout.total_misaligned
+        stride_too_small = layout.stride_too_small
+        too_long = layout.too_long
+
+        for k in np.flatnonzero(misaligned):
+            self.add(ERROR, 'ACCESSOR_OFFSET_ALIGNMENT',
+                     f"byteOffset {offsets[k]} is not a multiple of the component size {component_sizes[k]}",
+                     f'/accessors/{candidates[k]}/byteOffset')
+        for k in np.flatnonzero(total_misaligned & ~misaligned):
+            self.add(ERROR, 'ACCESSOR_TOTAL_OFFSET_ALIGNMENT',
+                     f"Accessor starts at buffer offset {offsets[k] + view_offsets[k]}, "
+                     f"not a multiple of the component size {component_sizes[k]}",
+                     f'/accessors/{candidates[k]}/byteOffset')
+        for k in np.flatnonzero(stride_too_small):
+            self.add(ERROR, 'ACCESSOR_SMALL_BYTESTRIDE',
+                     f"bufferView byteStride {declared_strides[k]} is smaller than the element size {element_sizes[k]}",
+                     f'/accessors/{candidates[k]}')
+        for k in np.flatnonzero(too_long):
+            self.add(ERROR, 'ACCESSOR_TOO_LONG',
+                     f"Accessor needs {offsets[k] + strides[k] * (layout.counts[k] - 1) + element_sizes[k]} bytes "
+                     f"but its bufferView has {layout.view_lengths[k]}",
+                     f'/accessors/{candidates[k]}')
+
+        usable = ~(misaligned | total_misaligned | stride_too_small | too_long)
+        for k in np.flatnonzero(usable):
+            i = candidates[k]
+            array = accessor_array(self.gltf, i, self.buffers, int(strides[k]))
+            if array is None:
+                continue
+            decoded[i] = array
+            if array.dtype.kind == 'f' and not np.isfinite(array).all():
+                self.add(ERROR, 'ACCESSOR_INVALID_FLOAT', "Accessor contains NaN or infinite values", f'/accessors/{i}')
+        return decoded
+
+    def check_meshes(self, decoded: Dict[int, np.ndarray]):
+        accessors = self.items('accessors')
+        for m, mesh in enumerate(self.items('meshes')):
+            primitives = mesh.get('primitives')
+            if not isinstance(primitives, list) or not primitives:
+                if 'primitives' in mesh:
+                    self.add(ERROR, 'EMPTY_ENTITY', "Mesh has no primitives", f'/meshes/{m}/primitives')
+                continue
+            for p, primitive in enumerate(primitives):
+                pointer = f'/meshes/{m}/primitives/{p}'
+                attributes = primitive.get('attributes')
+                if not isinstance(attributes, dict):
+                    self.add(ERROR, 'UNDEFINED_PROPERTY', "Missing required property 'attributes'", pointer)
+                    continue
+                for name, index in attributes.items():
+                    self.check_reference(index, 'accessors', f'{pointer}/attributes/{name}')
+                if 'indices' in primitive:
+                    self.check_reference(primitive['indices'], 'accessors', f'{pointer}/indices')
+                if 'material' in primitive:
+                    self.check_reference(primitive['material'], 'materials', f'{pointer}/material')
+
+                counts = {accessors[index].get('count') for index in attributes.values()
+                          if _is_index(index, len(accessors))}
+                if len(counts) > 1:
+                    self.add(ERROR, 'MESH_PRIMITIVE_UNEQUAL_ACCESSOR_COUNT',
+                             "All vertex attributes must have the same count", f'{pointer}/attributes')
+
+                position = attributes.get('POSITION')
+                if _is_index(position, len(accessors)):
+                    self.check_position_bounds(position, decoded.get(position))
+                texcoord = attributes.get('TEXCOORD_0')
+                if _is_index(texcoord, len(accessors)) and accessors[texcoord].get('type') != 'VEC2':
+                    self.add(ERROR, 'MESH_PRIMITIVE_ATTRIBUTES_ACCESSOR_INVALID_FORMAT',
+                             f"TEXCOORD_0 must be VEC2, found {accessors[texcoord].get('type')}",
+                             f'{pointer}/attributes/TEXCOORD_0')
+
+                indices = primitive.get('indices')
+                if _is_index(indices, len(accessors)) and _is_index(position, len(accessors)):
+                    self.check_indices(indices, decoded.get(indices), accessors[position].get('count', 0),
+                                       f'{pointer}/indices')
+
+    def check_position_bounds(self, index: int, array: Optional[np.ndarray]):
+        accessor = self.items('accessors')[index]
+        pointer = f'/accessors/{index}'
+        if 'min' not in accessor or 'max' not in accessor:
+            self.add(ERROR, 'MESH_PRIMITIVE_POSITION_ACCESSOR_WITHOUT_BOUNDS',
+                     "POSITION accessor must define min and max", pointer)
+            return
+        if array is None or array.dtype.kind != 'f' or not np.isfinite(array).all():
+            return
+        for prop, actual in (('min', array.min(axis=0)), ('max', array.max(axis=0))):
+            declared = np.asarray(accessor[prop], dtype=np.float64)
+            if declared.shape != actual.shape:
+                self.add(ERROR, 'INVALID_ACCESSOR_BOUNDS', f"{prop} must have {actual.shape[0]} components",
+                         f'{pointer}/{prop}')
+            elif not np.allclose(declared, actual, rtol=1e-5, atol=1e-6):
+                self.add(ERROR, 'ACCESSOR_MIN_MISMATCH' if prop == 'min' else 'ACCESSOR_MAX_MISMATCH',
+                         f"Declared {prop} {accessor[prop]} does not match data {actual.tolist()}",
+                         f'{pointer}/{prop}')
+
+    def check_indices(self, index: int, array: Optional[np.ndarray], vertex_count: int, pointer: str):
+        accessor = self.items('accessors')[index]
+        if accessor.get('componentType') not in INDEX_COMPONENT_TYPES or accessor.get('type') != 'SCALAR':
+            self.add(ERROR, 'MESH_PRIMITIVE_INDICES_ACCESSOR_INVALID_FORMAT',
+                     "Indices must be unsigned SCALAR accessors", pointer)
+            return
+        if array is None or not array.size:
+            return
+        largest = int(array.max())
+        if largest >= vertex_count:
+            self.add(ERROR, 'ACCESSOR_INDEX_OOB',
+                     f"Index {largest} is out of range for {vertex_count} vertices", f'/accessors/{index}')
+
+
+def validate_document(gltf_data: Dict, buffers: Optional[Sequence[Optional[bytes]]] = None,
+                      search_dirs: Sequence[Path] = ()) -> ValidationReport:
+    """
+    Validate an in-memory glTF document. buffers holds the loaded data of
+    each buffer (None when it could not be loaded); images and buffers are
+    resolved against search_dirs.
+    """
+    if not isinstance(gltf_data, dict):
+        return ValidationReport([ValidationIssue(ERROR, 'TYPE_MISMATCH', "Document root must be an object", '')])
+    if buffers is None:
+        buffers = [None] * len(gltf_data.get('buffers', []) or [])
+    return _Validator(gltf_data, buffers, search_dirs).run()
+
+
+def validate_file(path: Path, search_dirs: Sequence[Path] = ()) -> ValidationReport:
+    """Validate a .gltf or .glb file and the resources it references"""
+    path = Path(path)
+    try:
+        gltf_data, buffers = read_gltf_document(path)
+    except (OSError, ValueError) as e:
+        return ValidationReport([ValidationIssue(ERROR, 'INVALID_JSON', f"Could not read {path.name}: {e}", '')])
+    return validate_document(gltf_data, buffers, [path.parent] + list(search_dirs))